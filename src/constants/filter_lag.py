@@ -0,0 +1,6 @@
+
+MG_LPF_LAG = 200
+"""Lookahead samples of the streamed g-force lowpass (3/100), enough for its backward pass to settle."""
+
+ALT_LPF_LAG = 500
+"""Lookahead samples of the streamed altitude lowpass (1/100), longer since the filter is slower."""
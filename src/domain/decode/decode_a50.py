@@ -1,22 +1,47 @@
 import datetime as dt
+import numpy as np
 import pandas as pd
 from domain.devices.track import Track
 from domain.session_logger import SessionLogger as logger
+from utilities.archive import openInput
 from utilities.decorators.print_tracks import printTracks
 
 
+A50_COLUMNS = 8
+"""Data columns per track: time, dist, vel, course, alt, lat, long, accuracy."""
+
+
 @printTracks
 def decodeA50(file):
-    csv = pd.read_csv(file)
+    """Decodes the SkiApp Pro csv export into a list of `Track` objects.
+
+    The csv is parsed once, all data columns are converted to numbers in a single vectorized
+    pass and the track boundaries are computed once from the track header rows. Each track's
+    vectors are then numpy slices of the converted columns.
+    """
+    with openInput(file) as f:
+        csv = pd.read_csv(f, dtype=str)
     logger.info(f'Imported A50 data from csv, rows: {csv.size}')
 
-    l = csv.loc[csv.iloc[:, 0].isnull()].index.to_list()
-    nan_indices = [0] + l + [csv.shape[0]]
+    # non-numeric cells (track headers, column headers, blank separators) become nan
+    data = np.column_stack([
+        pd.to_numeric(csv.iloc[:, c], errors='coerce').to_numpy(dtype=float)
+        for c in range(A50_COLUMNS)
+    ])
+    first_col = csv.iloc[:, 0]
+    is_data = ~np.isnan(data[:, 0])
+    # track headers only fill the first cell, column headers & separators don't match
+    is_header = first_col.notna().to_numpy() & csv.iloc[:, 1].isna().to_numpy() & ~is_data
+
+    # keep only the data rows, tracks are contiguous slices of these
+    data_rows = np.flatnonzero(is_data)
+    header_rows = np.flatnonzero(is_header)
+    data = data[data_rows]
+    bounds = np.append(np.searchsorted(data_rows, header_rows), data_rows.shape[0])
     tracks = []
 
-    for n in range(len(nan_indices) - 1):
-        track = csv.iloc[nan_indices[n]:nan_indices[n+1]].dropna(how="all")
-        properties = track.iloc[0, 0]
+    for n, row in enumerate(header_rows):
+        properties = first_col.iat[row]
         type = properties.split("\"")[1]
         fulltime = properties.split("@ ")[1].split(', Duration=')[0].replace('p.', 'P').replace('m.', 'M').replace('a.', 'A')
         durlength = properties.split("@ ")[1].split(', Duration=')[1]
@@ -27,34 +52,25 @@ def decodeA50(file):
         duration = int(durlength.split("'")[0]) * 60 + int(durlength.split("'")[1])
         length = int(durlength.split("Length=")[1].replace('m', ''))
 
-        vectors = track.iloc[2:, :]
-        time = [int(float(t)) + int(_datetime.timestamp()) for t in vectors.iloc[:, 0].tolist()]
-        dist = [float(d) for d in vectors.iloc[:, 1].tolist()]
-        vel = [float(v) / 3.6 for v in vectors.iloc[:, 2].tolist()] # originally in kmh
-        course = [int(c) for c in vectors.iloc[:, 3].tolist()]
-        alt = [float(a) for a in vectors.iloc[:, 4].tolist()]
-        lat = [float(l) for l in vectors.iloc[:, 5].tolist()]
-        long = [float(l) for l in vectors.iloc[:, 6].tolist()]
-        var = [int(a) for a in vectors.iloc[:, 7].tolist()]
-
+        vectors = data[bounds[n]:bounds[n + 1]]
         trackObj = Track(
             track_type=type,
             date=date,
             tod=tod,
             duration=duration,
             length=length,
-            time=time,
-            dist=dist,
-            vel=vel,
-            alt=alt,
-            lat=lat,
-            long=long,
-            var=var,
-            course=course
+            time=vectors[:, 0].astype(np.int64) + int(_datetime.timestamp()),
+            dist=vectors[:, 1],
+            vel=vectors[:, 2] / 3.6, # originally in kmh
+            alt=vectors[:, 4],
+            lat=vectors[:, 5],
+            long=vectors[:, 6],
+            var=vectors[:, 7].astype(np.int64),
+            course=vectors[:, 3].astype(np.int64),
         )
         tracks.append(trackObj)
 
-    
+
     logger.info(f'Decoded A50 data into {len(tracks)} tracks.')
     return tracks
 
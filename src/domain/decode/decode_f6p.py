@@ -1,36 +1,59 @@
 import datetime as dt
+import numpy as np
 import pandas as pd
 from domain.devices.track import Track
 from domain.session_logger import SessionLogger as logger
+from utilities.archive import openInput
 from utilities.decorators.print_tracks import printTracks
 
 
+F6P_COLUMNS = [0, 2, 4, 7, 10, 13, 16, 19, 25, 28]
+"""Positions of the only csv columns the decoder reads: `Type`, `Message` & the used `Value x` columns."""
+
+
 @printTracks
 def decodeF6P(file):
+    """Decodes the Garmin csv export into a list of `Downhill` `Track` objects, one per lap.
+
+    Only the needed columns of the (very wide) csv are read. The record & lap masks are computed
+    once, then each lap's records are sliced out with `searchsorted` on the lap rows, so the
+    whole decode is a single pass over the file.
+    """
     ts_msb = 631065600 # Add MSB since this is the LSB of the ts https://stackoverflow.com/a/57836047
-    csv = pd.read_csv(file, low_memory=False) # no low memory due to columns having data with nonintersecting types
+    with openInput(file) as f:
+        csv = pd.read_csv(f, usecols=F6P_COLUMNS, dtype=str)
     logger.info(f'Imported F6P data from csv, rows: {csv.size}')
 
-    lap_rows = csv.loc[csv['Message'] == 'lap'].loc[csv['Type'] == 'Data']
-    lap_indices = [0] + lap_rows.index.tolist()
+    is_data = (csv.iloc[:, 0] == 'Data').to_numpy()
+    message = csv.iloc[:, 1]
+    record_rows = np.flatnonzero(is_data & (message == 'record').to_numpy())
+    lap_rows = np.flatnonzero(is_data & (message == 'lap').to_numpy())
+
+    def values(rows, c):
+        # values column by position in `F6P_COLUMNS`, converted only on the rows that are used
+        return pd.to_numeric(csv.iloc[rows, c]).to_numpy(dtype=float)
+
+    rec_time = values(record_rows, 2).astype(np.int64) + ts_msb
+    rec_lat = values(record_rows, 3) * 180 / (2**31) # convert from sc to deg
+    rec_long = values(record_rows, 4) * 180 / (2**31) # convert from sc to deg
+    rec_dist = values(record_rows, 5)
+    rec_vel = values(record_rows, 6)
+    rec_alt = values(record_rows, 7)
+    lap_start_ts = values(lap_rows, 3).astype(np.int64)
+    lap_duration = values(lap_rows, 8).astype(np.int64)
+    lap_length = values(lap_rows, 9)
+
+    bounds = np.searchsorted(record_rows, np.concatenate([[0], lap_rows]))
     tracks = []
     total_dist = 0
 
-    for n in range(len(lap_indices) - 1):
-        track = csv.iloc[lap_indices[n]:lap_indices[n + 1]].loc[csv['Message'] == 'record'].loc[csv['Type'] == 'Data']
-        start_ts = int(lap_rows.iloc[n, 7])
-        _datetime = dt.datetime.fromtimestamp(start_ts + ts_msb)
+    for n in range(lap_rows.shape[0]):
+        r = slice(bounds[n], bounds[n + 1])
+        _datetime = dt.datetime.fromtimestamp(int(lap_start_ts[n]) + ts_msb)
         date = _datetime.date()
         tod = _datetime.time()
-        duration = int(lap_rows.iloc[n, 25])
-        length = float(lap_rows.iloc[n, 28])
-
-        time = [int(t) + ts_msb for t in track.iloc[:, 4].tolist()]
-        dist = [float(d) - total_dist for d in track.iloc[:, 13].tolist()] # since this is accumulating distance
-        vel = [float(v) for v in track.iloc[:, 16].tolist()]
-        alt = [float(a) for a in track.iloc[:, 19].tolist()]
-        lat = [float(l) * 180 / (2**31) for l in track.iloc[:, 7].tolist()] # convert from sc to deg
-        long = [float(l) * 180 / (2**31) for l in track.iloc[:, 10].tolist()] # convert from sc to deg
+        duration = int(lap_duration[n])
+        length = float(lap_length[n])
 
         trackObj = Track(
             track_type="Downhill",
@@ -38,16 +61,16 @@ def decodeF6P(file):
             tod=tod,
             duration=duration,
             length=length,
-            time=time,
-            dist=dist,
-            vel=vel,
-            alt=alt,
-            lat=lat,
-            long=long
+            time=rec_time[r],
+            dist=rec_dist[r] - total_dist, # since this is accumulating distance
+            vel=rec_vel[r],
+            alt=rec_alt[r],
+            lat=rec_lat[r],
+            long=rec_long[r],
         )
         tracks.append(trackObj)
 
         total_dist += length
-        
+
     logger.info(f'Decoded F6P data into {len(tracks)} tracks.')
     return tracks
@@ -0,0 +1,184 @@
+import datetime as dt
+import struct
+import numpy as np
+from domain.devices.track import Track
+from domain.session_logger import SessionLogger as logger
+from utilities.archive import openInput
+from utilities.decorators.print_tracks import printTracks
+
+
+FIT_LAP = 19
+"""Global message number of the `lap` message."""
+FIT_RECORD = 20
+"""Global message number of the `record` message."""
+
+FIT_BASE_TYPES = {
+    0x00: ('B', 0xFF), 0x01: ('b', 0x7F), 0x02: ('B', 0xFF), 0x83: ('h', 0x7FFF),
+    0x84: ('H', 0xFFFF), 0x85: ('i', 0x7FFFFFFF), 0x86: ('I', 0xFFFFFFFF), 0x88: ('f', None),
+    0x89: ('d', None), 0x0A: ('B', 0x00), 0x8B: ('H', 0x0000), 0x8C: ('I', 0x00000000),
+    0x8E: ('q', 0x7FFFFFFFFFFFFFFF), 0x8F: ('Q', 0xFFFFFFFFFFFFFFFF), 0x90: ('Q', 0x0000000000000000),
+}
+"""FIT base types, `struct` format & invalid value. Anything else (strings, bytes, arrays) is skipped."""
+
+FIT_FIELDS = {
+    FIT_RECORD: {
+        253: ('timestamp', 1, 0),
+        0: ('position_lat', 2**31 / 180, 0), # sc to deg
+        1: ('position_long', 2**31 / 180, 0), # sc to deg
+        2: ('altitude', 5, 500),
+        5: ('distance', 100, 0),
+        6: ('speed', 1000, 0),
+        73: ('enhanced_speed', 1000, 0),
+        78: ('enhanced_altitude', 5, 500),
+    },
+    FIT_LAP: {
+        253: ('timestamp', 1, 0),
+        2: ('start_time', 1, 0),
+        7: ('total_elapsed_time', 1000, 0),
+        8: ('total_timer_time', 1000, 0),
+        9: ('total_distance', 100, 0),
+    },
+}
+"""Decoded fields per global message, `field number: (name, scale, offset)`."""
+
+
+class FitDefinition:
+    """Local message definition, compiled into a single `struct` that unpacks a data message."""
+    def __init__(self, global_num: int, little_endian: bool, fields: list, dev_size: int) -> None:
+        self.global_num = global_num
+        wanted = FIT_FIELDS.get(global_num, {})
+        fmt = '<' if little_endian else '>'
+        self.fields = []
+        for num, size, base_type in fields:
+            code, invalid = FIT_BASE_TYPES.get(base_type, (None, None))
+            if num in wanted and code is not None and struct.calcsize(code) == size:
+                fmt += code
+                self.fields.append((wanted[num], invalid))
+            else:
+                fmt += f'{size}x'
+        fmt += f'{dev_size}x'
+        self.struct = struct.Struct(fmt)
+
+
+def streamFitMessages(f):
+    """Streams the `(global message number, {field: value})` of the lap & record data messages
+    inside the FIT file object `f`, with scale & offset applied and invalid values as `nan`.
+
+    https://developer.garmin.com/fit/protocol/
+    """
+    header_size = f.read(1)[0]
+    header = f.read(header_size - 1)
+    data_size = struct.unpack('<I', header[3:7])[0]
+    if header[7:11] != b'.FIT':
+        raise ValueError('Not a FIT file, missing the `.FIT` signature.')
+
+    definitions = {}
+    last_ts = 0
+    read = 0
+    while read < data_size:
+        record_header = f.read(1)[0]
+        read += 1
+        ts_offset = None
+
+        if record_header & 0x80:
+            # compressed timestamp header, always a data message
+            local_num = (record_header >> 5) & 0x03
+            ts_offset = record_header & 0x1F
+        elif record_header & 0x40:
+            # definition message
+            local_num = record_header & 0x0F
+            fixed = f.read(5)
+            little_endian = fixed[1] == 0
+            global_num = struct.unpack('<H' if little_endian else '>H', fixed[2:4])[0]
+            fields = [tuple(f.read(3)) for _ in range(fixed[4])]
+            read += 5 + 3 * fixed[4]
+            dev_size = 0
+            if record_header & 0x20:
+                n_dev = f.read(1)[0]
+                dev_size = sum(d[1] for d in (f.read(3) for _ in range(n_dev)))
+                read += 1 + 3 * n_dev
+            definitions[local_num] = FitDefinition(global_num, little_endian, fields, dev_size)
+            continue
+        else:
+            local_num = record_header & 0x0F
+
+        definition = definitions[local_num]
+        raw = f.read(definition.struct.size)
+        read += definition.struct.size
+        if not definition.fields:
+            continue
+
+        message = {}
+        for ((name, scale, offset), invalid), value in zip(definition.fields, definition.struct.unpack(raw)):
+            message[name] = np.nan if value == invalid else value / scale - offset
+
+        if 'timestamp' in message:
+            if np.isnan(message['timestamp']):
+                # invalid timestamp, holds the last one, records before any valid one are dropped
+                if last_ts == 0 and definition.global_num == FIT_RECORD:
+                    continue
+                message['timestamp'] = last_ts
+            last_ts = int(message['timestamp'])
+        elif ts_offset is not None:
+            last_ts = (last_ts & ~0x1F) + ts_offset + (0x20 if ts_offset < (last_ts & 0x1F) else 0)
+            message['timestamp'] = last_ts
+
+        yield definition.global_num, message
+
+
+def validField(message: dict, *names):
+    """First of the fields `names` decoded to a valid (non `nan`) value in `message`, `nan` if none are."""
+    for name in names:
+        value = message.get(name, np.nan)
+        if not np.isnan(value):
+            return value
+    return np.nan
+
+
+@printTracks
+def decodeFIT(file):
+    """Decodes the Garmin FIT activity file into a list of `Downhill` `Track` objects, one per lap.
+
+    Messages are streamed straight from the binary file, only the record & lap fields used by
+    `Track` are unpacked. Follows the same lap segmentation as `decodeF6P()`.
+    """
+    ts_msb = 631065600 # Add MSB since this is the LSB of the ts https://stackoverflow.com/a/57836047
+    tracks = []
+    total_dist = 0
+    columns = ['timestamp', 'distance', 'speed', 'altitude', 'position_lat', 'position_long']
+    records = {col: [] for col in columns}
+
+    with openInput(file) as f:
+        for global_num, message in streamFitMessages(f):
+            if global_num == FIT_RECORD:
+                message['speed'] = validField(message, 'enhanced_speed', 'speed')
+                message['altitude'] = validField(message, 'enhanced_altitude', 'altitude')
+                for col in columns:
+                    records[col].append(message.get(col, np.nan))
+                continue
+
+            start_time = validField(message, 'start_time')
+            if np.isnan(start_time):
+                start_time = records['timestamp'][0] if records['timestamp'] else message.get('timestamp', 0)
+            _datetime = dt.datetime.fromtimestamp(int(start_time) + ts_msb)
+            length = float(message.get('total_distance', np.nan))
+            trackObj = Track(
+                track_type="Downhill",
+                date=_datetime.date(),
+                tod=_datetime.time(),
+                duration=int(message.get('total_timer_time', 0)),
+                length=length,
+                time=np.array(records['timestamp'], dtype=np.int64) + ts_msb,
+                dist=np.array(records['distance']) - total_dist, # since this is accumulating distance
+                vel=np.array(records['speed']),
+                alt=np.array(records['altitude']),
+                lat=np.array(records['position_lat']),
+                long=np.array(records['position_long']),
+            )
+            tracks.append(trackObj)
+
+            total_dist += length
+            records = {col: [] for col in columns}
+
+    logger.info(f'Decoded FIT data into {len(tracks)} tracks.')
+    return tracks
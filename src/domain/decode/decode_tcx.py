@@ -0,0 +1,97 @@
+import datetime as dt
+import xml.etree.ElementTree as ET
+import numpy as np
+from domain.devices.track import Track
+from domain.session_logger import SessionLogger as logger
+from utilities.archive import openInput
+from utilities.decorators.print_tracks import printTracks
+
+
+TCX_TRACKPOINT_FIELDS = {
+    'Time': 'time',
+    'LatitudeDegrees': 'lat',
+    'LongitudeDegrees': 'long',
+    'AltitudeMeters': 'alt',
+    'DistanceMeters': 'dist',
+    'Speed': 'vel',
+}
+"""Trackpoint elements decoded into the `Track` vectors, keyed by their local (no namespace) tag."""
+
+
+def localTag(el: ET.Element) -> str:
+    return el.tag.rsplit('}', 1)[-1]
+
+
+def isoTimestamp(text: str) -> int:
+    """Converts the TCX ISO-8601 UTC time into a timestamp, in `s`."""
+    return int(dt.datetime.fromisoformat(text.replace('Z', '+00:00')).timestamp())
+
+
+@printTracks
+def decodeTCX(file):
+    """Decodes the Garmin TCX activity file into a list of `Downhill` `Track` objects, one per `<Lap>`.
+
+    The xml is parsed incrementally and every trackpoint & lap element is detached from the tree
+    once it's decoded, so memory stays constant regardless of the file size. Follows the same lap
+    segmentation as `decodeF6P()`.
+    """
+    tracks = []
+    total_dist = 0
+    lap = None
+    point = None
+    # open elements, to detach the decoded ones from their parent
+    parents = []
+
+    with openInput(file) as f:
+        for event, el in ET.iterparse(f, events=('start', 'end')):
+            tag = localTag(el)
+
+            if event == 'start':
+                parents.append(el)
+                if tag == 'Lap':
+                    lap = {'start': isoTimestamp(el.get('StartTime')), 'duration': 0, 'length': np.nan}
+                    vectors = {field: [] for field in TCX_TRACKPOINT_FIELDS.values()}
+                elif tag == 'Trackpoint':
+                    point = {}
+                continue
+
+            parents.pop()
+            if point is not None and tag in TCX_TRACKPOINT_FIELDS:
+                point[TCX_TRACKPOINT_FIELDS[tag]] = el.text
+
+            elif tag == 'Trackpoint':
+                vectors['time'].append(isoTimestamp(point['time']))
+                for field in ['lat', 'long', 'alt', 'dist', 'vel']:
+                    vectors[field].append(float(point[field]) if field in point else np.nan)
+                point = None
+                parents[-1].remove(el)
+
+            elif lap is not None and tag == 'TotalTimeSeconds':
+                lap['duration'] = int(float(el.text))
+
+            elif lap is not None and tag == 'DistanceMeters':
+                lap['length'] = float(el.text)
+
+            elif tag == 'Lap':
+                _datetime = dt.datetime.fromtimestamp(lap['start'])
+                trackObj = Track(
+                    track_type="Downhill",
+                    date=_datetime.date(),
+                    tod=_datetime.time(),
+                    duration=lap['duration'],
+                    length=lap['length'],
+                    time=np.array(vectors['time'], dtype=np.int64),
+                    dist=np.array(vectors['dist']) - total_dist, # since this is accumulating distance
+                    vel=np.array(vectors['vel']),
+                    alt=np.array(vectors['alt']),
+                    lat=np.array(vectors['lat']),
+                    long=np.array(vectors['long']),
+                )
+                tracks.append(trackObj)
+
+                total_dist += lap['length']
+                lap = None
+                parents[-1].remove(el)
+
+    logger.info(f'Decoded TCX data into {len(tracks)} tracks.')
+    return tracks
@@ -1,21 +1,189 @@
+import numpy as np
 import pandas as pd
-from domain.devices.raw_tile import RawTile
+from domain.decode.tile_cache import cacheTile, fileHash, loadCachedTile
+from domain.devices.raw_tile import RAW_TILE_CSV_COLUMNS, TILE_GAP_DTYPE, RawTile, rawTileDtype, tileCsvDtypes
 from domain.session_logger import SessionLogger as logger
+from utilities.append_buffer import AppendBuffer
+from utilities.archive import globInputs, openInput
 from utilities.decorators.print_tracks import printTracks
 
 
+TILE_PERIOD_MS = 10
+"""Nominal Tile sample period, in `ms` (100Hz)."""
+TILE_MAX_DT_MS = 50
+"""Largest time step still considered continuous sampling, in `ms`. Larger steps are gaps."""
+
+
 @printTracks
-def decodeTile(file):
-    csv = pd.read_csv(file)
+def decodeTile(file, use_cache=False, compact=False):
+    """Decodes the SensorTile csv into a `RawTile`.
+
+    Set `use_cache` to cache the decoded buffer on disk (`cache/tile/`) keyed by the file content,
+    so any following decode of the same file memory-maps the cached buffer instead of parsing the
+    csv again. Off by default, decoding has no filesystem side effects.
+
+    Every column is parsed with an explicit dtype, set `compact` to load the raw IMU channels as
+    int16/int32 & the environmental channels as float32, less than half the memory.
+
+    `file` can also be an `archive.zip::member` path, streamed straight from the archive, or a
+    list/glob pattern of consecutive logs (ex: `SENS*.CSV`). Multiple files are decoded one by
+    one & concatenated into a single `RawTile`, every timestamp gap & rollover between or inside
+    them is indexed in `RawTile.gaps`.
+    """
+    files = tileFiles(file)
+    if not files:
+        raise FileNotFoundError(f'No Tile csv matches: {file}')
+
+    raw = decodeTileFile(files[0], use_cache, compact)
+    if len(files) > 1:
+        # appended into one growing buffer, every decoded (or memory-mapped) file buffer is dropped
+        # as soon as it's in, so only a single file is held next to the buffer
+        buffer = AppendBuffer(raw.data)
+        raw = None
+        for f in files[1:]:
+            buffer.append(decodeTileFile(f, use_cache, compact).data)
+        raw = RawTile.fromData(buffer.view)
+        logger.info(f'Concatenated {len(files)} Tile files, rows: {raw.time.shape[0]}')
+
+    raw.gaps = indexTileGaps(raw.time)
+    return raw
+
+
+def decodeTileFile(file, use_cache=False, compact=False) -> RawTile:
+    """Decodes a single SensorTile csv into a `RawTile`, see `decodeTile()`."""
+    key = (fileHash(file) + ('-compact' if compact else '')) if use_cache else None
+    if key is not None:
+        raw = loadCachedTile(key)
+        if raw is not None:
+            return raw
+
+    with openInput(file) as f:
+        csv = pd.read_csv(CompleteRows(f), dtype=tileCsvDtypes(compact))
     logger.info(f'Imported Tile data from csv, rows: {csv.size}')
 
-    return RawTile(
-        time=csv.iloc[:, 0].to_numpy(),
-        accel=csv.iloc[:, 1:4].to_numpy(),
-        gyro=csv.iloc[:, 4:7].to_numpy(),
-        mag=csv.iloc[:, 7:10].to_numpy(),
-        pres=csv.iloc[:, 10].to_numpy(),
-        temp=csv.iloc[:, 11].to_numpy(),
-        hum=csv.iloc[:, 12].to_numpy(),
-    )
+    raw = rawTileFromFrame(csv, compact)
+
+    if key is not None:
+        cacheTile(key, raw)
+    return raw
+
+
+def decodeTileChunks(file, chunk_size=60 * 60 * 100, compact=False):
+    """Streams the SensorTile csv as consecutive `RawTile` blocks of at most `chunk_size` rows.
+
+    Only one block is parsed and held at a time, so memory stays bounded by the block size
+    no matter how long the recording is. Defaults to 1 hour of 100Hz samples per block. Set
+    `compact` to load the reduced precision dtypes, see `decodeTile()`.
+
+    Like `decodeTile()`, `file` can be a list/glob pattern of consecutive logs, streamed one after
+    the other. The gaps of every block are indexed relative to its first sample, including the one
+    from the previous block, & the clock is continued across the rollovers of the previous blocks.
+    """
+    rows = 0
+    last = None
+    shift = 0
+    for path in tileFiles(file):
+        with openInput(path) as f, pd.read_csv(CompleteRows(f), dtype=tileCsvDtypes(compact), chunksize=chunk_size) as reader:
+            for csv in reader:
+                rows += csv.shape[0]
+                logger.debug(f'Streamed Tile block from csv, rows: {csv.shape[0]}')
+                raw = rawTileFromFrame(csv, compact)
+                if raw.time.shape[0] == 0:
+                    continue
+
+                raw_last = raw.time[-1]
+                time = raw.time + shift
+                if last is not None:
+                    time = np.concatenate([[last], time]).astype(time.dtype)
+                gaps = indexTileGaps(time)
+                if last is not None:
+                    time = time[1:]
+                    gaps['idx'] -= 1
+                raw.time = time
+                raw.gaps = gaps
+                last = raw.time[-1]
+                shift = last - raw_last
+                yield raw
+
+    logger.info(f'Streamed Tile data from csv, rows: {rows}')
+
+
+class CompleteRows:
+    """
+    Binary csv stream that drops the partially written rows at the end of a Tile log (the SD card
+    losing power mid-line), which the integer column dtypes can't parse.
+
+    The last two lines are held back until the end of the stream, then only the ones with the
+    header's field count are passed on.
+    """
+    def __init__(self, f) -> None:
+        self.__f = f
+        self.__held = b''
+        self.__fields = None
+
+
+    def read(self, size=-1) -> bytes:
+        while True:
+            data = self.__f.read(size)
+            if not data:
+                return self.flush()
+
+            self.__held += data
+            if self.__fields is None and b'\n' in self.__held:
+                self.__fields = self.__held[:self.__held.index(b'\n')].count(b',')
+
+            # everything up to the second to last line break is complete
+            split = self.__held.rfind(b'\n', 0, max(self.__held.rfind(b'\n'), 0))
+            if split >= 0:
+                out, self.__held = self.__held[:split + 1], self.__held[split + 1:]
+                return out
+
+
+    def flush(self) -> bytes:
+        """Passes on the held back lines that are complete, the rest are dropped."""
+        lines = [line for line in self.__held.split(b'\n') if line.strip()]
+        self.__held = b''
+        complete = [line for line in lines if self.__fields is None or line.count(b',') == self.__fields]
+        if len(complete) < len(lines):
+            logger.warning(f'Dropped {len(lines) - len(complete)} partially written Tile csv rows.')
+        return b''.join(line + b'\n' for line in complete)
+
+
+def tileFiles(file) -> list:
+    """Resolves the `decodeTile()` input into the ordered list of Tile csv files."""
+    if isinstance(file, (list, tuple)):
+        return list(file)
+    if any(c in file for c in '*?['):
+        return globInputs(file)
+    return [file]
+
+
+def indexTileGaps(time: np.ndarray, max_dt_ms=TILE_MAX_DT_MS) -> np.ndarray:
+    """Indexes the timestamp gaps (step > `max_dt_ms`) & rollovers (step < 0) of the Tile `time`
+    vector, as `TILE_GAP_DTYPE` records.
+
+    The ms counter restarts when the board resets, so `time` is shifted in place after every
+    rollover to continue the clock, assuming a single sample period across it.
+    """
+    dt = np.diff(time)
+    idxs = np.flatnonzero((dt > max_dt_ms) | (dt < 0)) + 1
+
+    gaps = np.empty(idxs.shape[0], dtype=TILE_GAP_DTYPE)
+    gaps['idx'] = idxs
+    gaps['dt_ms'] = dt[idxs - 1]
+    gaps['rollover'] = gaps['dt_ms'] < 0
+
+    for g in gaps[gaps['rollover']]:
+        time[g['idx']:] += TILE_PERIOD_MS - g['dt_ms']
+
+    if gaps.shape[0]:
+        logger.info(f'Indexed {gaps.shape[0]} Tile time gaps, rollovers: {np.count_nonzero(gaps["rollover"])}')
+    return gaps
+
 
+def rawTileFromFrame(csv: pd.DataFrame, compact=False) -> RawTile:
+    """Packs the columns of a decoded Tile csv frame into the buffer of a `RawTile`."""
+    data = np.empty(csv.shape[0], dtype=rawTileDtype(compact))
+    for ch, cols in RAW_TILE_CSV_COLUMNS.items():
+        data[ch] = csv.iloc[:, cols].to_numpy() if len(cols) > 1 else csv.iloc[:, cols[0]].to_numpy()
+    return RawTile.fromData(data)
@@ -0,0 +1,52 @@
+import hashlib
+import os
+import numpy as np
+from domain.devices.raw_tile import RawTile
+from domain.session_logger import SessionLogger as logger
+from utilities.archive import openInput
+
+
+def cacheDir():
+    """Root directory of the decoded tile cache, `cache/tile/` next to the `logs/` dir."""
+    return os.path.join(os.getcwd().split('src')[0], 'cache', 'tile')
+
+
+def fileHash(file, block_size=1 << 20):
+    """Hashes the content of `file` in blocks, so the cache key follows the data instead of the path."""
+    h = hashlib.sha1()
+    with openInput(file) as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def loadCachedTile(key) -> RawTile | None:
+    """Loads the cache entry for `key` as a memory-mapped `RawTile` buffer, `None` if it doesn't exist.
+
+    The buffer is mapped copy-on-write, so processing never writes back into the cache.
+    """
+    entry = os.path.join(cacheDir(), f'{key}.npy')
+    if not os.path.exists(entry):
+        return None
+
+    logger.info(f'Loading Tile data from cache: {entry}')
+    return RawTile.fromData(np.load(entry, mmap_mode='c'))
+
+
+def cacheTile(key, raw: RawTile):
+    """Stores the buffer of `raw` as a single `.npy` cache entry for `key`.
+
+    The buffer is written into a temporary file first, then moved into place so a partially
+    written entry is never picked up by `loadCachedTile()`.
+    """
+    os.makedirs(cacheDir(), exist_ok=True)
+    entry = os.path.join(cacheDir(), f'{key}.npy')
+    tmp = f'{entry}.tmp{os.getpid()}.npy'
+    np.save(tmp, raw.data)
+
+    try:
+        os.replace(tmp, entry)
+        logger.info(f'Cached Tile data: {entry}')
+    except OSError:
+        # another process cached the same content first
+        os.remove(tmp)
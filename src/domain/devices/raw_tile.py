@@ -1,7 +1,74 @@
 import numpy as np
 from domain.session_logger import SessionLogger as logger
 
+
+RAW_TILE_CSV_COLUMNS = {
+    'time': [0],
+    'accel': [1, 2, 3],
+    'gyro': [4, 5, 6],
+    'mag': [7, 8, 9],
+    'pres': [10],
+    'temp': [11],
+    'hum': [12],
+}
+"""Positions of each `RawTile` channel in the SensorTile csv."""
+
+RAW_TILE_DTYPES = {
+    'time': np.int64,
+    'accel': np.int64,
+    'gyro': np.int64,
+    'mag': np.int64,
+    'pres': np.float64,
+    'temp': np.float64,
+    'hum': np.float64,
+}
+"""Full precision dtype of each `RawTile` channel, same as what pandas infers from the csv."""
+
+COMPACT_RAW_TILE_DTYPES = {
+    'time': np.int32, # ~24 days of ms
+    'accel': np.int16, # +-16G in mG
+    'gyro': np.int32, # +-2000dps in mdps overflows int16
+    'mag': np.int32, # +-50G in mGauss overflows int16
+    'pres': np.float32,
+    'temp': np.float32,
+    'hum': np.float32,
+}
+"""Reduced precision dtype of each `RawTile` channel, less than half the memory of `RAW_TILE_DTYPES`.
+
+Raw IMU channels are integer counts in the csv so no precision is lost, the environmental
+channels keep ~7 significant digits which is past the sensor resolution.
+"""
+
+
+TILE_GAP_DTYPE = np.dtype([
+    ('idx', np.int64), # first sample after the gap
+    ('dt_ms', np.int64), # raw time step over the gap, negative for a rollover
+    ('rollover', np.bool_), # clock restarted, ex: the board was reset between files
+])
+"""Record of a timestamp gap or rollover in the `RawTile` time vector."""
+
+
+def tileCsvDtypes(compact=False) -> dict:
+    """Per csv column dtype schema for `pd.read_csv()`, compact or full precision."""
+    dtypes = COMPACT_RAW_TILE_DTYPES if compact else RAW_TILE_DTYPES
+    return {col: dtypes[ch] for ch, cols in RAW_TILE_CSV_COLUMNS.items() for col in cols}
+
+
+def rawTileDtype(compact=False) -> np.dtype:
+    """Record dtype of one `RawTile` sample, the triaxial channels are `(3,)` subarray fields."""
+    dtypes = COMPACT_RAW_TILE_DTYPES if compact else RAW_TILE_DTYPES
+    return np.dtype([
+        (ch, dtypes[ch], (len(cols),)) if len(cols) > 1 else (ch, dtypes[ch])
+        for ch, cols in RAW_TILE_CSV_COLUMNS.items()
+    ])
+
+
 class RawTile:
+    """
+    Raw SensorTile samples, backed by a single contiguous buffer of `rawTileDtype()` records (or
+    a memory-mapped cache file). Every channel is a view into the buffer, & slicing the tile
+    returns a `RawTile` sharing the same buffer, so the raw data is never duplicated.
+    """
     def __init__(
             self,
             time: np.ndarray,
@@ -11,14 +78,47 @@ class RawTile:
             pres: np.ndarray,
             temp: np.ndarray,
             hum: np.ndarray,
+            gaps: np.ndarray = None,
     ) -> None:
-        self.time = time
-        self.accel = accel
-        self.gyro = gyro
-        self.mag = mag
-        self.pres = pres
-        self.temp = temp
-        self.hum = hum
+        """Packs the channels into a new buffer, use `fromData()` to wrap an existing one."""
+        channels = {'time': time, 'accel': accel, 'gyro': gyro, 'mag': mag, 'pres': pres, 'temp': temp, 'hum': hum}
+        channels = {ch: np.asarray(v) for ch, v in channels.items()}
+        self.__data = np.empty(channels['time'].shape[0], dtype=[(ch, v.dtype, v.shape[1:]) for ch, v in channels.items()])
+        for ch, v in channels.items():
+            self.__data[ch] = v
+        self.gaps = gaps if gaps is not None else np.empty(0, dtype=TILE_GAP_DTYPE)
+
+
+    @classmethod
+    def fromData(cls, data: np.ndarray, gaps: np.ndarray = None):
+        """Wraps an existing buffer of `rawTileDtype()` records as a `RawTile`, without copying it."""
+        raw = cls.__new__(cls)
+        raw.__data = data
+        raw.gaps = gaps if gaps is not None else np.empty(0, dtype=TILE_GAP_DTYPE)
+        return raw
+
+
+    def __len__(self) -> int:
+        return self.__data.shape[0]
+
+
+    def __getitem__(self, s: slice):
+        """Zero-copy `RawTile` view of the samples in `s`, with the gaps re-indexed to the slice."""
+        start, stop, _ = s.indices(len(self))
+        gaps = self.gaps[(self.gaps['idx'] > start) & (self.gaps['idx'] < stop)].copy()
+        gaps['idx'] -= start
+        return RawTile.fromData(self.__data[s], gaps)
+
+
+    def compact(self):
+        """Returns a copy of the tile with every channel cast to `COMPACT_RAW_TILE_DTYPES`."""
+        return RawTile.fromData(self.__data.astype(rawTileDtype(compact=True)), self.gaps)
+
+
+    @property
+    def data(self) -> np.ndarray:
+        """Contiguous buffer of `rawTileDtype()` records backing every channel. [Nx1]"""
+        return self.__data
 
 
     def __printProps__(self, prefix="\t"):
@@ -28,69 +128,79 @@ class RawTile:
     @property
     def time(self) -> np.ndarray:
         """Time vector, in `ms`. [Nx1]"""
-        return self.__time
+        return self.__data['time']
 
     @time.setter
     def time(self, t):
-        self.__time = t
+        self.__data['time'] = t
         
 
 
     @property
     def accel(self) -> np.ndarray:
         """Triaxial accelerometer signals, in `mG`. [Nx3]"""
-        return self.__accel
+        return self.__data['accel']
 
     @accel.setter
     def accel(self, a):
-        self.__accel = a
+        self.__data['accel'] = a
 
 
     @property
     def gyro(self) -> np.ndarray:
         """Triaxial gyroscope signals, in `mdps`. [Nx3]"""
-        return self.__gyro
+        return self.__data['gyro']
 
     @gyro.setter
     def gyro(self, g):
-        self.__gyro = g
+        self.__data['gyro'] = g
 
 
     @property
     def mag(self) -> np.ndarray:
         """Triaxial magnetometer signals, in `mGauss`. [Nx3]"""
-        return self.__mag
+        return self.__data['mag']
 
     @mag.setter
     def mag(self, m):
-        self.__mag = m
+        self.__data['mag'] = m
 
 
     @property
     def pres(self) -> np.ndarray:
         """Air pressure measurements, in `mB`. [Nx1]"""
-        return self.__pres
+        return self.__data['pres']
 
     @pres.setter
     def pres(self, p):
-        self.__pres = p
+        self.__data['pres'] = p
 
 
     @property
     def temp(self) -> np.ndarray:
         """Temperature measurements, in `degC`. [Nx1]"""
-        return self.__temp
+        return self.__data['temp']
 
     @temp.setter
     def temp(self, t):
-        self.__temp = t
+        self.__data['temp'] = t
 
 
     @property
     def hum(self) -> np.ndarray:
         """Relative humidity measurements, in `%`. [Nx1]"""
-        return self.__hum
+        return self.__data['hum']
 
     @hum.setter
     def hum(self, h):
-        self.__hum = h
+        self.__data['hum'] = h
+
+
+    @property
+    def gaps(self) -> np.ndarray:
+        """Timestamp gaps & rollovers of the time vector, `TILE_GAP_DTYPE` records. [Gx1]"""
+        return self.__gaps
+
+    @gaps.setter
+    def gaps(self, g):
+        self.__gaps = g
@@ -1,7 +1,11 @@
 import datetime as dt
+import numpy as np
 from domain.session_logger import SessionLogger as logger
 
+
 class Track:
+    __slots__ = ('__track_type', '__date', '__tod', '__duration', '__length', '__data')
+
     def __init__(
             self,
             track_type: str,
@@ -9,14 +13,14 @@ class Track:
             tod: dt.time,
             duration: int,
             length: int,
-            time: list[int],
-            dist: list[float],
-            vel: list[float],
-            alt: list[float],
-            lat: list[float],
-            long: list[float],
-            var: list[int] = [],
-            course: list[float] = []
+            time: np.ndarray,
+            dist: np.ndarray,
+            vel: np.ndarray,
+            alt: np.ndarray,
+            lat: np.ndarray,
+            long: np.ndarray,
+            var: np.ndarray = None,
+            course: np.ndarray = None
     ):
         # props
         self.track_type = track_type
@@ -25,15 +29,31 @@ class Track:
         self.duration = duration
         self.length = length
 
-        # vectors
-        self.time = time
-        self.dist = dist
-        self.vel = vel
-        self.alt = alt
-        self.lat = lat
-        self.long = long
-        self.var = var
-        self.course = course
+        # vectors, packed into one structured array & exposed as column views. `var` & `course` are
+        # only recorded by some devices, their decoders always pass them (even for empty tracks)
+        vectors = {'time': time, 'dist': dist, 'vel': vel, 'alt': alt, 'lat': lat, 'long': long}
+        if var is not None:
+            vectors['var'] = var
+        if course is not None:
+            vectors['course'] = course
+        vectors = {col: np.asarray(v) for col, v in vectors.items()}
+
+        self.__data = np.empty(vectors['time'].shape[0], dtype=[(col, v.dtype) for col, v in vectors.items()])
+        for col, v in vectors.items():
+            self.__data[col] = v
+
+
+    @classmethod
+    def fromData(cls, data: np.ndarray, track_type, date, tod, duration, length):
+        """Wraps an existing structured array of track vectors as a `Track`, without copying it."""
+        track = cls.__new__(cls)
+        track.track_type = track_type
+        track.date = date
+        track.tod = tod
+        track.duration = duration
+        track.length = length
+        track.__data = data
+        return track
 
 
     def __printProps__(self, prefix="\t"):
@@ -42,6 +62,35 @@ class Track:
         )
 
 
+    def column(self, col) -> np.ndarray:
+        """View of the `col` vector, an empty vector if the device didn't record it."""
+        if col in self.__data.dtype.names:
+            return self.__data[col]
+        return np.empty(0)
+
+
+    def setColumn(self, col, v):
+        """Sets the `col` vector, adding it to the track if the device didn't record it."""
+        if col not in self.__data.dtype.names:
+            v = np.asarray(v)
+            if v.size == 0:
+                # nothing recorded, the column stays absent
+                return
+
+            names = self.__data.dtype.names
+            data = np.empty(self.__data.shape[0], dtype=[(name, self.__data.dtype[name]) for name in names] + [(col, v.dtype)])
+            for name in names:
+                data[name] = self.__data[name]
+            self.__data = data
+        self.__data[col] = v
+
+
+    @property
+    def data(self) -> np.ndarray:
+        """Structured array backing every vector of the track, one field per recorded column. [Nx1]"""
+        return self.__data
+
+
     @property
     def track_type(self) -> str:
         """Track type string, either `Downhill`, `Walk`, `Hold`, or `Lift`."""
@@ -93,82 +142,82 @@ class Track:
 
 
     @property
-    def time(self) -> list[int]:
+    def time(self) -> np.ndarray:
         """Time vector, in `s`."""
-        return self.__time
+        return self.column('time')
     
     @time.setter
     def time(self, t):
-        self.__time = t
+        self.__data['time'] = t
 
 
     @property
-    def dist(self) -> list[float]:
+    def dist(self) -> np.ndarray:
         """3D distance vector, in `m`."""
-        return self.__dist
+        return self.column('dist')
     
     @dist.setter
     def dist(self, d):
-        self.__dist = d
+        self.__data['dist'] = d
 
 
     @property
-    def vel(self) -> list[float]:
+    def vel(self) -> np.ndarray:
         """Velocity vector, in `m/s`."""
-        return self.__vel
+        return self.column('vel')
     
     @vel.setter
     def vel(self, v):
-        self.__vel = v
+        self.__data['vel'] = v
 
 
     @property
-    def alt(self) -> list[float]:
+    def alt(self) -> np.ndarray:
         """Altitude vector in `m` above sea level. Depends on the device on whether it was
         derived from barometric or mapped GPS data.
         """
-        return self.__alt
+        return self.column('alt')
     
     @alt.setter
     def alt(self, a):
-        self.__alt = a
+        self.__data['alt'] = a
 
 
     @property
-    def lat(self) -> list[float]:
+    def lat(self) -> np.ndarray:
         """Lattitude vector, in `°`."""
-        return self.__lat
+        return self.column('lat')
     
     @lat.setter
     def lat(self, l):
-        self.__lat = l
+        self.__data['lat'] = l
 
 
     @property
-    def long(self) -> list[float]:
+    def long(self) -> np.ndarray:
         """Longitude vector, in `°`."""
-        return self.__long
+        return self.column('long')
     
     @long.setter
     def long(self, l):
-        self.__long = l
+        self.__data['long'] = l
 
 
     @property
-    def var(self) -> list[int]:
+    def var(self) -> np.ndarray:
         """Variance of GPS/Accuracy vector, in `m`."""
-        return self.__var
+        return self.column('var')
     
     @var.setter
     def var(self, v):
-        self.__var = v
+        self.setColumn('var', v)
 
 
     @property
-    def course(self) -> list[float]:
+    def course(self) -> np.ndarray:
         """Course vector/heading of GPS position based on causal velocity, in `°`."""
-        return self.__course
+        return self.column('course')
     
     @course.setter
     def course(self, c):
-        self.__course = c
+        self.setColumn('course', c)
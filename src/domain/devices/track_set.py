@@ -0,0 +1,108 @@
+import numpy as np
+from domain.devices.track import Track
+from domain.session_logger import SessionLogger as logger
+
+class TrackSet:
+    """
+    Columnar container of all the tracks of a device. The track vectors are concatenated into one
+    structured array, indexed CSR-style by `offsets`, so a track is the slice
+    `data[offsets[i]:offsets[i + 1]]` and the whole day is a single contiguous vector per column.
+    """
+    def __init__(self, tracks: list[Track]) -> None:
+        """Packs the `tracks` of a single device. The set records the union of the track columns, a
+        column missing from a track is filled with `nan` (or `0` for integer columns) in its rows.
+        """
+        self.offsets = np.concatenate([[0], np.cumsum([track.data.shape[0] for track in tracks])]).astype(np.int64)
+        self.data = self.stitch(tracks, self.offsets) if tracks else np.empty(0, dtype=[('time', np.int64), ('alt', float)])
+        self.props = [(track.track_type, track.date, track.tod, track.duration, track.length) for track in tracks]
+
+        logger.debug(f'Packed {len(tracks)} tracks into a TrackSet, rows: {self.data.shape[0]}')
+
+
+    @staticmethod
+    def stitch(tracks: list[Track], offsets: np.ndarray) -> np.ndarray:
+        """Copies the vectors of every track into one structured array of the union of their columns."""
+        columns = {}
+        for track in tracks:
+            for col in track.data.dtype.names:
+                dtype = track.data.dtype[col]
+                columns[col] = np.result_type(columns[col], dtype) if col in columns else dtype
+
+        data = np.empty(offsets[-1], dtype=list(columns.items()))
+        for track, start, end in zip(tracks, offsets[:-1], offsets[1:]):
+            for col, dtype in columns.items():
+                if col in track.data.dtype.names:
+                    data[col][start:end] = track.data[col]
+                else:
+                    data[col][start:end] = np.nan if dtype.kind in 'fc' else 0
+        return data
+
+
+    def __len__(self) -> int:
+        return len(self.props)
+
+
+    def __getitem__(self, i) -> Track:
+        """O(1) `Track` view of the `i`th track, sharing memory with the set."""
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        i = range(len(self))[i]
+        return Track.fromData(self.data[self.offsets[i]:self.offsets[i + 1]], *self.props[i])
+
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+    def column(self, col) -> np.ndarray:
+        """Stitched `col` vector of every track, an empty vector if the device didn't record it."""
+        if col in self.data.dtype.names:
+            return self.data[col]
+        return np.empty(0)
+
+
+    def trackIdxs(self, rows: np.ndarray) -> np.ndarray:
+        """Index of the track holding each stitched row in `rows`."""
+        return np.searchsorted(self.offsets, rows, side='right') - 1
+
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Start row of each track in the stitched columns, with the total rows appended. [(T+1)x1]"""
+        return self.__offsets
+
+    @offsets.setter
+    def offsets(self, o):
+        self.__offsets = o
+
+
+    @property
+    def data(self) -> np.ndarray:
+        """Structured array of the stitched track vectors, one field per recorded column. [Nx1]"""
+        return self.__data
+
+    @data.setter
+    def data(self, d):
+        self.__data = d
+
+
+    @property
+    def props(self) -> list[tuple]:
+        """Static props of each track, `(track_type, date, tod, duration, length)`."""
+        return self.__props
+
+    @props.setter
+    def props(self, p):
+        self.__props = p
+
+
+    @property
+    def time(self) -> np.ndarray:
+        """Stitched time vector, in `s`."""
+        return self.column('time')
+
+
+    @property
+    def alt(self) -> np.ndarray:
+        """Stitched altitude vector, in `m` above sea level."""
+        return self.column('alt')
@@ -1,52 +1,50 @@
 import numpy as np
+from domain.event_tables import EventTable
 from domain.session_logger import SessionLogger as logger
 
 
 class EvaluatedKinematics:
-    def __init__(self) -> None:
-        self.confidence = 0.
-        self.tests_passed = 0
-        self.total_tests = 0
+    def __init__(self, table: EventTable) -> None:
+        self.table = table
 
 
     def test(self, suite):
-        """Runs the child test suite to determine the confidence value of the specific kinematic estimation.
-        
+        """Runs the child test suite on every event of the table, writing the confidence value of each
+        kinematic estimation into its row.
+
         Currently, all tests are weighted equally.
         """
-        results = suite()
-        self.tests_passed = np.sum(results)
-        self.total_tests = results.shape[0]
-        self.confidence = self.tests_passed / self.total_tests * 100
-    
-        logger.debug(f'Test results: {round(self.confidence, 2)}% ({self.tests_passed}/{self.total_tests} tests).')
+        results = np.array(suite(), dtype=bool)
+        self.table.data['tests_passed'] = np.sum(results, axis=0)
+        self.table.data['total_tests'] = results.shape[0]
+        self.table.data['confidence'] = self.tests_passed / results.shape[0] * 100
+
+        logger.debug(f'Test results: {round(float(np.mean(self.confidence)), 2) if len(self.table) else 0}% mean confidence ({len(self.table)} events, {results.shape[0]} tests).')
+
+
+    @property
+    def table(self) -> EventTable:
+        """Table of the identified events, one row per event."""
+        return self.__table
+
+    @table.setter
+    def table(self, table):
+        self.__table = table
 
 
     @property
-    def confidence(self) -> float:
-        """Confidence value, sum of passed tests / total tests."""
-        return self.__confidence
-    
-    @confidence.setter
-    def confidence(self, confidence):
-        self.__confidence = confidence
+    def confidence(self) -> np.ndarray:
+        """Confidence value of every event, sum of passed tests / total tests."""
+        return self.table['confidence']
 
 
     @property
-    def tests_passed(self) -> int:
-        """Number of passed tests."""
-        return self.__tests_passed
-    
-    @tests_passed.setter
-    def tests_passed(self, tests_passed):
-        self.__tests_passed = tests_passed
+    def tests_passed(self) -> np.ndarray:
+        """Number of passed tests of every event."""
+        return self.table['tests_passed']
 
 
     @property
-    def total_tests(self) -> int:
-        """Total number of tests."""
-        return self.__total_tests
-    
-    @total_tests.setter
-    def total_tests(self, total_tests):
-        self.__total_tests = total_tests
\ No newline at end of file
+    def total_tests(self) -> np.ndarray:
+        """Total number of tests of every event."""
+        return self.table['total_tests']
@@ -0,0 +1,158 @@
+import numpy as np
+
+
+JUMP_TABLE_DTYPE = np.dtype([
+    ('time', np.float64), # time at min_idx, in `s`
+    ('lowG_start', np.int64),
+    ('lowG_end', np.int64),
+    ('min_idx', np.int64),
+    ('liftoff_idx', np.int64),
+    ('touch_idx', np.int64),
+    ('landing_start', np.int64),
+    ('landing_end', np.int64),
+    ('impulse_idx', np.int64),
+    ('air_time', np.float64), # in `s`
+    ('distance', np.float64),
+    ('lowest_mG', np.float64),
+    ('lowest_mG_lpf', np.float64),
+    ('confidence', np.float64),
+    ('tests_passed', np.int64),
+    ('total_tests', np.int64),
+])
+"""Record of a single jump inside a `JumpTable`."""
+
+TURN_TABLE_DTYPE = np.dtype([
+    ('time', np.float64), # time at highG_idx, in `s`
+    ('highG_idx', np.int64),
+    ('baseline_idx_1', np.int64),
+    ('baseline_idx_2', np.int64),
+    ('baseline_idx_3', np.int64),
+    ('baseline_idx_4', np.int64),
+    ('baseline_idx_5', np.int64),
+    ('peak_roll_idx', np.int64),
+    ('past_peak_roll_idx', np.int64),
+    ('side', 'U1'), # `U` or `D`
+    ('carving_angle_1', np.float64), # in `°`
+    ('carving_angle_2', np.float64),
+    ('carving_angle_3', np.float64),
+    ('carving_angle_4', np.float64),
+    ('carving_angle_5', np.float64),
+    ('max_offset_abs_roll', np.float64), # in `°`
+    ('min_turning_radius', np.float64), # in `m`
+    ('confidence', np.float64),
+    ('tests_passed', np.int64),
+    ('total_tests', np.int64),
+])
+"""Record of a single turn inside a `TurnTable`."""
+
+
+class EventTable:
+    """
+    Struct-of-arrays table of identified kinematic events, one record per event. Filtering,
+    sorting & concatenating return new tables, every column is a numpy view.
+    """
+    DTYPE = None
+
+    def __init__(self, data: np.ndarray = None) -> None:
+        self.data = data if data is not None else np.empty(0, dtype=self.DTYPE)
+
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+
+    def __getitem__(self, key):
+        """A column by name, otherwise a new table of the rows selected by an index, slice or mask."""
+        if isinstance(key, str):
+            return self.data[key]
+        return type(self)(np.atleast_1d(self.data[key]))
+
+
+    def filter(self, mask: np.ndarray):
+        """New table with only the events where `mask` is set, ex: `table.filter(table['confidence'] > 50)`."""
+        return type(self)(self.data[mask])
+
+
+    def confident(self, min_confidence=50.):
+        """New table with only the events at or above `min_confidence`, in `%`."""
+        return self.filter(self.data['confidence'] >= min_confidence)
+
+
+    def sort(self, by='time', descending=False):
+        """New table sorted (stable) by the `by` column."""
+        order = np.argsort(self.data[by], kind='stable')
+        return type(self)(self.data[order[::-1] if descending else order])
+
+
+    def toCsv(self, file):
+        """Exports the table into the csv `file`, one event per line under a header of the column names."""
+        np.savetxt(file, self.data, fmt='%s', delimiter=',', header=','.join(self.data.dtype.names), comments='')
+
+
+    def ranges(self, start: str, end: str) -> np.ndarray:
+        """`[start, end]` index range of every event, from the `start` & `end` columns. [Ex2]"""
+        return np.stack([self.data[start], self.data[end]], axis=1)
+
+
+    @classmethod
+    def zeros(cls, count: int):
+        """Table of `count` zeroed events, filled column by column by the detectors."""
+        return cls(np.zeros(count, dtype=cls.DTYPE))
+
+
+    @classmethod
+    def concat(cls, tables: list):
+        """Single table of every event in `tables`, ex: a whole season of sessions."""
+        return cls(np.concatenate([table.data for table in tables]) if tables else None)
+
+
+    @property
+    def data(self) -> np.ndarray:
+        """Structured array of event records. [Ex1]"""
+        return self.__data
+
+    @data.setter
+    def data(self, d):
+        self.__data = d
+
+
+class JumpTable(EventTable):
+    DTYPE = JUMP_TABLE_DTYPE
+
+    @property
+    def lowG_range(self) -> np.ndarray:
+        """Index range below the low G threshold of every jump. [Ex2]"""
+        return self.ranges('lowG_start', 'lowG_end')
+
+
+    @property
+    def air_range(self) -> np.ndarray:
+        """Index range of the air time of every jump. [Ex2]"""
+        return self.ranges('liftoff_idx', 'touch_idx')
+
+
+    @property
+    def landing_range(self) -> np.ndarray:
+        """Index range of the landing of every jump. [Ex2]"""
+        return self.ranges('landing_start', 'landing_end')
+
+
+class TurnTable(EventTable):
+    DTYPE = TURN_TABLE_DTYPE
+
+    @property
+    def turn_range(self) -> np.ndarray:
+        """Index range from the baseline to the max compression of every turn. [Ex2]"""
+        return self.ranges('baseline_idx_1', 'highG_idx')
+
+
+    @property
+    def baseline_range(self) -> np.ndarray:
+        """Index range between the first two baselines of every turn. [Ex2]"""
+        return self.ranges('baseline_idx_2', 'baseline_idx_1')
+
+
+    @property
+    def min_radius_range(self) -> np.ndarray:
+        """Index range from the peak roll to the max compression of every turn. [Ex2]"""
+        return self.ranges('peak_roll_idx', 'highG_idx')
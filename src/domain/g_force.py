@@ -1,4 +1,8 @@
 import numpy as np
+from utilities.append_buffer import AppendBuffer
+from utilities.filter_bank import FilterBank
+from utilities.range_stats import RangeStats
+from utilities.rolling import RollingStats
 from utilities.sig_proc_np import deriv, length, lowpass
 
 
@@ -6,12 +10,53 @@ class GForce:
     def __init__(
             self,
             raw_accel: np.ndarray, 
+            lag: int = None,
     ) -> None:
+        """Filters the raw accelerations zero-phase at once, or block by block with `lag` samples of
+        lookahead when it's set, so the recording can be streamed in with `extend()`.
+        """
+        self.accel_filter = FilterBank(3/100, lag=lag) if lag is not None else None
         self.mG = length(raw_accel)
-        self.accel_lpf = lowpass(raw_accel, 3/100, 'butter2')
+        if self.accel_filter is None:
+            self.accel_lpf = lowpass(raw_accel, 3/100, 'butter2')
+        else:
+            self.accel_lpf = self.accel_filter.process(raw_accel).reshape(-1, 3)
         self.mG_lpf = length(self.accel_lpf)
-        self.d_mG_lpf_dt = deriv(self.mG_lpf, 0.01)
-        self.d2_mG_lpf_dt2 = deriv(self.d_mG_lpf_dt, 0.01)
+        self.__buffers = None
+
+
+    def extend(self, raw_accel: np.ndarray):
+        """Appends the next block of raw accelerations, only the new samples are filtered. The filtered
+        signals trail `mG` by the filter lag until `flush()`.
+
+        The statistics & derivatives are rebuilt from the extended signals on their next use.
+        """
+        if self.accel_filter is None:
+            raise ValueError('GForce was filtered at once, set its `lag` to extend it.')
+        self.appendSignals(length(raw_accel), self.accel_filter.process(raw_accel))
+
+
+    def flush(self):
+        """Appends the filtered samples still held back by the filter lag, at the end of the recording."""
+        if self.accel_filter is not None:
+            self.appendSignals(np.empty(0), self.accel_filter.flush())
+
+
+    def appendSignals(self, mG: np.ndarray, accel_lpf: np.ndarray):
+        """Appends the new unfiltered & filtered samples to the growing signals."""
+        if self.__buffers is None:
+            self.__buffers = {name: AppendBuffer(getattr(self, name)) for name in ('mG', 'accel_lpf', 'mG_lpf')}
+        accel_lpf = np.reshape(accel_lpf, (-1, 3))
+        self.mG = self.__buffers['mG'].append(mG)
+        self.accel_lpf = self.__buffers['accel_lpf'].append(accel_lpf)
+        self.mG_lpf = self.__buffers['mG_lpf'].append(length(accel_lpf))
+
+
+    def mGRolling(self, window: int) -> RollingStats:
+        """Sliding window statistics of `mG` over `window` samples, built once per window length."""
+        if window not in self.__mG_rolling:
+            self.__mG_rolling[window] = RollingStats(self.mG, window)
+        return self.__mG_rolling[window]
 
         
     @property
@@ -22,6 +67,16 @@ class GForce:
     @mG.setter
     def mG(self, mG):
         self.__mG = mG
+        self.__mG_rolling = {}
+        self.__mG_stats = None
+
+
+    @property
+    def mG_stats(self) -> RangeStats:
+        """Range statistics of `mG`, built on first use."""
+        if self.__mG_stats is None:
+            self.__mG_stats = RangeStats(self.mG)
+        return self.__mG_stats
 
 
     @property
@@ -42,11 +97,24 @@ class GForce:
     @mG_lpf.setter
     def mG_lpf(self, mG_lpf):
         self.__mG_lpf = mG_lpf
+        self.__mG_lpf_stats = None
+        self.__d_mG_lpf_dt = None
+        self.__d2_mG_lpf_dt2 = None
     
 
+    @property
+    def mG_lpf_stats(self) -> RangeStats:
+        """Range statistics of `mG_lpf`, built on first use."""
+        if self.__mG_lpf_stats is None:
+            self.__mG_lpf_stats = RangeStats(self.mG_lpf)
+        return self.__mG_lpf_stats
+
+
     @property
     def d_mG_lpf_dt(self) -> np.ndarray:
-        """First derivative of filtered mG-forces. [Nx1]"""
+        """First derivative of filtered mG-forces, computed on first use. [Nx1]"""
+        if self.__d_mG_lpf_dt is None:
+            self.__d_mG_lpf_dt = deriv(self.mG_lpf, 0.01)
         return self.__d_mG_lpf_dt
     
     @d_mG_lpf_dt.setter
@@ -56,10 +124,21 @@ class GForce:
 
     @property
     def d2_mG_lpf_dt2(self) -> np.ndarray:
-        """Second derivative of filtered mG-forces. [Nx1]"""
+        """Second derivative of filtered mG-forces, computed on first use. [Nx1]"""
+        if self.__d2_mG_lpf_dt2 is None:
+            self.__d2_mG_lpf_dt2 = deriv(self.d_mG_lpf_dt, 0.01)
         return self.__d2_mG_lpf_dt2
     
     @d2_mG_lpf_dt2.setter
     def d2_mG_lpf_dt2(self, d2_mG_lpf_dt2):
         self.__d2_mG_lpf_dt2 = d2_mG_lpf_dt2
-    
+
+
+    @property
+    def accel_filter(self) -> FilterBank | None:
+        """Stateful lowpass of the streamed accelerations, `None` when filtered at once."""
+        return self.__accel_filter
+
+    @accel_filter.setter
+    def accel_filter(self, accel_filter):
+        self.__accel_filter = accel_filter
@@ -1,5 +1,6 @@
 import numpy as np
 from domain.geography.geographical_tests import GeographicalTest, GeographicalSearchTestingParameters
+from utilities.range_stats import RangeStats
 
 
 class GeographicalSearch:
@@ -19,6 +20,11 @@ class GeographicalSearch:
     `window_s`  The secondary comparison window used for increasing/decreasing trends. Used to confirm 
             larger trends compared to the id'd index from `within_s`. In seconds.
 
+    `stats`     Range statistics of `x`, share them between the searches over the same signal. Built
+            from `x` otherwise.
+
+    `chunk`     Number of search steps whose tests are evaluated at once.
+
     """
     def __init__(
             self, 
@@ -27,34 +33,42 @@ class GeographicalSearch:
             within_s: int,
             window_s: int,
             tests: list[GeographicalTest],
+            stats: RangeStats = None,
+            chunk=4096,
     ) -> None:
         self.search_params = GeographicalSearchTestingParameters(
             x=x,
             within_s=within_s,
             window_s=window_s,
+            stats=stats,
         )
         self.x = x
         self.dx = dx
         self.tests = tests
+        self.chunk = chunk
 
 
     def search(self, min_idx) -> int | None:
         """Search method that splices the windowed signal and performs the attached tests.
         
         If the tests all return True, the index is returned, otherwise `None` if it's never met.
+
+        The tests are evaluated on `chunk` search steps at once, stopping at the first chunk
+        holding a match.
         """
-        xw = self.search_params.x[min_idx:]
-        for i in range(int(xw.shape[0] / self.dx)):
-            i *= self.dx
-
-            if i < max(self.search_params.window_s, self.search_params.within_s) * self.search_params.fs:
-                continue
-
-            if all([
-                test_in_tester.test(self.search_params, min_idx + i)
-                for test_in_tester in self.tests
-            ]):
-                return min_idx + i - (self.search_params.within_s * self.search_params.fs)
-            
-        return None
+        params = self.search_params
+        xw = params.x[min_idx:]
+        first = -(-max(params.window_s, params.within_s) * params.fs // self.dx)
+        steps = int(xw.shape[0] / self.dx)
 
+        for c in range(first, steps, self.chunk):
+            idxs = min_idx + np.arange(c, min(c + self.chunk, steps)) * self.dx
+            passed = np.ones(idxs.shape[0], dtype=bool)
+            for test_in_tester in self.tests:
+                passed &= test_in_tester.test(params, idxs)
+
+            hits = np.flatnonzero(passed)
+            if hits.shape[0] > 0:
+                return int(idxs[hits[0]]) - (params.within_s * params.fs)
+
+        return None
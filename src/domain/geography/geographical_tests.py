@@ -1,3 +1,6 @@
+import numpy as np
+from utilities.range_stats import RangeStats
+
 
 class GeographicalSearchTestingParameters:
     def __init__(
@@ -5,14 +8,22 @@ class GeographicalSearchTestingParameters:
             x,
             within_s,
             window_s,
+            stats: RangeStats = None,
     ) -> None:
         self.fs = 100
         self.x = x
         self.within_s = within_s
         self.window_s = window_s
+        self.stats = stats if stats is not None else RangeStats(x)
+
+
+    def window(self, i):
+        """The `window_s` range(s) ending right before the index (or array of indices) `i`."""
+        return np.stack([i - (self.window_s * self.fs), i], axis=-1)
 
 
 class GeographicalTest:
+    """Test of the search signal at the index `i`, or of every index of an array `i` at once."""
     def test(self, i: int) -> bool: {}
 
 
@@ -37,7 +48,7 @@ class DecreasingSlopeLTTh(GeographicalTest):
         x = params.x
         within_s = params.within_s
 
-        return x[i - (within_s * fs)] - x[i] < self.th and x[i - (within_s * fs)] - x[i] > 0
+        return (x[i - (within_s * fs)] - x[i] < self.th) & (x[i - (within_s * fs)] - x[i] > 0)
 
 
 class IncreasingSlopeGTTh(GeographicalTest):
@@ -61,7 +72,7 @@ class IncreasingSlopeLTTh(GeographicalTest):
         x = params.x
         within_s = params.within_s
 
-        return x[i - (within_s * fs)] - x[i] > -self.th and x[i] - x[i - (within_s * fs)] < 0
+        return (x[i - (within_s * fs)] - x[i] > -self.th) & (x[i] - x[i - (within_s * fs)] < 0)
 
 
 class MaxAtBeginningOfPeriod(GeographicalTest):
@@ -69,9 +80,8 @@ class MaxAtBeginningOfPeriod(GeographicalTest):
         fs = params.fs
         x = params.x
         within_s = params.within_s
-        window_s = params.window_s
 
-        return x[i - (within_s * fs)] == max(x[i - (window_s * fs):i])
+        return x[i - (within_s * fs)] == params.stats.max(params.window(i))
 
 
 class MinAtBeginningOfPeriod(GeographicalTest):
@@ -79,9 +89,8 @@ class MinAtBeginningOfPeriod(GeographicalTest):
         fs = params.fs
         x = params.x
         within_s = params.within_s
-        window_s = params.window_s
 
-        return x[i - (within_s * fs)] == min(x[i - (window_s * fs):i])
+        return x[i - (within_s * fs)] == params.stats.min(params.window(i))
 
 
 class SlopeRangeGTTh(GeographicalTest):
@@ -89,27 +98,20 @@ class SlopeRangeGTTh(GeographicalTest):
         self.th = th
 
     def test(self, params: GeographicalSearchTestingParameters, i) -> bool:
-        fs = params.fs
-        x = params.x
-        window_s = params.window_s
+        window = params.window(i)
 
-        return max(x[i - (window_s * fs):i]) - min(x[i - (window_s * fs):i]) > self.th
+        return params.stats.max(window) - params.stats.min(window) > self.th
 
 
 class CurrentMaxWithinPeriod(GeographicalTest):
     def test(self, params: GeographicalSearchTestingParameters, i) -> bool:
-        fs = params.fs
         x = params.x
-        window_s = params.window_s
 
-        return x[i] == max(x[i - (window_s * fs):i])
+        return x[i] == params.stats.max(params.window(i))
 
 
 class CurrentMinWithinPeriod(GeographicalTest):
     def test(self, params: GeographicalSearchTestingParameters, i) -> bool:
-        fs = params.fs
         x = params.x
-        window_s = params.window_s
-
-        return x[i] == min(x[i - (window_s * fs):i])
 
+        return x[i] == params.stats.min(params.window(i))
@@ -10,6 +10,7 @@ from domain.geography.geographical_tests import (
     SlopeRangeGTTh,
 )
 from domain.session_logger import SessionLogger as logger
+from utilities.range_stats import RangeStats
 
 
 class Geography:
@@ -23,6 +24,9 @@ class Geography:
 
         logger.debug(f'Starting geographical identification, full idx range: {time.shape[0]}')
 
+        # a single range min/max index of `alt_lpf`, shared by every search
+        self.alt_lpf_stats = RangeStats(self.alt_lpf)
+
         self.lift_bottom_search = GeographicalSearch(
             x=self.alt_lpf, 
             dx=20,
@@ -32,6 +36,7 @@ class Geography:
                 IncreasingSlopeGTTh(th=20),
                 MinAtBeginningOfPeriod()
             ],
+            stats=self.alt_lpf_stats,
         )
         self.lift_peak_search = GeographicalSearch(
             x=self.alt_lpf, 
@@ -42,6 +47,7 @@ class Geography:
                 DecreasingSlopeGTTh(th=5),
                 MaxAtBeginningOfPeriod(),
             ],
+            stats=self.alt_lpf_stats,
         )
         self.run_peak_search = GeographicalSearch(
             x=self.alt_lpf, 
@@ -51,6 +57,7 @@ class Geography:
             tests=[
                 DecreasingSlopeGTTh(th=10),
             ],
+            stats=self.alt_lpf_stats,
         )
         self.run_bottom_search = GeographicalSearch(
             x=self.alt_lpf, 
@@ -61,6 +68,7 @@ class Geography:
                 DecreasingSlopeLTTh(th=3),
                 SlopeRangeGTTh(th=30),
             ],
+            stats=self.alt_lpf_stats,
         )
 
         self.identify()
@@ -155,6 +163,16 @@ class Geography:
         logger.debug(f'\tNo fragmented tracks found.')
                 
 
+    @property
+    def alt_lpf_stats(self) -> RangeStats:
+        """Range statistics of `alt_lpf`, shared by the searches for O(1) window min/max tests."""
+        return self.__alt_lpf_stats
+    
+    @alt_lpf_stats.setter
+    def alt_lpf_stats(self, alt_lpf_stats):
+        self.__alt_lpf_stats = alt_lpf_stats
+        
+
     @property
     def lift_bottom_search(self) -> GeographicalSearch:
         """Lift bottom search object and specific parameters."""
@@ -1,6 +1,7 @@
 import imufusion
 import numpy as np
 from domain.session_logger import SessionLogger as logger
+from utilities.append_buffer import AppendBuffer
 from utilities.quat import quatToEuler
 from utilities.sig_proc_np import makeContinuousRange3dof
 
@@ -35,6 +36,8 @@ class IMU:
         self.offset = imufusion.Offset(fs)
         self.ahrs = imufusion.Ahrs()
         self.fs = fs
+        self.use_mag = mag is not None
+        self.buffers = None
         self.ahrs.settings = imufusion.Settings(
             imufusion.CONVENTION_NWU,
             gain,
@@ -47,6 +50,19 @@ class IMU:
         self.computeEuler()
 
 
+    def extend(self, accel: np.ndarray, gyro: np.ndarray, mag: np.ndarray = None):
+        """Appends the orientation of the next block of motion data, continuing from the current
+        offset & AHRS state. Only the new samples are fused & converted into euler data.
+        """
+        if self.buffers is None:
+            self.buffers = {name: AppendBuffer(getattr(self, name)) for name in ('quat', 'euler', 'euler_combined')}
+
+        self.computeOrientation(accel / 1000, gyro / 1000, mag / 10 if self.use_mag else None)
+        self.computeEuler()
+        for name, buffer in self.buffers.items():
+            setattr(self, name, buffer.append(getattr(self, name)))
+
+
     def convertToBootFrame(self, x: np.ndarray) -> np.ndarray:
         return np.transpose([x[:, 1], -x[:, 2], -x[:, 0]])
 
@@ -76,7 +92,7 @@ class IMU:
         Also computes the euler norm (based on clamped signals), for external algorithm use.
         """
         logger.debug(f'Translating orientation into euler data for {self}')
-        self.euler = np.apply_along_axis(quatToEuler, 1, self.quat)
+        self.euler = quatToEuler(self.quat)
         self.euler_combined = np.linalg.norm(self.euler, axis=1)
 
 
@@ -84,10 +100,8 @@ class IMU:
     def cts_euler(self) -> np.ndarray:
         """Continuous (unclamped) euler data based on the orientation quaternion. No attached setter,
         since this is assumed to only be used in prototyping situation and will be deprecated.
-        
-        `** Watch out- this getter is inherently very slow! **`
         """
-        return makeContinuousRange3dof(self.euler, debug_file=True)
+        return makeContinuousRange3dof(self.euler)
     
 
     @property
@@ -1,58 +1,52 @@
 import numpy as np
 from constants.jump_th import JUMP_THRESHOLD_MG
 from domain.evaluated_kinematics import EvaluatedKinematics
+from domain.event_tables import JumpTable
 from domain.g_force import GForce
 from domain.session_logger import SessionLogger as logger
-from utilities.sig_proc_np import maxIndex, minIndex
-from utilities.sig_proc import cumtrapz
+from utilities.range_stats import RangeStats
+from utilities.sig_proc_np import cumtrapz
 from utilities.stat_tests import StatTests as ST
 
-class Jump(EvaluatedKinematics):
+class JumpDetector(EvaluatedKinematics):
+    """
+    Identifies every jump of the low G ranges at once, each step writes its column(s) straight into
+    the `JumpTable`, one row per jump.
+    """
     def __init__(
             self,
-            lowG_range: np.ndarray,
+            lowG_ranges: np.ndarray,
             g_force: GForce,
             gyro: np.ndarray,
+            time: np.ndarray,
+            gyro_stats: RangeStats,
     ) -> None:
-        super().__init__()
+        lowG_ranges = np.asarray(lowG_ranges, dtype=np.int64).reshape(-1, 2)
+        super().__init__(JumpTable.zeros(lowG_ranges.shape[0]))
+        self.table.data['lowG_start'] = lowG_ranges[:, 0]
+        self.table.data['lowG_end'] = lowG_ranges[:, 1]
 
-        self.lowG_range = lowG_range
+        self.g_force = g_force
         self.mG_lpf = g_force.mG_lpf
         self.mG = g_force.mG
         self.gyro = gyro
+        self.gyro_stats = gyro_stats
+        self.time = time
 
         self.identify()
 
 
-    @property
-    def air_time(self):
-        """Calculate the air time from `liftoff_idx` and the beginning of the landing, `touch_idx`"""
-        # indices are in 100Hz
-        return (self.touch_idx - self.liftoff_idx) / 100
-
-    @property
-    def distance(self):
-        """Calculate the jump distance based on the integration of the Tile
-        acceleration subtracting gravity.
-
-        Note, this assumes that the only other acceleration next to gravity is pure motion.
-        Friction and drag are neglected.
-        """
-        # integrate (mG_lpf - 1G) to get velocity
-        vel = cumtrapz(self.mG_lpf - 1)
-        mean_air_time_vel = np.mean(vel[self.liftoff_idx:self.touch_idx])
-        return mean_air_time_vel * self.air_time
-
-
     def computeMinIndex(self):
-        self.lowest_mG_lpf = self.mG_lpf[self.lowG_range[0]]
-        self.lowest_mG = self.mG[self.lowG_range[0]]
-        if self.lowG_range[0] != self.lowG_range[1]:
-            self.lowest_mG_lpf = min(self.mG_lpf[self.lowG_range[0]:self.lowG_range[1]])
-            self.lowest_mG = min(self.mG[self.lowG_range[0]:self.lowG_range[1]])
+        """Lowest `mG_lpf` & `mG` of every low G range, with the index of the lowest `mG_lpf` as `min_idx`."""
+        data = self.table.data
+        lowG_range = self.table.lowG_range
+        single = data['lowG_start'] == data['lowG_end']
 
-        self.min_idx = minIndex(self.mG_lpf, self.lowG_range)
-        logger.debug(f'min_idx:\t\t{self.min_idx}')
+        data['lowest_mG_lpf'] = np.where(single, self.mG_lpf[data['lowG_start']], self.g_force.mG_lpf_stats.min(lowG_range))
+        data['lowest_mG'] = np.where(single, self.mG[data['lowG_start']], self.g_force.mG_stats.min(lowG_range))
+        data['min_idx'] = np.where(single, data['lowG_start'], self.g_force.mG_lpf_stats.argmin(lowG_range))
+        data['time'] = self.time[data['min_idx']]
+        logger.debug(f'min_idx:\t\t{data["min_idx"]}')
 
 
     def computeAirPhase(self, th=2, method='std'):
@@ -61,39 +55,50 @@ class Jump(EvaluatedKinematics):
 
         Store the maximum seen before `min_idx` in `mG_lpf` as the `liftoff_idx`.
         """
+        data = self.table.data
+        min_idx = data['min_idx']
+
         if method == 'std':
             # std-based method, search left and right until the window std dev passes a th
-            N = self.mG.shape[0]
             wsamples = 16
-            self.liftoff_idx = self.min_idx
-            self.touch_idx = self.min_idx
-            for i in range(self.min_idx + 1 - wsamples):
-                # build sliding window & test std
-                if np.std(self.mG[self.min_idx - (wsamples + i):self.min_idx - i]) > 400:
-                    self.liftoff_idx = self.min_idx - (i + round(wsamples / 2))
-                    break
-
-            for i in range(N - self.min_idx + 1 - wsamples):
-                if np.std(self.mG[self.min_idx + i:self.min_idx + (wsamples + i)]) > 1000:
-                    self.touch_idx = self.min_idx + (i + round(wsamples / 2))
-                    break
+            mG_std = self.g_force.mGRolling(wsamples).std
+
+            # last window ending at or before min_idx, first window starting at or after it
+            liftoff_starts = np.flatnonzero(mG_std > 400)
+            last = np.searchsorted(liftoff_starts, np.maximum(min_idx + 1 - wsamples, 0), side='left') - 1
+            data['liftoff_idx'] = np.where(
+                last >= 0,
+                liftoff_starts[np.maximum(last, 0)] + wsamples - round(wsamples / 2) if liftoff_starts.shape[0] else 0,
+                min_idx,
+            )
+
+            touch_starts = np.flatnonzero(mG_std > 1000)
+            first = np.searchsorted(touch_starts, min_idx, side='left')
+            data['touch_idx'] = np.where(
+                first < touch_starts.shape[0],
+                touch_starts[np.minimum(first, touch_starts.shape[0] - 1)] + round(wsamples / 2) if touch_starts.shape[0] else 0,
+                min_idx,
+            )
 
         else:
-            x1 = 0
-            for i in range(len(self.mG_lpf[0:self.min_idx])):
-                if self.mG_lpf[self.min_idx - i] - self.mG_lpf[self.min_idx - (i + 1)] > th:
-                    x1 = self.min_idx - (i + 1)
-                    break
-            self.liftoff_idx = maxIndex(self.mG_lpf, [x1, self.min_idx])
+            # last rise larger than th left of min_idx, then the max in between
+            rises = np.flatnonzero(np.diff(self.mG_lpf) > th)
+            last = np.searchsorted(rises, min_idx, side='left') - 1
+            x1 = np.where(last >= 0, rises[np.maximum(last, 0)] if rises.shape[0] else 0, 0)
+            data['liftoff_idx'] = np.where(x1 == min_idx, x1, self.g_force.mG_lpf_stats.argmax(np.stack([x1, min_idx], axis=1)))
 
             # now search right of `min_idx` to find the point where G's increase, signifying landing
-            for i in range(len(self.mG_lpf[self.min_idx:-1])):
-                if self.mG_lpf[self.min_idx + i] > JUMP_THRESHOLD_MG:
-                    self.touch_idx = self.min_idx + i
-                    break
+            landings = np.flatnonzero(self.mG_lpf[:-1] > JUMP_THRESHOLD_MG)
+            first = np.searchsorted(landings, min_idx, side='left')
+            data['touch_idx'] = np.where(
+                first < landings.shape[0],
+                landings[np.minimum(first, landings.shape[0] - 1)] if landings.shape[0] else 0,
+                min_idx,
+            )
 
-        self.air_range =  [self.liftoff_idx, self.touch_idx]
-        logger.debug(f'air_range:\t{self.air_range}')
+        # indices are in 100Hz
+        data['air_time'] = (data['touch_idx'] - data['liftoff_idx']) / 100
+        logger.debug(f'air_range:\t{self.table.air_range.tolist()}')
 
 
     def computeLandingPhase(self, delay_s=0.5):
@@ -102,43 +107,176 @@ class Jump(EvaluatedKinematics):
 
         Store the impulse seen in `mG` as the `impulse_idx`.
         """
-        self.landing_range = [self.touch_idx, int(self.touch_idx + delay_s * 100)]
-        self.impulse_idx = maxIndex(self.mG, self.landing_range)
-        logger.debug(f'landing_range:\t{self.landing_range}')
-    
-
-    def testSuite(self) -> np.ndarray:
-        """Run the test suite. Can toggle individual running here.
-        
+        data = self.table.data
+        data['landing_start'] = data['touch_idx']
+        data['landing_end'] = (data['touch_idx'] + delay_s * 100).astype(np.int64)
+        landing_range = self.table.landing_range
+        empty = data['landing_start'] == data['landing_end']
+        data['impulse_idx'] = np.where(empty, data['landing_start'], self.g_force.mG_stats.argmax(landing_range))
+        logger.debug(f'landing_range:\t{landing_range.tolist()}')
+
+
+    def computeDistance(self):
+        """Calculate the jump distance based on the integration of the Tile
+        acceleration subtracting gravity.
+
+        Note, this assumes that the only other acceleration next to gravity is pure motion.
+        Friction and drag are neglected.
+        """
+        # integrate (mG_lpf - 1G) to get velocity, once for every jump
+        vel_stats = RangeStats(cumtrapz(self.mG_lpf - 1))
+        data = self.table.data
+        data['distance'] = vel_stats.mean(self.table.air_range) * data['air_time']
+
+
+    def testSuite(self) -> list[np.ndarray]:
+        """Run the test suite on every jump. Can toggle individual running here.
+
         In the future, can return values and parameters for each test. For ML
         """
         logger.debug('Running test suite.')
-        return np.array([
-            ST.testDecreasingTrend(self.mG_lpf, self.air_range, header='Test mG_lpf has decreasing trend during air range'),
-            ST.testMinSampleCount(self.air_range, min_count=30, header='Test air_range has minimum 30 sample count'),
-            ST.testMinSampleCount(self.lowG_range, min_count=10, header='Test lowG_range has minimum 10 samples below lowG threshold'),
-            ST.testLowerSampleStdDev(self.mG, self.air_range, header='Test mG std dev (air time < pop)'),
-            ST.testLowerSampleStdDev(self.gyro, self.air_range, header='Test gyro std dev (air time < pop)'),
-            ST.testLowerSampleMean(self.mG, self.air_range, header='Test mG mean (air time < pop)'),
-            # ST.testLowerSampleMean(self.gyro, self.air_range, header='Test gyro mean (air time < pop)'),
-            ST.testLowerSampleStdDev(self.mG, self.air_range, self.landing_range, header='Test mG std dev (air time < landing time)'),
-            ST.testLowerSampleStdDev(self.gyro, self.air_range, self.landing_range, header='Test gyro std dev (air time < landing time)'),
-            ST.testLowerSampleMean(self.mG, self.air_range, self.landing_range, header='Test mG mean (air time < landing time)'),
-            # ST.testLowerSampleMean(self.gyro, self.air_range, self.landing_range, header='Test gyro mean (air time < landing time)'),
-            ST.testLargerSampleStdDev(self.mG, self.landing_range, header='Test mG std dev (landing time > pop)'),
-            ST.testLargerSampleStdDev(self.gyro, self.landing_range, header='Test gyro std dev (landing time > pop)'),
-            ST.testLargerSampleMean(self.mG, self.landing_range, header='Test mG mean (landing time > pop)'),
-            ST.testLargerSampleMean(self.gyro, self.landing_range, header='Test gyro mean (landing time > pop)'),
-            ST.testLargestMagnitude(self.mG, self.air_range, header='Test landing time mG contains large impulse > (3 * std dev)'),
-            ST.testTimingOfMagnitude(self.mG, self.landing_range, header='Test that large impulse occurs close to landing time'),
-        ])
-    
-    
+        lowG_range = self.table.lowG_range
+        air_range = self.table.air_range
+        landing_range = self.table.landing_range
+        mG_stats = self.g_force.mG_stats
+        return [
+            ST.testDecreasingTrend(self.mG_lpf, air_range, header='Test mG_lpf has decreasing trend during air range'),
+            ST.testMinSampleCount(air_range, min_count=30, header='Test air_range has minimum 30 sample count'),
+            ST.testMinSampleCount(lowG_range, min_count=10, header='Test lowG_range has minimum 10 samples below lowG threshold'),
+            ST.testLowerSampleStdDev(self.mG, air_range, stats=mG_stats, header='Test mG std dev (air time < pop)'),
+            ST.testLowerSampleStdDev(self.gyro, air_range, stats=self.gyro_stats, header='Test gyro std dev (air time < pop)'),
+            ST.testLowerSampleMean(self.mG, air_range, stats=mG_stats, header='Test mG mean (air time < pop)'),
+            # ST.testLowerSampleMean(self.gyro, air_range, stats=self.gyro_stats, header='Test gyro mean (air time < pop)'),
+            ST.testLowerSampleStdDev(self.mG, air_range, landing_range, stats=mG_stats, header='Test mG std dev (air time < landing time)'),
+            ST.testLowerSampleStdDev(self.gyro, air_range, landing_range, stats=self.gyro_stats, header='Test gyro std dev (air time < landing time)'),
+            ST.testLowerSampleMean(self.mG, air_range, landing_range, stats=mG_stats, header='Test mG mean (air time < landing time)'),
+            # ST.testLowerSampleMean(self.gyro, air_range, landing_range, stats=self.gyro_stats, header='Test gyro mean (air time < landing time)'),
+            ST.testLargerSampleStdDev(self.mG, landing_range, stats=mG_stats, header='Test mG std dev (landing time > pop)'),
+            ST.testLargerSampleStdDev(self.gyro, landing_range, stats=self.gyro_stats, header='Test gyro std dev (landing time > pop)'),
+            ST.testLargerSampleMean(self.mG, landing_range, stats=mG_stats, header='Test mG mean (landing time > pop)'),
+            ST.testLargerSampleMean(self.gyro, landing_range, stats=self.gyro_stats, header='Test gyro mean (landing time > pop)'),
+            ST.testLargestMagnitude(self.mG, air_range, stats=mG_stats, header='Test landing time mG contains large impulse > (3 * std dev)'),
+            ST.testTimingOfMagnitude(self.mG, landing_range, stats=mG_stats, header='Test that large impulse occurs close to landing time'),
+        ]
+
+
     def identify(self):
-        """Identifies the ranges of air time and landing"""
-        logger.debug('New jump identification.')
+        """Identifies the ranges of air time and landing of every jump"""
+        logger.debug(f'Identifying {len(self.table)} jumps.')
         self.computeMinIndex()
         self.computeAirPhase()
         self.computeLandingPhase()
+        self.computeDistance()
         self.test(self.testSuite)
-    
+
+
+class Jump:
+    """
+    View of a single jump, row `idx` of the `JumpTable`, with the signals it was identified from.
+    Every value is read from the table row, ex: `tile.jumps[0].air_range`.
+    """
+    def __init__(
+            self,
+            table: JumpTable,
+            idx: int,
+            g_force: GForce,
+            gyro: np.ndarray,
+            gyro_stats: RangeStats,
+    ) -> None:
+        self.table = table
+        self.idx = idx
+        self.g_force = g_force
+        self.mG_lpf = g_force.mG_lpf
+        self.mG = g_force.mG
+        self.gyro = gyro
+        self.gyro_stats = gyro_stats
+
+
+    @property
+    def row(self) -> np.void:
+        """Record of the jump in the `JumpTable`."""
+        return self.table.data[self.idx]
+
+
+    @property
+    def lowG_range(self) -> list:
+        """Index range below the low G threshold."""
+        return [self.row['lowG_start'], self.row['lowG_end']]
+
+
+    @property
+    def min_idx(self) -> int:
+        """Index of the lowest `mG_lpf` inside the low G range."""
+        return self.row['min_idx']
+
+
+    @property
+    def liftoff_idx(self) -> int:
+        """Index of the liftoff, start of the air time."""
+        return self.row['liftoff_idx']
+
+
+    @property
+    def touch_idx(self) -> int:
+        """Index of the touch down, end of the air time."""
+        return self.row['touch_idx']
+
+
+    @property
+    def air_range(self) -> list:
+        """Index range of the air time."""
+        return [self.liftoff_idx, self.touch_idx]
+
+
+    @property
+    def landing_range(self) -> list:
+        """Index range of the landing."""
+        return [self.row['landing_start'], self.row['landing_end']]
+
+
+    @property
+    def impulse_idx(self) -> int:
+        """Index of the largest `mG` impulse during the landing."""
+        return self.row['impulse_idx']
+
+
+    @property
+    def air_time(self) -> float:
+        """Air time, in `s`."""
+        return self.row['air_time']
+
+
+    @property
+    def distance(self) -> float:
+        """Jump distance, see `JumpDetector.computeDistance()`."""
+        return self.row['distance']
+
+
+    @property
+    def lowest_mG(self) -> float:
+        """Lowest `mG` inside the low G range."""
+        return self.row['lowest_mG']
+
+
+    @property
+    def lowest_mG_lpf(self) -> float:
+        """Lowest `mG_lpf` inside the low G range."""
+        return self.row['lowest_mG_lpf']
+
+
+    @property
+    def confidence(self) -> float:
+        """Confidence value, sum of passed tests / total tests."""
+        return self.row['confidence']
+
+
+    @property
+    def tests_passed(self) -> int:
+        """Number of passed tests."""
+        return self.row['tests_passed']
+
+
+    @property
+    def total_tests(self) -> int:
+        """Total number of tests."""
+        return self.row['total_tests']
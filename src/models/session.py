@@ -1,9 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 from io import TextIOWrapper
 from constants.jump_th import JUMP_THRESHOLD_MG
 from constants.turn_th import D_MG_LPF_DT_TH
 from domain.decode.decode_a50 import decodeA50
 from domain.decode.decode_f6p import decodeF6P
-from domain.decode.decode_tile import decodeTile
+from domain.decode.decode_fit import decodeFIT
+from domain.decode.decode_tcx import decodeTCX
+from domain.decode.decode_tile import decodeTile, decodeTileChunks
+from domain.devices.track_set import TrackSet
 from domain.session_logger import SessionLogger as logger
 from models.tile import Tile
 from utilities.datafile import (
@@ -12,7 +16,9 @@ from utilities.datafile import (
     constructTurnLine,
     createJumpDataFile,
     createSensorBootDataFile,
-    createTurnDataFile
+    createTurnDataFile,
+    jumpRangeStats,
+    turnRangeStats,
 )
 
 class Session:
@@ -24,21 +30,40 @@ class Session:
             offsets=None,
             compute_kinematics=True,
             import_non_tile=True,
+            compact_tile=False,
+            cache_tile=False,
+            stream_tile=False,
     ) -> None:
-        # init the device objects
-        self.raw_tile = decodeTile(tile_file)
-        self.tile = Tile(raw=self.raw_tile, compute_kinematics=compute_kinematics)
+        """Set `stream_tile` to decode & filter the Tile csv block by block (`Tile.fromChunks()`), so
+        the whole `RawTile` is never held in memory, `raw_tile` is then `None`.
+        """
+        # decode the independent device files concurrently, csv parsing releases the GIL
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            if stream_tile:
+                tile_job = pool.submit(Tile.fromChunks, decodeTileChunks(tile_file, compact=compact_tile), compute_kinematics=compute_kinematics)
+            else:
+                tile_job = pool.submit(decodeTile, tile_file, use_cache=cache_tile, compact=compact_tile)
+            a50_job = pool.submit(decodeA50, a50_file) if a50_file is not None and import_non_tile is True else None
+            f6p_job = pool.submit(self.decodeGarmin, f6p_file) if f6p_file is not None and import_non_tile is True else None
 
-        if a50_file is not None and import_non_tile is True:
-            self.a50 = decodeA50(a50_file)
+        # init the device objects
+        if stream_tile:
+            self.raw_tile = None
+            self.tile = tile_job.result()
+        else:
+            self.raw_tile = tile_job.result()
+            self.tile = Tile(raw=self.raw_tile, compute_kinematics=compute_kinematics)
+
+        if a50_job is not None:
+            self.a50 = TrackSet(a50_job.result())
             if offsets is None:
                 self.tile.identifyOffsets(self.a50)
             else:
                 self.tile.applyOffsets(offsets[0], offsets[1])
                 self.tile.applyTimestamp(self.a50[0].time[0])
 
-        if f6p_file is not None and import_non_tile is True:
-            self.f6p = decodeF6P(f6p_file)
+        if f6p_job is not None:
+            self.f6p = TrackSet(f6p_job.result())
 
         self.logJumpData()
         self.logTurnData()
@@ -47,17 +72,28 @@ class Session:
         logger.info('Done importing session.\n')
 
 
+    def decodeGarmin(self, file):
+        """Decodes the Garmin file with the decoder matching its format, `.fit`, `.tcx` or the csv export."""
+        if file.lower().endswith('.fit'):
+            return decodeFIT(file)
+        if file.lower().endswith('.tcx'):
+            return decodeTCX(file)
+        return decodeF6P(file)
+
+
     def logJumpData(self):
         logger.info('Generating jump training file.')
         self.jump_train_file = createJumpDataFile(f'tile-{self.a50[0].date}-jumps-{JUMP_THRESHOLD_MG}mG.csv')
-        self.jump_train_file.writelines([constructJumpLine(jump) for jump in self.tile.jumps])
+        stats = jumpRangeStats(self.tile)
+        self.jump_train_file.writelines([constructJumpLine(jump, stats) for jump in self.tile.jumps])
         self.jump_train_file.close()
 
 
     def logTurnData(self):
         logger.info('Generating turn training file.')
         self.turn_train_file = createTurnDataFile(f'tile-{self.a50[0].date}-turns-{D_MG_LPF_DT_TH}d_mG_lpf_dt.csv')
-        self.turn_train_file.writelines([constructTurnLine(turn) for turn in self.tile.turns])
+        stats = turnRangeStats(self.tile)
+        self.turn_train_file.writelines([constructTurnLine(turn, stats) for turn in self.tile.turns])
         self.turn_train_file.close()
 
 
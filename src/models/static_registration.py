@@ -4,7 +4,8 @@ from domain.registration import Registration
 from models.imu import IMU
 from domain.session_logger import SessionLogger as logger
 from utilities.frames import convertToBootFrame
-from utilities.quat import avgQuat, eulerToQuat, inverseQuat, quatToEuler
+from utilities.quat import avgQuatRanges, eulerToQuat, inverseQuat, quatToEuler
+from utilities.rolling import RollingStats
 from utilities.sig_proc import maxIndex
 
 
@@ -22,6 +23,7 @@ class StaticRegistration:
         self.alt_lpf = alt_lpf
         self.mG = mG
         self.imu = imu
+        self.mG_rolling = None
 
         self.identify()
 
@@ -31,8 +33,21 @@ class StaticRegistration:
         #  - ifft of raw gyro, accel
         return [
             # np.std(self.imu.euler_combined[r[0]:r[1]]) < EULER_DEG_NORM_STILLNESS_TH,
-            np.std(self.mG[r[0]:r[1]]) < MG_STILLNESS_TH,
+            self.mGStd(r) < MG_STILLNESS_TH,
         ]
+
+
+    def mGStd(self, r) -> float:
+        """Std dev of `mG` in the range `r`, looked up from the rolling window statistics when `r` is
+        a full search window, otherwise computed directly.
+        """
+        if (
+            self.mG_rolling is not None and
+            r[1] - r[0] == self.mG_rolling.window and
+            0 <= r[0] and r[1] <= self.mG.shape[0]
+        ):
+            return self.mG_rolling.std[r[0]]
+        return np.std(self.mG[r[0]:r[1]])
     
 
     def computeFineStillRanges(self, min_s=0.25, r=[0, -1]) -> list[list]:
@@ -40,6 +55,8 @@ class StaticRegistration:
         and returns them as a list of lists representing their indices.
         """
         wsamples = round(min_s * 100)
+        if self.mG_rolling is None or self.mG_rolling.window != wsamples:
+            self.mG_rolling = RollingStats(self.mG, wsamples)
         search = (r[1] - r[0]) - wsamples
         coarse_mult = wsamples
         fine_mult = round(coarse_mult / 10)
@@ -140,12 +157,14 @@ class StaticRegistration:
         """Computes the static registration based on the avg orientation within the discovered static
         index `idx`.        
         """
+        ranges = [r for r in self.ranges if r is not None]
+        avg_quats = avgQuatRanges(self.imu.quat, np.array(ranges))
         self.registrations = [
             Registration(
                 ts=self.time[r[1]],
                 range=r,
-                avg_quat=avgQuat(self.imu.quat[r[0]:r[1], :]),
-            ) for r in self.ranges if r is not None
+                avg_quat=avg_quat,
+            ) for r, avg_quat in zip(ranges, avg_quats)
         ]
         logger.debug(f'Identified {len(self.registrations)} total static registrations.')
 
@@ -181,13 +200,29 @@ class StaticRegistration:
         By default in boot frame, override `boot_frame` to `False` otherwise. Only registers the 
         2D/horizontal registration.
         """
-        if len(self.registrations) == 0 or timestamp < self.registrations[0].ts:
-            return np.array([1, 0, 0, 0])
+        return self.getMostRecentRegistrationQuats(np.array([timestamp]))[0]
+
+
+    def getMostRecentRegistrationQuats(self, timestamps: np.ndarray) -> np.ndarray:
+        """Vectorized `getMostRecentRegistrationQuat()` for every timestamp in `timestamps`. [Nx4]
         
+        The boot frame offset of each registration is computed once, then looked up per timestamp
+        with a `searchsorted` on the registration timestamps.
+        """
+        quats = np.tile(np.array([1., 0., 0., 0.]), (timestamps.shape[0], 1))
+        if len(self.registrations) == 0:
+            return quats
+
         # convert to boot frame and extract only the horizontal portion of the registrations
-        q_offset_b = convertToBootFrame(self.getMostRecentRegistration(timestamp).avg_quat)
-        euler_offset_b = quatToEuler(q_offset_b)
-        return inverseQuat(eulerToQuat(np.array([euler_offset_b[0], euler_offset_b[1], 0])))
+        euler_offsets_b = quatToEuler(convertToBootFrame(np.array([reg.avg_quat for reg in self.registrations])))
+        euler_offsets_b[:, 2] = 0
+        offsets = inverseQuat(eulerToQuat(euler_offsets_b))
+
+        reg_ts = np.array([reg.ts for reg in self.registrations])
+        regs_below = np.searchsorted(reg_ts, timestamps, side='left')
+        registered = timestamps >= reg_ts[0]
+        quats[registered] = offsets[np.maximum(regs_below[registered] - 1, 0)]
+        return quats
             
 
     @property
@@ -200,6 +235,16 @@ class StaticRegistration:
         self.__ranges = rs
 
 
+    @property
+    def mG_rolling(self) -> RollingStats | None:
+        """Rolling `mG` statistics over the still search window, `None` before the first search."""
+        return self.__mG_rolling
+    
+    @mG_rolling.setter
+    def mG_rolling(self, r):
+        self.__mG_rolling = r
+
+
     @property
     def registrations(self) -> list[Registration]:
         """The identified static registrations representing the still motions for sensor to boot realignment."""
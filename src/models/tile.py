@@ -1,19 +1,27 @@
 import numpy as np
+from constants.filter_lag import ALT_LPF_LAG, MG_LPF_LAG
 from constants.jump_th import JUMP_THRESHOLD_MG
 from constants.turn_th import D_MG_LPF_DT_TH
 from domain.devices.raw_tile import RawTile
 from domain.devices.track import Track
+from domain.devices.track_set import TrackSet
+from domain.event_tables import JumpTable, TurnTable
 from domain.g_force import GForce
 from domain.session_logger import SessionLogger as logger
 from models.geography import Geography
-from models.jump import Jump
+from models.jump import Jump, JumpDetector
 from models.static_registration import StaticRegistration
 from models.imu import IMU
-from models.turn import Turn
+from models.turn import Turn, TurnDetector
+from utilities.append_buffer import AppendBuffer
+from utilities.filter_bank import FilterBank
 from utilities.frames import convertToBootFrame
+from utilities.interval_index import IntervalIndex
+from utilities.range_stats import RangeStats
 from utilities.sig_proc_np import deriv, identifyLTThInsideRanges, length, lowpass, lowpass, zeroCrossingIdxsGTThInsideRanges
 from utilities.sync import identifyOffsets
 from utilities.quat import quatMult, quatToEuler
+from utilities.time_index import SignalWindow, TimeIndex
 
 class Tile:
     def __init__(
@@ -21,13 +29,39 @@ class Tile:
             raw: RawTile,
             prefer_9dof=False,
             compute_kinematics=True,
+            stream=False,
     ):
+        """Set `stream` to filter the altitude & g-forces block by block with lookahead filters instead
+        of at once, so the next blocks of the recording can be appended with `extend()`, see `fromChunks()`.
+        """
+        self.gaps = raw.gaps
         self.time = raw.time / 1000
-        self.constructProcessedSignals(raw, prefer_9dof)
+        self.constructProcessedSignals(raw, prefer_9dof, stream)
 
         if not compute_kinematics:
             return
         
+        self.computeKinematics()
+
+
+    @classmethod
+    def fromChunks(cls, raws, prefer_9dof=False, compute_kinematics=True):
+        """Builds the Tile from consecutive `RawTile` blocks, ex: `decodeTileChunks()`, filtering only
+        the new samples of every block. The kinematics are identified once the last block is in.
+        """
+        raws = iter(raws)
+        tile = cls(next(raws), prefer_9dof, compute_kinematics=False, stream=True)
+        for raw in raws:
+            tile.extend(raw)
+        tile.flush()
+
+        if compute_kinematics:
+            tile.computeKinematics()
+        return tile
+
+
+    def computeKinematics(self):
+        """Identifies all the kinematics from the processed signals."""
         self.identifyGeographicalPoints()
         self.identifyJumps()
         self.identifyStaticRegistrations()
@@ -39,23 +73,82 @@ class Tile:
         logger.debug(f'{prefix}Duration [s]", {round(self.time[-1] - self.time[0])}')
 
 
-    def constructProcessedSignals(self, raw: RawTile, prefer_9dof: bool=None):
+    def index(self, t):
+        """Sample index of the timestamp `t` in `s` (first sample at or after it), `t` can be an array."""
+        return self.time_index.index(t)
+
+
+    def window(self, t0, t1) -> SignalWindow:
+        """Zero-copy views of every signal between the timestamps `[t0, t1)` in `s`, ex:
+        `tile.window(t0, t1).g_force.mG_lpf`. Costs O(log N) regardless of the window size.
+        """
+        return SignalWindow(self, self.time_index.slice(t0, t1), self.time.shape[0])
+
+
+    def constructProcessedSignals(self, raw: RawTile, prefer_9dof: bool=None, stream=False):
         """Constructs all the processed signals for the Tile sensor."""
         logger.info(f'Constructing all processed signals.')
 
         self.raw_alt = 44307.694 * (1 - (raw.pres / 1013.25)**0.190284)
-        self.raw_alt_lpf = lowpass(self.raw_alt, 1/100, 'butter2')
+        if stream:
+            self.alt_filter = FilterBank(1/100, lag=ALT_LPF_LAG)
+            self.raw_alt_lpf = self.alt_filter.process(self.raw_alt)
+        else:
+            self.alt_filter = None
+            self.raw_alt_lpf = lowpass(self.raw_alt, 1/100, 'butter2')
         self.gyro_v = length(raw.gyro)
         self.imu = IMU(raw.accel, raw.gyro, raw.mag if prefer_9dof else None)
-        self.g_force = GForce(raw.accel)
+        self.g_force = GForce(raw.accel, MG_LPF_LAG if stream else None)
+        self.__buffers = None
 
         # placeholder until the offsets are set from ground truth
         self.alt = self.raw_alt
         self.alt_lpf = self.raw_alt_lpf
 
 
+    def extend(self, raw: RawTile):
+        """Appends the next `RawTile` block of the recording to the processed signals, only its samples
+        are filtered & fused. The filtered signals trail the raw ones by the filter lag until `flush()`.
+
+        Only for a `stream` Tile, before the offsets & kinematics are identified.
+        """
+        if self.alt_filter is None:
+            raise ValueError('Tile was filtered at once, construct it with `stream` to extend it.')
+        buffers = self.signalBuffers()
+        gaps = raw.gaps.copy()
+        gaps['idx'] += self.time.shape[0]
+        self.gaps = buffers['gaps'].append(gaps)
+        self.time = buffers['time'].append(raw.time / 1000)
+        raw_alt = 44307.694 * (1 - (raw.pres / 1013.25)**0.190284)
+        self.raw_alt = buffers['raw_alt'].append(raw_alt)
+        self.raw_alt_lpf = buffers['raw_alt_lpf'].append(self.alt_filter.process(raw_alt))
+        self.gyro_v = buffers['gyro_v'].append(length(raw.gyro))
+        self.imu.extend(raw.accel, raw.gyro, raw.mag)
+        self.g_force.extend(raw.accel)
+
+        self.alt = self.raw_alt
+        self.alt_lpf = self.raw_alt_lpf
+
+
+    def signalBuffers(self) -> dict[str, AppendBuffer]:
+        """Growing buffers of the streamed signals, started from the current signals on first use."""
+        if self.__buffers is None:
+            self.__buffers = {name: AppendBuffer(getattr(self, name)) for name in ('time', 'gaps', 'raw_alt', 'raw_alt_lpf', 'gyro_v')}
+        return self.__buffers
+
+
+    def flush(self):
+        """Appends the filtered samples still held back by the filter lags, at the end of the recording."""
+        if self.alt_filter is None:
+            return
+
+        self.raw_alt_lpf = self.signalBuffers()['raw_alt_lpf'].append(self.alt_filter.flush())
+        self.alt_lpf = self.raw_alt_lpf
+        self.g_force.flush()
+
+
     def identifyOffsets(self, 
-        truth: list[Track],
+        truth: list[Track] | TrackSet,
         use_lpf=True,
     ):
         """Synchronizes the raw tile signals with a ground truth (using a search for best fit),
@@ -65,7 +158,7 @@ class Tile:
         """
         logger.info(f'Identifying timestamp and altitude offsets.')
 
-        opt_ts, opt_alt = identifyOffsets(self.raw_alt_lpf if use_lpf else self.raw_alt, use_lpf)
+        opt_ts, opt_alt = identifyOffsets(self.raw_alt_lpf if use_lpf else self.raw_alt, truth)
         self.applyOffsets(opt_ts, opt_alt)
         self.applyTimestamp(truth[0].time[0])
 
@@ -101,6 +194,7 @@ class Tile:
             [el.idx for el in self.geography.run_peaks],
             [el.idx for el in self.geography.run_bottoms],
         ])
+        self.downhill_index = IntervalIndex(self.downhill_idxs)
         self.lift_idxs = np.transpose([
             [el.idx for el in self.geography.lift_bottoms],
             [el.idx for el in self.geography.lift_peaks],
@@ -114,18 +208,16 @@ class Tile:
 
 
     def identifyJumps(self=None):
-        """Identify all points of low G-force and run the jump id pipeline on each.
+        """Identify all points of low G-force and run the jump id pipeline on all of them at once.
         
-        Confidence values will be associated with each `Jump` instance.
+        Every jump is a row of the `jump_table`, with its associated confidence value.
         """
         logger.info(f'Identifying key points of near-zero acceleration.')
-        lowG_els = identifyLTThInsideRanges(self.g_force.mG_lpf, JUMP_THRESHOLD_MG, self.downhill_idxs)
+        lowG_els = identifyLTThInsideRanges(self.g_force.mG_lpf, JUMP_THRESHOLD_MG, self.downhill_index)
 
         logger.info(f'Computing the associated jumping kinematics based on near-zero acclerations.')
-        self.jumps = [
-            Jump(lowG_els[row], self.g_force, self.gyro_v)
-            for row in range(lowG_els.shape[0])
-        ]
+        self.gyro_v_stats = RangeStats(self.gyro_v)
+        self.jump_table = JumpDetector(lowG_els, self.g_force, self.gyro_v, self.time, self.gyro_v_stats).table
 
 
     def identifyStaticRegistrations(self=None):
@@ -167,31 +259,34 @@ class Tile:
         orientation transformations.
         """
         logger.info(f'Converting orientation into static boot frame.')
-        self.boot_quat = np.apply_along_axis(convertToBootFrame, 1, self.imu.quat)
+        self.boot_quat = convertToBootFrame(self.imu.quat)
 
         # center the boot orientation
         logger.info(f'Applying static registations to compute the orientation quaternion representing the boot.')
-        for i in range(self.boot_quat.shape[0] - 1):
-            self.boot_quat[i] = quatMult(
-                self.boot_quat[i], 
-                self.static_registration.getMostRecentRegistrationQuat(self.time[i])
-            )
+        self.boot_quat[:-1] = quatMult(
+            self.boot_quat[:-1],
+            self.static_registration.getMostRecentRegistrationQuats(self.time[:-1])
+        )
 
         logger.debug('Converting boot orientation into euler data.')
-        self.boot_euler = np.apply_along_axis(quatToEuler, 1, self.boot_quat)
-        self.d_boot_euler_dt = np.apply_along_axis(deriv, 0, self.boot_euler)
+        self.boot_euler = quatToEuler(self.boot_quat)
+        self.d_boot_euler_dt = deriv(self.boot_euler)
 
 
     def identifyTurns(self=None):
         """Identify all turn-based kinematics."""
         logger.info(f'Identifying key points of larger acceleration.')
-        highG_els = zeroCrossingIdxsGTThInsideRanges(self.g_force.d_mG_lpf_dt, D_MG_LPF_DT_TH, self.downhill_idxs)
+        highG_els = zeroCrossingIdxsGTThInsideRanges(self.g_force.d_mG_lpf_dt, D_MG_LPF_DT_TH, self.downhill_index)
 
         logger.info(f'Computing the associated turning kinematics based on large accelerations.')
-        self.turns = [
-            Turn(highG_els[idx], self.alt_lpf, self.g_force, self.boot_euler, self.d_boot_euler_dt)
-            for idx in range(highG_els.shape[0])
-        ]
+        self.turn_table = TurnDetector(
+            highG_els,
+            self.alt_lpf,
+            self.g_force,
+            self.boot_euler,
+            self.d_boot_euler_dt,
+            self.time,
+        ).table
 
 
     @property
@@ -202,6 +297,35 @@ class Tile:
     @time.setter
     def time(self, time):
         self.__time = time
+        self.__time_index = None
+
+
+    @property
+    def time_index(self) -> TimeIndex:
+        """Timestamp to sample index lookup on the 100Hz clock, rebuilt whenever `time` is set."""
+        if self.__time_index is None:
+            self.__time_index = TimeIndex(self.time, fs=100, gap_idxs=self.gaps['idx'])
+        return self.__time_index
+
+
+    @property
+    def alt_filter(self) -> FilterBank | None:
+        """Stateful lowpass of the streamed altitude, `None` when filtered at once."""
+        return self.__alt_filter
+
+    @alt_filter.setter
+    def alt_filter(self, alt_filter):
+        self.__alt_filter = alt_filter
+
+
+    @property
+    def gaps(self) -> np.ndarray:
+        """Timestamp gaps & rollovers of the raw tile, `TILE_GAP_DTYPE` records. [Gx1]"""
+        return self.__gaps
+
+    @gaps.setter
+    def gaps(self, gaps):
+        self.__gaps = gaps
 
 
     @property
@@ -259,6 +383,16 @@ class Tile:
         self.__gyro_v = gyro_v
 
 
+    @property
+    def gyro_v_stats(self) -> RangeStats:
+        """Range statistics of `gyro_v`, shared by the jump identification & export."""
+        return self.__gyro_v_stats
+
+    @gyro_v_stats.setter
+    def gyro_v_stats(self, gyro_v_stats):
+        self.__gyro_v_stats = gyro_v_stats
+
+
     @property
     def imu(self) -> IMU:
         """6/9dof based orientation, default 6dof unless overriden via `init(prefer_9dof)`. Euler: [Nx3], Quat: [Nx4]"""
@@ -298,6 +432,16 @@ class Tile:
         self.__downhill_idxs = downhill_idxs
         
 
+    @property
+    def downhill_index(self) -> IntervalIndex:
+        """Interval index of `downhill_idxs`, built once for the jump & turn candidate filtering."""
+        return self.__downhill_index
+    
+    @downhill_index.setter
+    def downhill_index(self, downhill_index):
+        self.__downhill_index = downhill_index
+        
+
     @property
     def lift_idxs(self) -> np.ndarray:
         return self.__lift_idxs
@@ -327,12 +471,21 @@ class Tile:
 
     @property
     def jumps(self) -> list[Jump]:
-        """Jumps identified from kinematic analysis, includes analytics inside the internal `Jump` objects."""
-        return self.__jumps
-    
-    @jumps.setter
-    def jumps(self, jumps):
-        self.__jumps = jumps
+        """Jumps identified from kinematic analysis, a `Jump` view per row of the `jump_table`."""
+        return [
+            Jump(self.jump_table, idx, self.g_force, self.gyro_v, self.gyro_v_stats)
+            for idx in range(len(self.jump_table))
+        ]
+
+
+    @property
+    def jump_table(self) -> JumpTable:
+        """Columnar table of the identified jumps, for vectorized filtering, sorting & exporting."""
+        return self.__jump_table
+
+    @jump_table.setter
+    def jump_table(self, jump_table):
+        self.__jump_table = jump_table
 
 
     @property
@@ -381,10 +534,18 @@ class Tile:
 
     @property
     def turns(self) -> list[Turn]:
-        """Turns identified from kinematic analysis, includes analytics inside the internal `Turn` objects."""
-        return self.__turns
-    
-    @turns.setter
-    def turns(self, turns):
-        self.__turns = turns
+        """Turns identified from kinematic analysis, a `Turn` view per row of the `turn_table`."""
+        return [
+            Turn(self.turn_table, idx, self.alt_lpf, self.g_force, self.boot_euler, self.d_boot_euler_dt)
+            for idx in range(len(self.turn_table))
+        ]
+
+
+    @property
+    def turn_table(self) -> TurnTable:
+        """Columnar table of the identified turns, for vectorized filtering, sorting & exporting."""
+        return self.__turn_table
 
+    @turn_table.setter
+    def turn_table(self, turn_table):
+        self.__turn_table = turn_table
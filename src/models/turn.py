@@ -1,163 +1,335 @@
 import numpy as np
 from constants.ski_th import SKI_SIDECUT_R
 from domain.evaluated_kinematics import EvaluatedKinematics
+from domain.event_tables import TurnTable
 from domain.g_force import GForce
 from domain.session_logger import SessionLogger as logger
-from utilities.quat import quatToEuler
-from utilities.sig_proc_np import deriv, zeroCrossingIdxs
+from utilities.range_stats import RangeStats
+from utilities.sig_proc_np import lastZeroCrossingIdxs
 from utilities.stat_tests import StatTests as ST
 
-class Turn(EvaluatedKinematics):
+class TurnDetector(EvaluatedKinematics):
+    """
+    Identifies every turn of the high G indices at once, each step writes its column(s) straight
+    into the `TurnTable`, one row per turn.
+
+    The per turn `offset_abs_roll` signals are stored back to back in a single signal, turn `k`
+    spans `offset_abs_roll[offset_range[k, 0]:offset_range[k, 1]]`.
+    """
     def __init__(
             self,
-            highG_idx: int,
+            highG_idxs: np.ndarray,
             alt_lpf: np.ndarray,
             g_force: GForce,
             boot_euler: np.ndarray,
             d_boot_euler_dt: np.ndarray,
+            time: np.ndarray,
     ) -> None:
-        super().__init__()
-        
-        self.highG_idx = highG_idx
+        super().__init__(TurnTable.zeros(0))
+
+        self.highG_idxs = np.asarray(highG_idxs, dtype=np.int64)
         self.g_force = g_force
         self.alt_lpf = alt_lpf
         self.roll = boot_euler[:, 0]
         self.d_boot_roll_dt = d_boot_euler_dt[:, 0]
+        self.time = time
 
         self.identify()
 
 
+    def gatherRanges(self, x: np.ndarray, start: np.ndarray, end: np.ndarray):
+        """Samples of `x[start:end]` of every turn back to back, with the row of each sample & the
+        offset of every turn in the gathered samples.
+        """
+        n = np.maximum(end - start, 0)
+        offsets = np.cumsum(n) - n
+        rows = np.repeat(np.arange(n.shape[0]), n)
+        return x[np.arange(rows.shape[0]) - offsets[rows] + start[rows]], rows, offsets
+
+
     def identifyIdxs(self):
         """Identifies various indices that represent important turning kinematics.
-        
+
         - turn baseline idx based on the most recent derivative zero crossing with a positive slope.
         - max roll idx between baseline roll and high G indices
+
+        High G indices without a zero crossing or a roll above/below the mean before them are dropped.
         """
         logger.debug('Identifying key indices in accleration and boot roll.')
+        highG_idx = self.highG_idxs
 
-        self.baseline_idx_1 = np.max(zeroCrossingIdxs(self.g_force.d_mG_lpf_dt[:self.highG_idx - 1]))
-        self.baseline_idx_2 = np.max(zeroCrossingIdxs(self.g_force.d2_mG_lpf_dt2[:self.baseline_idx_1 - 1]))
-        self.baseline_idx_3 = round((self.baseline_idx_1 + self.baseline_idx_2) * 0.5)
-
-        self.peak_roll_idx = np.max(zeroCrossingIdxs(self.d_boot_roll_dt[:self.highG_idx - 1]))
-        self.past_peak_roll_idx = np.max(zeroCrossingIdxs(self.d_boot_roll_dt[:self.peak_roll_idx - 1]))
+        baseline_idx_1 = lastZeroCrossingIdxs(self.g_force.d_mG_lpf_dt, highG_idx - 1)
+        baseline_idx_2 = lastZeroCrossingIdxs(self.g_force.d2_mG_lpf_dt2, baseline_idx_1 - 1)
+        peak_roll_idx = lastZeroCrossingIdxs(self.d_boot_roll_dt, highG_idx - 1)
+        past_peak_roll_idx = lastZeroCrossingIdxs(self.d_boot_roll_dt, peak_roll_idx - 1)
 
-        self.baseline_idx_4 = round((self.peak_roll_idx + self.past_peak_roll_idx) * 0.5)
+        # first roll above (right turn, past pk < pk) or below (left turn) the mean roll from past pk to pk
+        rolls, rows, offsets = self.gatherRanges(self.roll, past_peak_roll_idx, peak_roll_idx)
+        counts = np.maximum(peak_roll_idx - past_peak_roll_idx, 0)
+        sums = np.add.reduceat(rolls, offsets[counts > 0]) if rolls.shape[0] else np.empty(0)
+        mean_roll = np.full(highG_idx.shape[0], np.nan)
+        mean_roll[counts > 0] = sums / counts[counts > 0]
+        right_turn = self.roll[past_peak_roll_idx] < self.roll[peak_roll_idx]
+        past_mean = np.where(right_turn[rows], rolls > mean_roll[rows], rolls < mean_roll[rows])
+        first_past_mean = np.full(highG_idx.shape[0], -1)
+        if rolls.shape[0]:
+            hits = np.minimum.reduceat(np.where(past_mean, np.arange(rows.shape[0]) - offsets[rows], rolls.shape[0]), offsets[counts > 0])
+            first_past_mean[counts > 0] = np.where(hits < rolls.shape[0], hits, -1)
 
-        mean_roll = np.mean(self.roll[self.past_peak_roll_idx:self.peak_roll_idx])
-        
-        # if a right turn (past pk < pk)
-        if self.roll[self.past_peak_roll_idx] < self.roll[self.peak_roll_idx]:
-            idxs_above_mean = np.argwhere(
-                self.roll[self.past_peak_roll_idx:self.peak_roll_idx] > mean_roll
-            )
-        # else a left turn (past pk > pk)
-        else:
-            idxs_above_mean = np.argwhere(
-                self.roll[self.past_peak_roll_idx:self.peak_roll_idx] < mean_roll
-            )
+        valid = (baseline_idx_1 >= 0) & (baseline_idx_2 >= 0) & (peak_roll_idx >= 0) & (past_peak_roll_idx >= 0) & (first_past_mean >= 0)
+        if not np.all(valid):
+            logger.debug(f'Dropped {np.sum(~valid)} high G indices without turning kinematics.')
 
-        self.baseline_idx_5 = self.past_peak_roll_idx + np.min(idxs_above_mean)
+        self.table = TurnTable.zeros(int(np.sum(valid)))
+        data = self.table.data
+        data['highG_idx'] = highG_idx[valid]
+        data['time'] = self.time[data['highG_idx']]
+        data['baseline_idx_1'] = baseline_idx_1[valid]
+        data['baseline_idx_2'] = baseline_idx_2[valid]
+        data['baseline_idx_3'] = np.round((data['baseline_idx_1'] + data['baseline_idx_2']) * 0.5)
+        data['peak_roll_idx'] = peak_roll_idx[valid]
+        data['past_peak_roll_idx'] = past_peak_roll_idx[valid]
+        data['baseline_idx_4'] = np.round((data['peak_roll_idx'] + data['past_peak_roll_idx']) * 0.5)
+        data['baseline_idx_5'] = data['past_peak_roll_idx'] + first_past_mean[valid]
 
         # baseline_flex = self.boot_euler[self.baseline_idx, 1]
 
-        self.turn_range = [self.baseline_idx_1, self.highG_idx]
-        self.baseline_range = [self.baseline_idx_2, self.baseline_idx_1]
-        self.min_radius_range = [self.peak_roll_idx, self.highG_idx]
-        self.offset_abs_roll = np.absolute(self.roll[self.baseline_idx_1:self.highG_idx] + self.roll[self.baseline_idx_1])
+        roll, rows, offsets = self.gatherRanges(self.roll, data['baseline_idx_1'], data['highG_idx'])
+        self.offset_abs_roll = np.absolute(roll + self.roll[data['baseline_idx_1']][rows])
+        self.offset_range = np.stack([offsets, offsets + np.maximum(data['highG_idx'] - data['baseline_idx_1'], 0)], axis=1)
+        self.offset_abs_roll_stats = RangeStats(self.offset_abs_roll)
         # self.heading_change = abs(self.boot_euler[self.highG_idx, 2] - self.boot_euler[self.baseline_idx_1, 2])
 
 
+    def offsetRanges(self, r) -> np.ndarray:
+        """The range `r` inside every turn's `offset_abs_roll` (python slice rules), as ranges of the
+        back to back signal. [Kx2]
+        """
+        r = np.asarray(r, dtype=np.int64).reshape(-1, 2)
+        start, end = self.offset_range[:, 0], self.offset_range[:, 1]
+        L = end - start
+        local_start = np.clip(np.where(r[:, 0] < 0, r[:, 0] + L, r[:, 0]), 0, L)
+        local_end = np.clip(np.where(r[:, 1] < 0, r[:, 1] + L, r[:, 1]), 0, L)
+        return np.stack([start + local_start, start + np.maximum(local_end, local_start)], axis=1)
+
+
     def identifySide(self):
         """Identifies the turning side (uphill/downhill) based on the sign of the roll
         """
-        self.side = 'D' if self.roll[self.baseline_idx_1] < self.roll[self.peak_roll_idx] else 'U'
+        data = self.table.data
+        data['side'] = np.where(self.roll[data['baseline_idx_1']] < self.roll[data['peak_roll_idx']], 'D', 'U')
 
 
     def computeCarvingAngle(self):
         """Using the baseline angle, compute the carving angle in the boot frame."""
         logger.debug('Computing the carving angle based on the identified indices.')
+        data = self.table.data
 
         def maxCarveFromBaseline(baseline_idx):
-            return abs(self.roll[baseline_idx] - self.roll[self.peak_roll_idx])
-        
-        self.carving_angle_1 = maxCarveFromBaseline(self.baseline_idx_1)
-        self.carving_angle_2 = maxCarveFromBaseline(self.baseline_idx_2)
-        self.carving_angle_3 = maxCarveFromBaseline(self.baseline_idx_3)
-        self.carving_angle_4 = maxCarveFromBaseline(self.baseline_idx_4)
-        self.carving_angle_5 = maxCarveFromBaseline(self.baseline_idx_5)
+            return np.absolute(self.roll[baseline_idx] - self.roll[data['peak_roll_idx']])
 
-        self.turning_radius = SKI_SIDECUT_R * np.cos(np.deg2rad(self.offset_abs_roll))
+        data['carving_angle_1'] = maxCarveFromBaseline(data['baseline_idx_1'])
+        data['carving_angle_2'] = maxCarveFromBaseline(data['baseline_idx_2'])
+        data['carving_angle_3'] = maxCarveFromBaseline(data['baseline_idx_3'])
+        data['carving_angle_4'] = maxCarveFromBaseline(data['baseline_idx_4'])
+        data['carving_angle_5'] = maxCarveFromBaseline(data['baseline_idx_5'])
 
+        turning_radius_stats = RangeStats(SKI_SIDECUT_R * np.cos(np.deg2rad(self.offset_abs_roll)))
+        data['max_offset_abs_roll'] = self.offset_abs_roll_stats.max(self.offset_range)
+        data['min_turning_radius'] = turning_radius_stats.min(self.offset_range)
+
+
+    def testSuite(self) -> list[np.ndarray]:
+        """Run the test suite on every turn. Can toggle individual running here.
 
-    def testSuite(self) -> np.ndarray:
-        """Run the test suite. Can toggle individual running here.
-        
         In the future, can return values and parameters for each test. For ML
         """
         logger.debug('Running test suite.')
-        return np.array([
-            ST.testDecreasingTrend(self.alt_lpf, self.turn_range, header='Test alt_lpf has decreasing trend'),
-            ST.testMinSampleCount(self.turn_range, min_count=35, header='Test for minimum samples count'),
-            ST.testRecentMax(self.offset_abs_roll, th=25, header='Test that the max carving occurs close to the max compression'),
-            ST.testLargestMagnitude(self.offset_abs_roll, th=20, header='Test carve angle > 30deg'),
-            ST.testLargestMagnitude(self.g_force.mG_lpf, self.turn_range, th=1250, header='Test max g-force > 1250mG'),
+        data = self.table.data
+        turn_range = self.table.turn_range
+        return [
+            ST.testDecreasingTrend(self.alt_lpf, turn_range, header='Test alt_lpf has decreasing trend'),
+            ST.testMinSampleCount(turn_range, min_count=35, header='Test for minimum samples count'),
+            ST.testRecentMax(self.offset_abs_roll, self.offsetRanges([0, -1]), th=25, stats=self.offset_abs_roll_stats, header='Test that the max carving occurs close to the max compression'),
+            ST.testLargestMagnitude(self.offset_abs_roll, self.offsetRanges([0, -1]), th=20, stats=self.offset_abs_roll_stats, header='Test carve angle > 30deg'),
+            ST.testLargestMagnitude(self.g_force.mG_lpf, turn_range, th=1250, stats=self.g_force.mG_lpf_stats, header='Test max g-force > 1250mG'),
             ST.testLowerSampleStdDev(
                 self.offset_abs_roll,
-                [self.peak_roll_idx - self.baseline_idx_1, len(self.min_radius_range) - 1],
-                [0, len(self.baseline_range) - 1],
+                self.offsetRanges(np.stack([data['peak_roll_idx'] - data['baseline_idx_1'], np.ones(len(self.table), dtype=np.int64)], axis=1)),
+                self.offsetRanges([0, 1]),
+                stats=self.offset_abs_roll_stats,
                 header='Test roll std dev (min radius < baseline)'
             ),
-            ST.testSmallestMagnitude(self.g_force.mG_lpf, self.turn_range, th=1000, header='Test g-force at baseline < 1000mG'),
-        ])
-    
-    
+            ST.testSmallestMagnitude(self.g_force.mG_lpf, turn_range, th=1000, stats=self.g_force.mG_lpf_stats, header='Test g-force at baseline < 1000mG'),
+        ]
+
+
     def identify(self):
-        """Identifies the complete turning kinematics and runs the test suite, assigning a confidence value
-        based on specific statistical tests.
+        """Identifies the complete turning kinematics of every turn and runs the test suite, assigning
+        a confidence value based on specific statistical tests.
         """
-        logger.debug('New turn identification.')
+        logger.debug(f'Identifying {self.highG_idxs.shape[0]} turns.')
         self.identifyIdxs()
         self.identifySide()
         self.computeCarvingAngle()
         self.test(self.testSuite)
 
 
+class Turn:
+    """
+    View of a single turn, row `idx` of the `TurnTable`, with the signals it was identified from.
+    Every value is read from the table row, ex: `tile.turns[0].carving_angle_1`.
+    """
+    def __init__(
+            self,
+            table: TurnTable,
+            idx: int,
+            alt_lpf: np.ndarray,
+            g_force: GForce,
+            boot_euler: np.ndarray,
+            d_boot_euler_dt: np.ndarray,
+    ) -> None:
+        self.table = table
+        self.idx = idx
+        self.g_force = g_force
+        self.alt_lpf = alt_lpf
+        self.roll = boot_euler[:, 0]
+        self.d_boot_roll_dt = d_boot_euler_dt[:, 0]
+
+
+    @property
+    def row(self) -> np.void:
+        """Record of the turn in the `TurnTable`."""
+        return self.table.data[self.idx]
+
+
     @property
     def highG_idx(self) -> int:
         """Index of high G at max compression in turn."""
-        return self.__highG_idx
-
-    @highG_idx.setter
-    def highG_idx(self, highG_idx):
-        self.__highG_idx = highG_idx
+        return self.row['highG_idx']
 
 
     @property
     def baseline_idx_1(self) -> int:
         """Index of baseline before turn start."""
-        return self.__baseline_idx
+        return self.row['baseline_idx_1']
 
-    @baseline_idx_1.setter
-    def baseline_idx_1(self, baseline_idx):
-        self.__baseline_idx = baseline_idx
+
+    @property
+    def baseline_idx_2(self) -> int:
+        """Index of the baseline before `baseline_idx_1`, from the second derivative of `mG_lpf`."""
+        return self.row['baseline_idx_2']
+
+
+    @property
+    def baseline_idx_3(self) -> int:
+        """Index halfway between `baseline_idx_1` & `baseline_idx_2`."""
+        return self.row['baseline_idx_3']
+
+
+    @property
+    def baseline_idx_4(self) -> int:
+        """Index halfway between `past_peak_roll_idx` & `peak_roll_idx`."""
+        return self.row['baseline_idx_4']
+
+
+    @property
+    def baseline_idx_5(self) -> int:
+        """Index of the first roll past the mean roll between the roll peaks."""
+        return self.row['baseline_idx_5']
 
 
     @property
     def peak_roll_idx(self) -> int:
         """Index of max_roll before turn start."""
-        return self.__peak_roll_idx
+        return self.row['peak_roll_idx']
+
 
-    @peak_roll_idx.setter
-    def peak_roll_idx(self, peak_roll_idx):
-        self.__peak_roll_idx = peak_roll_idx
+    @property
+    def past_peak_roll_idx(self) -> int:
+        """Index of the max roll before `peak_roll_idx`."""
+        return self.row['past_peak_roll_idx']
 
 
     @property
     def side(self) -> str:
         """Side of turn, uphill or downhill (`U`, `D`)."""
-        return self.__side
+        return self.row['side']
+
+
+    @property
+    def turn_range(self) -> list:
+        """Index range from the baseline to the max compression."""
+        return [self.baseline_idx_1, self.highG_idx]
+
+
+    @property
+    def baseline_range(self) -> list:
+        """Index range between the first two baselines."""
+        return [self.baseline_idx_2, self.baseline_idx_1]
+
+
+    @property
+    def min_radius_range(self) -> list:
+        """Index range from the peak roll to the max compression."""
+        return [self.peak_roll_idx, self.highG_idx]
+
+
+    @property
+    def offset_abs_roll(self) -> np.ndarray:
+        """Absolute roll over the turn range, offset by the baseline roll."""
+        return np.absolute(self.roll[self.baseline_idx_1:self.highG_idx] + self.roll[self.baseline_idx_1])
+
+
+    @property
+    def turning_radius(self) -> np.ndarray:
+        """Turning radius of the ski sidecut over the turn range, in `m`."""
+        return SKI_SIDECUT_R * np.cos(np.deg2rad(self.offset_abs_roll))
+
+
+    @property
+    def carving_angle_1(self) -> float:
+        """Carving angle from `baseline_idx_1` to the peak roll, in `°`."""
+        return self.row['carving_angle_1']
 
-    @side.setter
-    def side(self, side):
-        self.__side = side
\ No newline at end of file
+
+    @property
+    def carving_angle_2(self) -> float:
+        """Carving angle from `baseline_idx_2` to the peak roll, in `°`."""
+        return self.row['carving_angle_2']
+
+
+    @property
+    def carving_angle_3(self) -> float:
+        """Carving angle from `baseline_idx_3` to the peak roll, in `°`."""
+        return self.row['carving_angle_3']
+
+
+    @property
+    def carving_angle_4(self) -> float:
+        """Carving angle from `baseline_idx_4` to the peak roll, in `°`."""
+        return self.row['carving_angle_4']
+
+
+    @property
+    def carving_angle_5(self) -> float:
+        """Carving angle from `baseline_idx_5` to the peak roll, in `°`."""
+        return self.row['carving_angle_5']
+
+
+    @property
+    def confidence(self) -> float:
+        """Confidence value, sum of passed tests / total tests."""
+        return self.row['confidence']
+
+
+    @property
+    def tests_passed(self) -> int:
+        """Number of passed tests."""
+        return self.row['tests_passed']
+
+
+    @property
+    def total_tests(self) -> int:
+        """Total number of tests."""
+        return self.row['total_tests']
@@ -0,0 +1,40 @@
+import numpy as np
+
+
+class AppendBuffer:
+    """
+    Signal growing block by block along axis 0, ex: while a recording is streamed. The capacity
+    doubles whenever it's full, so appending a block costs amortized O(block) instead of the O(N)
+    copy of `np.concatenate`.
+    """
+    def __init__(self, x: np.ndarray) -> None:
+        x = np.asarray(x)
+        self.__buffer = x.copy()
+        self.__length = x.shape[0]
+
+
+    def __len__(self) -> int:
+        return self.__length
+
+
+    def append(self, block: np.ndarray) -> np.ndarray:
+        """Appends the `block` of samples, returning the view of the whole signal."""
+        block = np.asarray(block)
+        length = self.__length + block.shape[0]
+        if length > self.__buffer.shape[0]:
+            buffer = np.empty(
+                (max(length, 2 * self.__buffer.shape[0]),) + self.__buffer.shape[1:],
+                dtype=np.result_type(self.__buffer, block),
+            )
+            buffer[:self.__length] = self.__buffer[:self.__length]
+            self.__buffer = buffer
+
+        self.__buffer[self.__length:length] = block
+        self.__length = length
+        return self.view
+
+
+    @property
+    def view(self) -> np.ndarray:
+        """View of the samples appended so far, valid until the next `append()` grows the buffer."""
+        return self.__buffer[:self.__length]
@@ -0,0 +1,44 @@
+import fnmatch
+import glob
+import zipfile
+from contextlib import contextmanager
+
+
+ARCHIVE_SEPARATOR = '::'
+"""Separates the archive path & the member name inside it, ex: `10196117595.zip::10196117595_ACTIVITY.fit`."""
+
+
+def splitArchivePath(path: str) -> tuple[str, str | None]:
+    """Splits `archive.zip::member` into the archive path & member name, member is `None` for a plain path."""
+    if ARCHIVE_SEPARATOR not in path:
+        return path, None
+    archive, member = path.split(ARCHIVE_SEPARATOR, 1)
+    return archive, member
+
+
+def globInputs(pattern: str) -> list[str]:
+    """Expands the glob `pattern` into the sorted input paths it matches, the pattern can also
+    match the members of an archive, ex: `log.zip::SENS*.CSV`.
+    """
+    archive, member = splitArchivePath(pattern)
+    if member is None:
+        return sorted(glob.glob(pattern))
+
+    with zipfile.ZipFile(archive) as z:
+        return [f'{archive}{ARCHIVE_SEPARATOR}{name}' for name in sorted(fnmatch.filter(z.namelist(), member))]
+
+
+@contextmanager
+def openInput(path: str):
+    """Opens the input file in binary mode, either a plain path or an `archive.zip::member` path.
+
+    Archive members are decompressed as a stream while being read, nothing is extracted to disk.
+    """
+    archive, member = splitArchivePath(path)
+    if member is None:
+        with open(archive, 'rb') as f:
+            yield f
+        return
+
+    with zipfile.ZipFile(archive) as z, z.open(member) as f:
+        yield f
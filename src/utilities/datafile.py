@@ -6,7 +6,7 @@ from models.tile import Tile
 from models.jump import Jump
 from models.turn import Turn
 from utilities.quat import quatToEuler
-from utilities.sig_proc import mean, std
+from utilities.range_stats import RangeStats
 from utilities.sig_proc_np import maxIndex, minIndex
 
 
@@ -117,24 +117,54 @@ def createTurnDataFile(name):
     return createDataFile(name=name, subdir='turn', header=TURN_HEADER)
 
 
-def constructJumpLine(jump: Jump):
-    """Constructs the (lengthy) data row based on the jump."""
+def jumpRangeStats(tile: Tile) -> dict[str, RangeStats]:
+    """Range statistics of the signals exported for every jump of the `tile`, built once."""
+    return {
+        'mG_lpf': tile.g_force.mG_lpf_stats,
+        'mG': tile.g_force.mG_stats,
+        'gyro': tile.gyro_v_stats,
+    }
+
+
+def turnRangeStats(tile: Tile) -> dict[str, RangeStats]:
+    """Range statistics of the signals exported for every turn of the `tile`, built once."""
+    return {
+        'mG_lpf': tile.g_force.mG_lpf_stats,
+        'd_boot_roll_dt': RangeStats(tile.d_boot_euler_dt[:, 0]),
+        'alt_lpf': RangeStats(tile.alt_lpf),
+    }
+
+
+def rangeStatsFields(x: np.ndarray, r, stats: RangeStats = None) -> str:
+    """The `min,max,mean,std` data fields of `x` in the range `r`, or `x[r[0]]` for all of them if the range is empty.
+
+    Pass the precomputed `stats` of long signals, short ones are sliced directly.
+    """
+    if r[0] == r[1]:
+        return ','.join([f'{x[r[0]]}'] * 4)
+    if stats is None:
+        window = x[r[0]:r[1]]
+        if window.shape[0] == 0:
+            return ','.join(['nan'] * 4)
+        return f'{np.min(window)},{np.max(window)},{np.mean(window)},{np.std(window)}'
+    return f'{stats.min(r)},{stats.max(r)},{stats.mean(r)},{stats.std(r)}'
+
+
+def constructJumpLine(jump: Jump, stats: dict[str, RangeStats]):
+    """Constructs the (lengthy) data row based on the jump.
+    
+    `stats` are the `jumpRangeStats()` of the Tile, built once for all the jumps.
+    """
+    full_range = [0, len(jump.mG_lpf)]
+    full_jump_range = [jump.air_range[0], jump.landing_range[1]]
+
     line = f'{JUMP_THRESHOLD_MG},'
     line += f'{jump.lowG_range[0]},'
     line += f'{jump.lowG_range[1]},'
     line += f'{jump.lowG_range[1] - jump.lowG_range[0]},'
-    line += f'{jump.mG_lpf[jump.lowG_range[0]] if jump.lowG_range[0] == jump.lowG_range[1] else min(jump.mG_lpf[jump.lowG_range[0]:jump.lowG_range[1]])},'
-    line += f'{jump.mG_lpf[jump.lowG_range[0]] if jump.lowG_range[0] == jump.lowG_range[1] else max(jump.mG_lpf[jump.lowG_range[0]:jump.lowG_range[1]])},'
-    line += f'{jump.mG_lpf[jump.lowG_range[0]] if jump.lowG_range[0] == jump.lowG_range[1] else mean(jump.mG_lpf[jump.lowG_range[0]:jump.lowG_range[1]])},'
-    line += f'{jump.mG_lpf[jump.lowG_range[0]] if jump.lowG_range[0] == jump.lowG_range[1] else std(jump.mG_lpf[jump.lowG_range[0]:jump.lowG_range[1]])},'
-    line += f'{jump.mG[jump.lowG_range[0]] if jump.lowG_range[0] == jump.lowG_range[1] else min(jump.mG[jump.lowG_range[0]:jump.lowG_range[1]])},'
-    line += f'{jump.mG[jump.lowG_range[0]] if jump.lowG_range[0] == jump.lowG_range[1] else max(jump.mG[jump.lowG_range[0]:jump.lowG_range[1]])},'
-    line += f'{jump.mG[jump.lowG_range[0]] if jump.lowG_range[0] == jump.lowG_range[1] else mean(jump.mG[jump.lowG_range[0]:jump.lowG_range[1]])},'
-    line += f'{jump.mG[jump.lowG_range[0]] if jump.lowG_range[0] == jump.lowG_range[1] else std(jump.mG[jump.lowG_range[0]:jump.lowG_range[1]])},'
-    line += f'{jump.gyro[jump.lowG_range[0]] if jump.lowG_range[0] == jump.lowG_range[1] else min(jump.gyro[jump.lowG_range[0]:jump.lowG_range[1]])},'
-    line += f'{jump.gyro[jump.lowG_range[0]] if jump.lowG_range[0] == jump.lowG_range[1] else max(jump.gyro[jump.lowG_range[0]:jump.lowG_range[1]])},'
-    line += f'{jump.gyro[jump.lowG_range[0]] if jump.lowG_range[0] == jump.lowG_range[1] else mean(jump.gyro[jump.lowG_range[0]:jump.lowG_range[1]])},'
-    line += f'{jump.gyro[jump.lowG_range[0]] if jump.lowG_range[0] == jump.lowG_range[1] else std(jump.gyro[jump.lowG_range[0]:jump.lowG_range[1]])},'
+    line += f'{rangeStatsFields(jump.mG_lpf, jump.lowG_range, stats["mG_lpf"])},'
+    line += f'{rangeStatsFields(jump.mG, jump.lowG_range, stats["mG"])},'
+    line += f'{rangeStatsFields(jump.gyro, jump.lowG_range, stats["gyro"])},'
     line += f'{jump.min_idx},'
     line += f'{jump.mG_lpf[jump.min_idx]},'
     line += f'{jump.mG[jump.min_idx]},'
@@ -142,18 +172,9 @@ def constructJumpLine(jump: Jump):
     line += f'{jump.air_range[0]},'
     line += f'{jump.air_range[1]},'
     line += f'{jump.air_range[1] - jump.air_range[0]},'
-    line += f'{jump.mG_lpf[jump.air_range[0]] if jump.air_range[0] == jump.air_range[1] else min(jump.mG_lpf[jump.air_range[0]:jump.air_range[1]])},'
-    line += f'{jump.mG_lpf[jump.air_range[0]] if jump.air_range[0] == jump.air_range[1] else max(jump.mG_lpf[jump.air_range[0]:jump.air_range[1]])},'
-    line += f'{jump.mG_lpf[jump.air_range[0]] if jump.air_range[0] == jump.air_range[1] else mean(jump.mG_lpf[jump.air_range[0]:jump.air_range[1]])},'
-    line += f'{jump.mG_lpf[jump.air_range[0]] if jump.air_range[0] == jump.air_range[1] else std(jump.mG_lpf[jump.air_range[0]:jump.air_range[1]])},'
-    line += f'{jump.mG[jump.air_range[0]] if jump.air_range[0] == jump.air_range[1] else min(jump.mG[jump.air_range[0]:jump.air_range[1]])},'
-    line += f'{jump.mG[jump.air_range[0]] if jump.air_range[0] == jump.air_range[1] else max(jump.mG[jump.air_range[0]:jump.air_range[1]])},'
-    line += f'{jump.mG[jump.air_range[0]] if jump.air_range[0] == jump.air_range[1] else mean(jump.mG[jump.air_range[0]:jump.air_range[1]])},'
-    line += f'{jump.mG[jump.air_range[0]] if jump.air_range[0] == jump.air_range[1] else std(jump.mG[jump.air_range[0]:jump.air_range[1]])},'
-    line += f'{jump.gyro[jump.air_range[0]] if jump.air_range[0] == jump.air_range[1] else min(jump.gyro[jump.air_range[0]:jump.air_range[1]])},'
-    line += f'{jump.gyro[jump.air_range[0]] if jump.air_range[0] == jump.air_range[1] else max(jump.gyro[jump.air_range[0]:jump.air_range[1]])},'
-    line += f'{jump.gyro[jump.air_range[0]] if jump.air_range[0] == jump.air_range[1] else mean(jump.gyro[jump.air_range[0]:jump.air_range[1]])},'
-    line += f'{jump.gyro[jump.air_range[0]] if jump.air_range[0] == jump.air_range[1] else std(jump.gyro[jump.air_range[0]:jump.air_range[1]])},'
+    line += f'{rangeStatsFields(jump.mG_lpf, jump.air_range, stats["mG_lpf"])},'
+    line += f'{rangeStatsFields(jump.mG, jump.air_range, stats["mG"])},'
+    line += f'{rangeStatsFields(jump.gyro, jump.air_range, stats["gyro"])},'
     line += f'{jump.liftoff_idx},'
     line += f'{jump.mG_lpf[jump.liftoff_idx]},'
     line += f'{jump.mG[jump.liftoff_idx]},'
@@ -165,31 +186,13 @@ def constructJumpLine(jump: Jump):
     line += f'{jump.landing_range[0]},'
     line += f'{jump.landing_range[1]},'
     line += f'{jump.landing_range[1] - jump.landing_range[0]},'
-    line += f'{jump.mG_lpf[jump.landing_range[0]] if jump.landing_range[0] == jump.landing_range[1] else min(jump.mG_lpf[jump.landing_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.mG_lpf[jump.landing_range[0]] if jump.landing_range[0] == jump.landing_range[1] else max(jump.mG_lpf[jump.landing_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.mG_lpf[jump.landing_range[0]] if jump.landing_range[0] == jump.landing_range[1] else mean(jump.mG_lpf[jump.landing_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.mG_lpf[jump.landing_range[0]] if jump.landing_range[0] == jump.landing_range[1] else std(jump.mG_lpf[jump.landing_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.mG[jump.landing_range[0]] if jump.landing_range[0] == jump.landing_range[1] else min(jump.mG[jump.landing_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.mG[jump.landing_range[0]] if jump.landing_range[0] == jump.landing_range[1] else max(jump.mG[jump.landing_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.mG[jump.landing_range[0]] if jump.landing_range[0] == jump.landing_range[1] else mean(jump.mG[jump.landing_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.mG[jump.landing_range[0]] if jump.landing_range[0] == jump.landing_range[1] else std(jump.mG[jump.landing_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.gyro[jump.landing_range[0]] if jump.landing_range[0] == jump.landing_range[1] else min(jump.gyro[jump.landing_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.gyro[jump.landing_range[0]] if jump.landing_range[0] == jump.landing_range[1] else max(jump.gyro[jump.landing_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.gyro[jump.landing_range[0]] if jump.landing_range[0] == jump.landing_range[1] else mean(jump.gyro[jump.landing_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.gyro[jump.landing_range[0]] if jump.landing_range[0] == jump.landing_range[1] else std(jump.gyro[jump.landing_range[0]:jump.landing_range[1]])},'
+    line += f'{rangeStatsFields(jump.mG_lpf, jump.landing_range, stats["mG_lpf"])},'
+    line += f'{rangeStatsFields(jump.mG, jump.landing_range, stats["mG"])},'
+    line += f'{rangeStatsFields(jump.gyro, jump.landing_range, stats["gyro"])},'
     line += f'{jump.landing_range[1] - jump.air_range[0]},'
-    line += f'{jump.mG_lpf[jump.air_range[0]] if jump.air_range[0] == jump.landing_range[1] else min(jump.mG_lpf[jump.air_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.mG_lpf[jump.air_range[0]] if jump.air_range[0] == jump.landing_range[1] else max(jump.mG_lpf[jump.air_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.mG_lpf[jump.air_range[0]] if jump.air_range[0] == jump.landing_range[1] else mean(jump.mG_lpf[jump.air_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.mG_lpf[jump.air_range[0]] if jump.air_range[0] == jump.landing_range[1] else std(jump.mG_lpf[jump.air_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.mG[jump.air_range[0]] if jump.air_range[0] == jump.landing_range[1] else min(jump.mG[jump.air_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.mG[jump.air_range[0]] if jump.air_range[0] == jump.landing_range[1] else max(jump.mG[jump.air_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.mG[jump.air_range[0]] if jump.air_range[0] == jump.landing_range[1] else mean(jump.mG[jump.air_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.mG[jump.air_range[0]] if jump.air_range[0] == jump.landing_range[1] else std(jump.mG[jump.air_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.gyro[jump.air_range[0]] if jump.air_range[0] == jump.landing_range[1] else min(jump.gyro[jump.air_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.gyro[jump.air_range[0]] if jump.air_range[0] == jump.landing_range[1] else max(jump.gyro[jump.air_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.gyro[jump.air_range[0]] if jump.air_range[0] == jump.landing_range[1] else mean(jump.gyro[jump.air_range[0]:jump.landing_range[1]])},'
-    line += f'{jump.gyro[jump.air_range[0]] if jump.air_range[0] == jump.landing_range[1] else std(jump.gyro[jump.air_range[0]:jump.landing_range[1]])},'
+    line += f'{rangeStatsFields(jump.mG_lpf, full_jump_range, stats["mG_lpf"])},'
+    line += f'{rangeStatsFields(jump.mG, full_jump_range, stats["mG"])},'
+    line += f'{rangeStatsFields(jump.gyro, full_jump_range, stats["gyro"])},'
     line += f'{jump.impulse_idx},'
     line += f'{jump.mG_lpf[jump.impulse_idx]},'
     line += f'{jump.mG[jump.impulse_idx]},'
@@ -199,25 +202,20 @@ def constructJumpLine(jump: Jump):
     line += f'{jump.total_tests},'
     line += f'{jump.confidence},'
     line += f'{len(jump.mG_lpf)},'
-    line += f'{min(jump.mG_lpf)},'
-    line += f'{max(jump.mG_lpf)},'
-    line += f'{mean(jump.mG_lpf)},'
-    line += f'{std(jump.mG_lpf)},'
-    line += f'{min(jump.mG)},'
-    line += f'{max(jump.mG)},'
-    line += f'{mean(jump.mG)},'
-    line += f'{std(jump.mG)},'
-    line += f'{min(jump.gyro)},'
-    line += f'{max(jump.gyro)},'
-    line += f'{mean(jump.gyro)},'
-    line += f'{std(jump.gyro)}'
+    line += f'{rangeStatsFields(jump.mG_lpf, full_range, stats["mG_lpf"])},'
+    line += f'{rangeStatsFields(jump.mG, full_range, stats["mG"])},'
+    line += f'{rangeStatsFields(jump.gyro, full_range, stats["gyro"])}'
     line += '\n'
 
     return line
 
 
-def constructTurnLine(turn: Turn):
-    """Constructs the (lengthy) data row based on the turn."""
+def constructTurnLine(turn: Turn, stats: dict[str, RangeStats]):
+    """Constructs the (lengthy) data row based on the turn.
+    
+    `stats` are the `turnRangeStats()` of the Tile, built once for all the turns.
+    """
+    offset_abs_roll = turn.offset_abs_roll
     shifted_turn_range = [0, len(turn.turn_range) - 1]
     shifted_baseline_range = [0, len(turn.baseline_range) - 1]
     shifted_min_radius_range = [0, len(turn.min_radius_range) - 1]
@@ -243,65 +241,29 @@ def constructTurnLine(turn: Turn):
     line += f'{turn.min_radius_range[1] - turn.min_radius_range[0]},'
     line += f'{turn.g_force.mG_lpf[turn.highG_idx]},'
     line += f'{turn.d_boot_roll_dt[turn.highG_idx]},'
-    line += f'{turn.offset_abs_roll[-1]},'
-    line += f'{turn.g_force.mG_lpf[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else min(turn.g_force.mG_lpf[turn.turn_range[0]:turn.turn_range[1]])},'
-    line += f'{turn.g_force.mG_lpf[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else max(turn.g_force.mG_lpf[turn.turn_range[0]:turn.turn_range[1]])},'
-    line += f'{turn.g_force.mG_lpf[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else mean(turn.g_force.mG_lpf[turn.turn_range[0]:turn.turn_range[1]])},'
-    line += f'{turn.g_force.mG_lpf[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else std(turn.g_force.mG_lpf[turn.turn_range[0]:turn.turn_range[1]])},'
-    line += f'{turn.g_force.mG_lpf[turn.baseline_range[0]] if turn.baseline_range[0] == turn.baseline_range[1] else min(turn.g_force.mG_lpf[turn.baseline_range[0]:turn.baseline_range[1]])},'
-    line += f'{turn.g_force.mG_lpf[turn.baseline_range[0]] if turn.baseline_range[0] == turn.baseline_range[1] else max(turn.g_force.mG_lpf[turn.baseline_range[0]:turn.baseline_range[1]])},'
-    line += f'{turn.g_force.mG_lpf[turn.baseline_range[0]] if turn.baseline_range[0] == turn.baseline_range[1] else mean(turn.g_force.mG_lpf[turn.baseline_range[0]:turn.baseline_range[1]])},'
-    line += f'{turn.g_force.mG_lpf[turn.baseline_range[0]] if turn.baseline_range[0] == turn.baseline_range[1] else std(turn.g_force.mG_lpf[turn.baseline_range[0]:turn.baseline_range[1]])},'
-    line += f'{turn.g_force.mG_lpf[turn.min_radius_range[0]] if turn.min_radius_range[0] == turn.min_radius_range[1] else min(turn.g_force.mG_lpf[turn.min_radius_range[0]:turn.min_radius_range[1]])},'
-    line += f'{turn.g_force.mG_lpf[turn.min_radius_range[0]] if turn.min_radius_range[0] == turn.min_radius_range[1] else max(turn.g_force.mG_lpf[turn.min_radius_range[0]:turn.min_radius_range[1]])},'
-    line += f'{turn.g_force.mG_lpf[turn.min_radius_range[0]] if turn.min_radius_range[0] == turn.min_radius_range[1] else mean(turn.g_force.mG_lpf[turn.min_radius_range[0]:turn.min_radius_range[1]])},'
-    line += f'{turn.g_force.mG_lpf[turn.min_radius_range[0]] if turn.min_radius_range[0] == turn.min_radius_range[1] else std(turn.g_force.mG_lpf[turn.min_radius_range[0]:turn.min_radius_range[1]])},'
-    line += f'{turn.offset_abs_roll[shifted_turn_range[0]] if shifted_turn_range[0] == shifted_turn_range[1] else min(turn.offset_abs_roll[shifted_turn_range[0]:shifted_turn_range[1]])},'
-    line += f'{turn.offset_abs_roll[shifted_turn_range[0]] if shifted_turn_range[0] == shifted_turn_range[1] else max(turn.offset_abs_roll[shifted_turn_range[0]:shifted_turn_range[1]])},'
-    line += f'{turn.offset_abs_roll[shifted_turn_range[0]] if shifted_turn_range[0] == shifted_turn_range[1] else mean(turn.offset_abs_roll[shifted_turn_range[0]:shifted_turn_range[1]])},'
-    line += f'{turn.offset_abs_roll[shifted_turn_range[0]] if shifted_turn_range[0] == shifted_turn_range[1] else std(turn.offset_abs_roll[shifted_turn_range[0]:shifted_turn_range[1]])},'
-    line += f'{turn.offset_abs_roll[shifted_baseline_range[0]] if shifted_baseline_range[0] == shifted_baseline_range[1] else min(turn.offset_abs_roll[shifted_baseline_range[0]:shifted_baseline_range[1]])},'
-    line += f'{turn.offset_abs_roll[shifted_baseline_range[0]] if shifted_baseline_range[0] == shifted_baseline_range[1] else max(turn.offset_abs_roll[shifted_baseline_range[0]:shifted_baseline_range[1]])},'
-    line += f'{turn.offset_abs_roll[shifted_baseline_range[0]] if shifted_baseline_range[0] == shifted_baseline_range[1] else mean(turn.offset_abs_roll[shifted_baseline_range[0]:shifted_baseline_range[1]])},'
-    line += f'{turn.offset_abs_roll[shifted_baseline_range[0]] if shifted_baseline_range[0] == shifted_baseline_range[1] else std(turn.offset_abs_roll[shifted_baseline_range[0]:shifted_baseline_range[1]])},'
-    line += f'{turn.offset_abs_roll[shifted_min_radius_range[0]] if shifted_min_radius_range[0] == shifted_min_radius_range[1] else min(turn.offset_abs_roll[shifted_min_radius_range[0]:shifted_min_radius_range[1]])},'
-    line += f'{turn.offset_abs_roll[shifted_min_radius_range[0]] if shifted_min_radius_range[0] == shifted_min_radius_range[1] else max(turn.offset_abs_roll[shifted_min_radius_range[0]:shifted_min_radius_range[1]])},'
-    line += f'{turn.offset_abs_roll[shifted_min_radius_range[0]] if shifted_min_radius_range[0] == shifted_min_radius_range[1] else mean(turn.offset_abs_roll[shifted_min_radius_range[0]:shifted_min_radius_range[1]])},'
-    line += f'{turn.offset_abs_roll[shifted_min_radius_range[0]] if shifted_min_radius_range[0] == shifted_min_radius_range[1] else std(turn.offset_abs_roll[shifted_min_radius_range[0]:shifted_min_radius_range[1]])},'
-    line += f'{turn.d_boot_roll_dt[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else min(turn.d_boot_roll_dt[turn.turn_range[0]:turn.turn_range[1]])},'
-    line += f'{turn.d_boot_roll_dt[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else max(turn.d_boot_roll_dt[turn.turn_range[0]:turn.turn_range[1]])},'
-    line += f'{turn.d_boot_roll_dt[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else mean(turn.d_boot_roll_dt[turn.turn_range[0]:turn.turn_range[1]])},'
-    line += f'{turn.d_boot_roll_dt[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else std(turn.d_boot_roll_dt[turn.turn_range[0]:turn.turn_range[1]])},'
-    line += f'{turn.d_boot_roll_dt[turn.baseline_range[0]] if turn.baseline_range[0] == turn.baseline_range[1] else min(turn.d_boot_roll_dt[turn.baseline_range[0]:turn.baseline_range[1]])},'
-    line += f'{turn.d_boot_roll_dt[turn.baseline_range[0]] if turn.baseline_range[0] == turn.baseline_range[1] else max(turn.d_boot_roll_dt[turn.baseline_range[0]:turn.baseline_range[1]])},'
-    line += f'{turn.d_boot_roll_dt[turn.baseline_range[0]] if turn.baseline_range[0] == turn.baseline_range[1] else mean(turn.d_boot_roll_dt[turn.baseline_range[0]:turn.baseline_range[1]])},'
-    line += f'{turn.d_boot_roll_dt[turn.baseline_range[0]] if turn.baseline_range[0] == turn.baseline_range[1] else std(turn.d_boot_roll_dt[turn.baseline_range[0]:turn.baseline_range[1]])},'
-    line += f'{turn.d_boot_roll_dt[turn.min_radius_range[0]] if turn.min_radius_range[0] == turn.min_radius_range[1] else min(turn.d_boot_roll_dt[turn.min_radius_range[0]:turn.min_radius_range[1]])},'
-    line += f'{turn.d_boot_roll_dt[turn.min_radius_range[0]] if turn.min_radius_range[0] == turn.min_radius_range[1] else max(turn.d_boot_roll_dt[turn.min_radius_range[0]:turn.min_radius_range[1]])},'
-    line += f'{turn.d_boot_roll_dt[turn.min_radius_range[0]] if turn.min_radius_range[0] == turn.min_radius_range[1] else mean(turn.d_boot_roll_dt[turn.min_radius_range[0]:turn.min_radius_range[1]])},'
-    line += f'{turn.d_boot_roll_dt[turn.min_radius_range[0]] if turn.min_radius_range[0] == turn.min_radius_range[1] else std(turn.d_boot_roll_dt[turn.min_radius_range[0]:turn.min_radius_range[1]])},'
-    line += f'{turn.alt_lpf[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else min(turn.alt_lpf[turn.turn_range[0]:turn.turn_range[1]])},'
-    line += f'{turn.alt_lpf[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else max(turn.alt_lpf[turn.turn_range[0]:turn.turn_range[1]])},'
-    line += f'{turn.alt_lpf[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else mean(turn.alt_lpf[turn.turn_range[0]:turn.turn_range[1]])},'
-    line += f'{turn.alt_lpf[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else std(turn.alt_lpf[turn.turn_range[0]:turn.turn_range[1]])},'
-    line += f'{turn.alt_lpf[turn.baseline_range[0]] if turn.baseline_range[0] == turn.baseline_range[1] else min(turn.alt_lpf[turn.baseline_range[0]:turn.baseline_range[1]])},'
-    line += f'{turn.alt_lpf[turn.baseline_range[0]] if turn.baseline_range[0] == turn.baseline_range[1] else max(turn.alt_lpf[turn.baseline_range[0]:turn.baseline_range[1]])},'
-    line += f'{turn.alt_lpf[turn.baseline_range[0]] if turn.baseline_range[0] == turn.baseline_range[1] else mean(turn.alt_lpf[turn.baseline_range[0]:turn.baseline_range[1]])},'
-    line += f'{turn.alt_lpf[turn.baseline_range[0]] if turn.baseline_range[0] == turn.baseline_range[1] else std(turn.alt_lpf[turn.baseline_range[0]:turn.baseline_range[1]])},'
-    line += f'{turn.alt_lpf[turn.min_radius_range[0]] if turn.min_radius_range[0] == turn.min_radius_range[1] else min(turn.alt_lpf[turn.min_radius_range[0]:turn.min_radius_range[1]])},'
-    line += f'{turn.alt_lpf[turn.min_radius_range[0]] if turn.min_radius_range[0] == turn.min_radius_range[1] else max(turn.alt_lpf[turn.min_radius_range[0]:turn.min_radius_range[1]])},'
-    line += f'{turn.alt_lpf[turn.min_radius_range[0]] if turn.min_radius_range[0] == turn.min_radius_range[1] else mean(turn.alt_lpf[turn.min_radius_range[0]:turn.min_radius_range[1]])},'
-    line += f'{turn.alt_lpf[turn.min_radius_range[0]] if turn.min_radius_range[0] == turn.min_radius_range[1] else std(turn.alt_lpf[turn.min_radius_range[0]:turn.min_radius_range[1]])},'
+    line += f'{offset_abs_roll[-1]},'
+    line += f'{rangeStatsFields(turn.g_force.mG_lpf, turn.turn_range, stats["mG_lpf"])},'
+    line += f'{rangeStatsFields(turn.g_force.mG_lpf, turn.baseline_range, stats["mG_lpf"])},'
+    line += f'{rangeStatsFields(turn.g_force.mG_lpf, turn.min_radius_range, stats["mG_lpf"])},'
+    line += f'{rangeStatsFields(offset_abs_roll, shifted_turn_range)},'
+    line += f'{rangeStatsFields(offset_abs_roll, shifted_baseline_range)},'
+    line += f'{rangeStatsFields(offset_abs_roll, shifted_min_radius_range)},'
+    line += f'{rangeStatsFields(turn.d_boot_roll_dt, turn.turn_range, stats["d_boot_roll_dt"])},'
+    line += f'{rangeStatsFields(turn.d_boot_roll_dt, turn.baseline_range, stats["d_boot_roll_dt"])},'
+    line += f'{rangeStatsFields(turn.d_boot_roll_dt, turn.min_radius_range, stats["d_boot_roll_dt"])},'
+    line += f'{rangeStatsFields(turn.alt_lpf, turn.turn_range, stats["alt_lpf"])},'
+    line += f'{rangeStatsFields(turn.alt_lpf, turn.baseline_range, stats["alt_lpf"])},'
+    line += f'{rangeStatsFields(turn.alt_lpf, turn.min_radius_range, stats["alt_lpf"])},'
     line += f'{turn.carving_angle_1},'
     line += f'{turn.carving_angle_2},'
     line += f'{turn.carving_angle_3},'
     line += f'{turn.carving_angle_4},'
     line += f'{turn.carving_angle_5},'
     line += f'{turn.g_force.mG_lpf[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else maxIndex(turn.g_force.mG_lpf[turn.turn_range[0]:turn.turn_range[1]]) - turn.baseline_idx_1},'
-    line += f'{maxIndex(turn.offset_abs_roll)},'
+    line += f'{maxIndex(offset_abs_roll)},'
     line += f'{turn.d_boot_roll_dt[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else maxIndex(turn.d_boot_roll_dt[turn.turn_range[0]:turn.turn_range[1]]) - turn.baseline_idx_1},'
     line += f'{turn.g_force.mG_lpf[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else minIndex(turn.g_force.mG_lpf[turn.turn_range[0]:turn.turn_range[1]]) - turn.baseline_idx_1},'
-    line += f'{minIndex(turn.offset_abs_roll)},'
+    line += f'{minIndex(offset_abs_roll)},'
     line += f'{turn.d_boot_roll_dt[turn.turn_range[0]] if turn.turn_range[0] == turn.turn_range[1] else minIndex(turn.d_boot_roll_dt[turn.turn_range[0]:turn.turn_range[1]]) - turn.baseline_idx_1}'
     line += '\n'
 
@@ -313,12 +275,12 @@ def constructSensorBootLines(tile: Tile):
     data_dump = ''
 
     # collect clamped euler data
-    sensor_euler = np.apply_along_axis(quatToEuler, 1, tile.imu.quat)
-    boot_euler = np.apply_along_axis(quatToEuler, 1, tile.boot_quat)
+    sensor_euler = quatToEuler(tile.imu.quat)
+    boot_euler = quatToEuler(tile.boot_quat)
+    offset_eulers = quatToEuler(tile.static_registration.getMostRecentRegistrationQuats(tile.time[:-1]))
 
     for i in range(tile.time.shape[0] - 1):
-        q_offset = tile.static_registration.getMostRecentRegistrationQuat(tile.time[i])
-        offset_euler = quatToEuler(q_offset)
+        offset_euler = offset_eulers[i]
         
         data_dump += f'{tile.time[i]},{tile.alt_lpf[i]},'
         data_dump += f'{sensor_euler[i, 0]},{sensor_euler[i, 1]},{sensor_euler[i, 2]},'
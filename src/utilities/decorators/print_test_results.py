@@ -1,3 +1,4 @@
+import numpy as np
 from domain.session_logger import SessionLogger as logger
 
 
@@ -8,7 +9,7 @@ def printTestResults(func):
 
         result = func(*args, **kwargs)
 
-        logger.debug(f'\t\t{result}')
-        
+        logger.debug(f'\t\t{np.sum(result)}/{np.size(result)} passed' if np.ndim(result) else f'\t\t{result}')
+
         return result
     return wrapper
@@ -0,0 +1,114 @@
+import numpy as np
+from scipy import signal
+
+
+class FilterBank:
+    """
+    Stateful lowpass filter bank, filtering a signal block by block as it's being recorded.
+
+    Keeps the second-order-section state (`zi`) of every channel between blocks, so each block is
+    filtered causally in O(block) time. The first state is the steady state at the first sample
+    (`steadyState()`), so the concatenated output equals `sosfilt` of the whole signal with
+    steady-state initial conditions (`zi=sosfilt_zi(sos) * x[0]`), not a plain `sosfilt` from zero.
+
+    With `lag > 0` it runs a bounded-lag forward-backward mode instead: every forward filtered
+    block is also filtered backward over the last `lag` samples of lookahead, approximating the
+    zero-phase `sosfiltfilt` used by `sig_proc_np.lowpass()`. The output then trails the input by
+    `lag` samples, call `flush()` at the end of the recording for the remaining ones. It only
+    equals `sosfiltfilt` in the interior, once the lookahead is long enough for the backward pass
+    to settle (see `constants.filter_lag`). Near both ends of the signal `sosfiltfilt` pads with
+    odd extensions instead, so the two can differ by a sizable part of the signal's swing there.
+    """
+    def __init__(self, Wn, order=2, lag=0) -> None:
+        self.sos = signal.butter(order, Wn, 'low', output='sos')
+        self.lag = lag
+        self.reset()
+
+
+    def reset(self):
+        """Clears the filter state, the next block starts a new signal."""
+        self.zi = None
+        self.pending = None
+
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """Filters the next `block` of samples along axis 0, [Bx1] or [Bxk] for k channels.
+
+        Returns the filtered block, or the samples that are `lag` behind it in forward-backward mode.
+        """
+        block = np.asarray(block, dtype=float)
+        if block.shape[0] == 0:
+            return block
+        if self.zi is None:
+            # start in steady state at the first sample, instead of ringing up from 0
+            self.zi = self.steadyState(block[0])
+
+        y, self.zi = signal.sosfilt(self.sos, block, axis=0, zi=self.zi)
+        if self.lag == 0:
+            return y
+
+        self.pending = y if self.pending is None else np.concatenate([self.pending, y])
+        return self.backward(self.pending.shape[0] - self.lag)
+
+
+    def flush(self) -> np.ndarray:
+        """Returns the last `lag` samples still held back in forward-backward mode."""
+        if self.pending is None:
+            return np.empty(0)
+        return self.backward(self.pending.shape[0])
+
+
+    def backward(self, n_out) -> np.ndarray:
+        """Backward filters the pending forward output & emits its first `n_out` samples."""
+        n_out = max(n_out, 0)
+        reverse = self.pending[::-1]
+        y, _ = signal.sosfilt(self.sos, reverse, axis=0, zi=self.steadyState(reverse[0]))
+        out = y[::-1][:n_out]
+        self.pending = self.pending[n_out:]
+        return out
+
+
+    def steadyState(self, x0) -> np.ndarray:
+        """Filter state of a constant signal at `x0`, per channel."""
+        zi = signal.sosfilt_zi(self.sos)
+        return zi.reshape(zi.shape + (1,) * np.ndim(x0)) * x0
+
+
+    @property
+    def sos(self) -> np.ndarray:
+        """Second order sections of the butterworth lowpass."""
+        return self.__sos
+
+    @sos.setter
+    def sos(self, sos):
+        self.__sos = sos
+
+
+    @property
+    def zi(self) -> np.ndarray | None:
+        """Forward filter state carried between blocks, `None` before the first block."""
+        return self.__zi
+
+    @zi.setter
+    def zi(self, zi):
+        self.__zi = zi
+
+
+    @property
+    def lag(self) -> int:
+        """Lookahead samples of the forward-backward mode, `0` for causal filtering."""
+        return self.__lag
+
+    @lag.setter
+    def lag(self, lag):
+        self.__lag = lag
+
+
+    @property
+    def pending(self) -> np.ndarray | None:
+        """Forward filtered samples still waiting on lookahead in forward-backward mode."""
+        return self.__pending
+
+    @pending.setter
+    def pending(self, p):
+        self.__pending = p
@@ -0,0 +1,70 @@
+import numpy as np
+
+
+class IntervalIndex:
+    """
+    Sorted index of `[start, end]` index ranges (ex: the downhill runs) answering membership
+    queries for whole candidate arrays with a single `searchsorted`.
+
+    The starts are sorted & the ends are stored as a running max, so the largest end of every
+    range starting before `x` is a single lookup. `x` is strictly inside a range exactly when that
+    end is past `x`, which also holds for overlapping ranges.
+    """
+    def __init__(self, ranges: np.ndarray) -> None:
+        ranges = np.asarray(ranges).reshape(-1, 2)
+        order = np.argsort(ranges[:, 0], kind='stable')
+        self.starts = ranges[order, 0]
+        self.max_ends = np.maximum.accumulate(ranges[order, 1]) if ranges.shape[0] else ranges[order, 1]
+
+
+    def __len__(self) -> int:
+        return self.starts.shape[0]
+
+
+    def maxEndBefore(self, x: np.ndarray) -> np.ndarray:
+        """Largest end of the ranges starting strictly before each `x`, `-inf` if there are none."""
+        x = np.asarray(x)
+        j = np.searchsorted(self.starts, x, side='left') - 1
+        ends = self.max_ends[np.clip(j, 0, None)] if len(self) else np.zeros(x.shape)
+        return np.where(j >= 0, ends, -np.inf)
+
+
+    def contains(self, x: np.ndarray) -> np.ndarray:
+        """Mask of the points `x` that are strictly inside any range. [Nx1]"""
+        return self.maxEndBefore(x) > x
+
+
+    def containsRanges(self, pairs: np.ndarray) -> np.ndarray:
+        """Mask of the `[x1, x2]` pairs with both points strictly inside the same range. [Nx1]"""
+        pairs = np.asarray(pairs).reshape(-1, 2)
+        lo = np.min(pairs, axis=1)
+        hi = np.max(pairs, axis=1)
+        return self.maxEndBefore(lo) > hi
+
+
+    def filter(self, idxs: np.ndarray) -> np.ndarray:
+        """Only the points [Nx1] or pairs [Nx2] of `idxs` inside the ranges, in their original order."""
+        idxs = np.asarray(idxs)
+        if idxs.shape[0] == 0:
+            return idxs
+        return idxs[self.containsRanges(idxs) if idxs.ndim == 2 else self.contains(idxs)]
+
+
+    @property
+    def starts(self) -> np.ndarray:
+        """Sorted range starts. [Rx1]"""
+        return self.__starts
+
+    @starts.setter
+    def starts(self, s):
+        self.__starts = s
+
+
+    @property
+    def max_ends(self) -> np.ndarray:
+        """Running max of the range ends, in the order of `starts`. [Rx1]"""
+        return self.__max_ends
+
+    @max_ends.setter
+    def max_ends(self, e):
+        self.__max_ends = e
@@ -1,4 +1,3 @@
-import numpy as np
 import matplotlib.pyplot as plt
 from constants.jump_th import JUMP_THRESHOLD_MG
 from domain.devices.track import Track
@@ -221,11 +220,11 @@ def plotEulerAnalysis(tile: Tile, r=[0, -1]):
 
 
     boot_quat = tile.boot_quat[r[0]:r[1], :]
-    boot_quat_euler = np.apply_along_axis(quatToEuler, 1, boot_quat)
+    boot_quat_euler = quatToEuler(boot_quat)
     # boot_quat_euler = makeContinuousRange3dof(boot_quat_euler, fix_0=True, fix_1=True, fix_2=True)
 
     sensor_quat = tile.imu.quat[r[0]:r[1], :]
-    sensor_euler = np.apply_along_axis(quatToEuler, 1, sensor_quat)
+    sensor_euler = quatToEuler(sensor_quat)
     # sensor_euler = makeContinuousRange3dof(sensor_euler, fix_0=True, fix_1=True, fix_2=True)
 
     boot_rotated_euler = tile.boot_rotated_euler[r[0]:r[1], :]
@@ -304,11 +303,11 @@ def plotSensorBootEuler(tile: Tile, r=[0, -1]):
     t = tile.time[r[0]:r[1]]
 
     boot_quat = tile.boot_quat[r[0]:r[1], :]
-    boot_quat_euler = np.apply_along_axis(quatToEuler, 1, boot_quat)
+    boot_quat_euler = quatToEuler(boot_quat)
     # boot_quat_euler = makeContinuousRange3dof(boot_quat_euler, fix_0=True, fix_1=True, fix_2=True)
 
     sensor_quat = tile.imu.quat[r[0]:r[1], :]
-    sensor_euler = np.apply_along_axis(quatToEuler, 1, sensor_quat)
+    sensor_euler = quatToEuler(sensor_quat)
     # sensor_euler = makeContinuousRange3dof(sensor_euler, fix_0=True, fix_1=True, fix_2=True)
 
     plt.rc('lines', linewidth=1)
@@ -373,7 +372,7 @@ def plotTurnAnalysis(tile: Tile, rrs=None, r=[0, -1]):
                 ax.axvspan(t[tile.downhill_idxs[i, 0]], t[tile.downhill_idxs[i, 1]], color='g', alpha=0.25)
 
     t = tile.time[r[0]:r[1]]
-    euler = np.apply_along_axis(quatToEuler, 1, tile.boot_quat[r[0]:r[1], :])
+    euler = quatToEuler(tile.boot_quat[r[0]:r[1], :])
 
     highG_idxs = [turn.highG_idx for turn in tile.turns]
     baseline_idxs = [turn.baseline_idx_1 for turn in tile.turns]
@@ -497,7 +496,7 @@ def plotTurnBaselineAnalysis(tile: Tile, r=[0, -1]):
             ax.axvline(t[rr], color=_color, linestyle='--')
 
     t = tile.time[r[0]:r[1]]
-    euler = np.apply_along_axis(quatToEuler, 1, tile.boot_quat[r[0]:r[1], :])
+    euler = quatToEuler(tile.boot_quat[r[0]:r[1], :])
 
     baseline_idxs_1 = [turn.baseline_idx_1 for turn in tile.turns]
     baseline_idxs_2 = [turn.baseline_idx_2 for turn in tile.turns]
@@ -585,7 +584,7 @@ def plotTurnBaselineAnalysis(tile: Tile, r=[0, -1]):
 
 def plotRunGeographyAnalysis(tile: Tile, r=[0, -1]):
     t = tile.time[r[0]:r[1]]
-    boot_euler = np.apply_along_axis(quatToEuler, 1, tile.boot_quat[r[0]:r[1], :])
+    boot_euler = quatToEuler(tile.boot_quat[r[0]:r[1], :])
     lbs = [el.idx for el in tile.geography.lift_bottoms]
     lps = [el.idx for el in tile.geography.lift_peaks]
     rps = [el.idx for el in tile.geography.run_peaks]
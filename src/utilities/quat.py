@@ -1,5 +1,4 @@
 import numpy as np
-import math
 
 def avgQuat(quats: np.ndarray, weights=None):
     """Performs the calculation for the average quaternion, based on the range `r` provided.
@@ -10,20 +9,42 @@ def avgQuat(quats: np.ndarray, weights=None):
     -------
     Average orientation quaternion [w, x, y, z] over range `r`.
     """
-    N = quats.shape[0]
-    ws = np.ones(N) if weights is None else weights
-    qavg = np.array([0., 0., 0., 0.])
-    for i in range(N):
-        # ensure each quat is normalized
-        quat = quats[i] / np.linalg.norm(quats[i])
-
-        # flip, account for double cross over
-        if i > 0 and quat.dot(quats[0]) < 0.:
-            ws[i] -= 1
-
-        qavg = np.add(qavg, quat * ws[i])
-    norm = np.linalg.norm(qavg)
-    qavg /= norm if not norm == 0 else 1
+    return avgQuatRanges(quats, np.array([[0, quats.shape[0]]]), weights)[0]
+
+
+def avgQuatRanges(quats: np.ndarray, ranges: np.ndarray, weights=None) -> np.ndarray:
+    """Averages the quaternions inside every `[start, end)` row of `ranges` in one batched call. [Rx4]
+
+    Uses the eigen method (Markley et al. 2007), the average is the eigenvector of the largest
+    eigenvalue of the accumulated (weighted) outer product matrix `sum(w * q q^T)`. Since `q` &
+    `-q` give the same outer product, the sign ambiguity of the inputs doesn't matter, the result
+    is returned in the same hemisphere as the first quaternion of its range. Empty ranges average
+    to a zero quaternion.
+    """
+    ranges = np.asarray(ranges, dtype=np.int64).reshape(-1, 2)
+    R = ranges.shape[0]
+    lengths = np.maximum(ranges[:, 1] - ranges[:, 0], 0)
+    qavg = np.zeros((R, 4))
+    filled = lengths > 0
+    if not np.any(filled):
+        return qavg
+
+    # gather only the samples inside the ranges, range by range
+    starts = ranges[filled, 0]
+    seg_starts = np.concatenate([[0], np.cumsum(lengths[filled])[:-1]])
+    idxs = np.arange(lengths[filled].sum()) - np.repeat(seg_starts - starts, lengths[filled])
+
+    q = quats[idxs] / np.linalg.norm(quats[idxs], axis=1, keepdims=True)
+    w = np.ones(idxs.shape[0]) if weights is None else np.asarray(weights, dtype=float)[idxs]
+    M = np.add.reduceat(w[:, None, None] * q[:, :, None] * q[:, None, :], seg_starts, axis=0)
+
+    _, vecs = np.linalg.eigh(M)
+    avg = vecs[:, :, -1]
+
+    # pick the hemisphere of the first quaternion in each range
+    first = q[seg_starts]
+    avg *= np.where(np.sum(avg * first, axis=1) < 0, -1., 1.)[:, None]
+    qavg[filled] = avg
     return qavg
 
 
@@ -43,33 +64,38 @@ def createMisalignmentMatrix(alpha = 0, beta = 0, gamma = 0):
 def eulerToQuat(rpy: np.ndarray) -> np.ndarray:
     """Convert Euler data into an orientation quaternion. Follows a cardan ZYX sequence.
 
+    Broadcasts over the leading dimensions, ex: [Nx3] euler into [Nx4] quaternions.
+
     https://en.wikipedia.org/wiki/Conversion_between_quaternions_and_Euler_angles#Euler_angles_(in_3-2-1_sequence)_to_quaternion_conversion
     """
-    halfR = np.deg2rad(rpy[0]) * 0.5
-    halfP = np.deg2rad(rpy[1]) * 0.5
-    halfY = np.deg2rad(rpy[2]) * 0.5
-    cr = math.cos(halfR); cp = math.cos(halfP); cy = math.cos(halfY)
-    sr = math.sin(halfR); sp = math.sin(halfP); sy = math.sin(halfY)
-
-    return np.array([
+    rpy = np.asarray(rpy)
+    halfR = np.deg2rad(rpy[..., 0]) * 0.5
+    halfP = np.deg2rad(rpy[..., 1]) * 0.5
+    halfY = np.deg2rad(rpy[..., 2]) * 0.5
+    cr = np.cos(halfR); cp = np.cos(halfP); cy = np.cos(halfY)
+    sr = np.sin(halfR); sp = np.sin(halfP); sy = np.sin(halfY)
+
+    return np.stack([
         cr * cp * cy + sr * sp * sy,
         sr * cp * cy - cr * sp * sy,
         cr * sp * cy + sr * cp * sy,
         cr * cp * sy - sr * sp * cy,
-    ])
+    ], axis=-1)
 
 
 def inverseQuat(q: np.ndarray) -> np.ndarray:
+    """Conjugate of the (unit) quaternion `q`, [1x4] or [Nx4]."""
     return np.multiply(q, [1, -1, -1, -1])
 
 
 def quatToEuler(q: np.ndarray):
     """Converts an orientation quaternion into euler angles, in degrees.
     
-    Employs the atan2 method straight from wiki, following a cardan ZYX sequence.
+    Employs the atan2 method straight from wiki, following a cardan ZYX sequence. Broadcasts over
+    the leading dimensions, ex: [Nx4] quaternions into [Nx3] euler.
     """
-    q = q / np.linalg.norm(q)
-    qw = q[0]; qx = q[1]; qy = q[2]; qz = q[3]
+    q = q / np.linalg.norm(q, axis=-1, keepdims=True)
+    qw = q[..., 0]; qx = q[..., 1]; qy = q[..., 2]; qz = q[..., 3]
     
     # v1
     # https://github.com/xioTechnologies/Fusion/blob/58f9d2e01be0fcda37ebb1af35c7fc09a5dcbeff/Fusion/FusionMath.h#L466
@@ -99,7 +125,7 @@ def quatToEuler(q: np.ndarray):
     cosy_cosp = 1 - 2 * (qy * qy + qz * qz)
     yaw = np.degrees(np.arctan2(siny_cosp, cosy_cosp))
 
-    return np.array([roll, pitch, yaw])
+    return np.stack([roll, pitch, yaw], axis=-1)
 
 
 def quatMult(qa: np.ndarray, qb: np.ndarray) -> np.ndarray:
@@ -107,17 +133,18 @@ def quatMult(qa: np.ndarray, qb: np.ndarray) -> np.ndarray:
     without the matching inverse performs a vector rotation.
     
     For quaternion rotations with the
-    inverse, use `quatRot()`.
+    inverse, use `quatRot()`. Broadcasts, ex: [Nx4] by [Nx4] or [Nx4] by [1x4].
     """
-    qa_w = qa[0]; qa_x = qa[1]; qa_y = qa[2]; qa_z = qa[3]
-    qb_w = qb[0]; qb_x = qb[1]; qb_y = qb[2]; qb_z = qb[3]
+    qa = np.asarray(qa); qb = np.asarray(qb)
+    qa_w = qa[..., 0]; qa_x = qa[..., 1]; qa_y = qa[..., 2]; qa_z = qa[..., 3]
+    qb_w = qb[..., 0]; qb_x = qb[..., 1]; qb_y = qb[..., 2]; qb_z = qb[..., 3]
 
-    return np.array([
+    return np.stack([
         qa_w*qb_w - qa_x*qb_x - qa_y*qb_y - qa_z*qb_z,  # w
         qa_w*qb_x + qa_x*qb_w + qa_y*qb_z - qa_z*qb_y,  # x
         qa_w*qb_y - qa_x*qb_z + qa_y*qb_w + qa_z*qb_x,  # y
         qa_w*qb_z + qa_x*qb_y - qa_y*qb_x + qa_z*qb_w,  # z
-    ])
+    ], axis=-1)
 
 
 def quatRot(q_input: np.ndarray, q_rot: np.ndarray, inverse=False) -> np.ndarray:
@@ -127,9 +154,11 @@ def quatRot(q_input: np.ndarray, q_rot: np.ndarray, inverse=False) -> np.ndarray
     .. math::
 
     q_{result} = q_{rot} \cdot q_{i} \cdot q_{rot}^{-1}
+
+    Broadcasts, ex: [Nx4] inputs by a single [1x4] rotation.
     """
     # q_input = q_input / np.linalg.norm(q_input)
-    q_rot = q_rot / np.linalg.norm(q_rot)
+    q_rot = q_rot / np.linalg.norm(q_rot, axis=-1, keepdims=True)
     q_rot_i = inverseQuat(q_rot)
     return (
         quatMult(quatMult(q_rot, q_input), q_rot_i) 
@@ -139,4 +168,4 @@ def quatRot(q_input: np.ndarray, q_rot: np.ndarray, inverse=False) -> np.ndarray
 
 
 def euler2DNormFromQuat(q: np.ndarray) -> np.ndarray:
-    return np.linalg.norm(np.abs([quatToEuler(q)[0], quatToEuler(q)[1]]))
\ No newline at end of file
+    return np.linalg.norm(np.abs(quatToEuler(q)[..., :2]), axis=-1)
\ No newline at end of file
@@ -0,0 +1,200 @@
+import numpy as np
+
+
+class RangeStats:
+    """
+    Per-signal index answering the min, max, mean & std dev of any `[start, end)` range of `x` in
+    constant time, ex: `stats.std([liftoff_idx, touch_idx])`.
+
+    Mean & variance come from cumulative sums & sums of squares. Min & max come from a block
+    sparse table: every range is covered by the suffix of its first block, the prefix of its last
+    block & two overlapping power-of-two spans of the whole blocks in between. The arg min & max
+    are then found among the samples of the ranges.
+
+    Ranges follow the python slice rules (negative indices count from the end, out of bounds
+    indices are clipped), empty ranges are `nan`. A single `[start, end]` pair returns a scalar,
+    an array of pairs [Kx2] returns an array of results. [Kx1]
+    """
+    def __init__(self, x: np.ndarray, block=32) -> None:
+        self.x = np.asarray(x, dtype=float)
+        self.block = block
+        N = self.x.shape[0]
+
+        # centered first, the cumulative sums of squares would otherwise cancel out
+        self.__offset = np.mean(self.x) if N > 0 else 0.
+        xc = self.x - self.__offset
+        self.__csum = np.concatenate([[0.], np.cumsum(xc)])
+        self.__csum2 = np.concatenate([[0.], np.cumsum(xc ** 2)])
+
+        blocks = max(-(-N // block), 1)
+        self.__blocks = np.full(blocks * block, self.x[-1] if N > 0 else np.nan)
+        self.__blocks[:N] = self.x
+        self.__blocks = self.__blocks.reshape(blocks, block)
+        self.__tables = {ufunc: self.blockTables(ufunc) for ufunc in (np.maximum, np.minimum)}
+
+
+    def __len__(self) -> int:
+        return self.x.shape[0]
+
+
+    def blockTables(self, ufunc):
+        """In-block prefix & suffix scans, plus the sparse table over the whole block reductions."""
+        B = self.block
+        pad = self.__blocks
+        blocks = pad.shape[0]
+
+        prefix = ufunc.accumulate(pad, axis=1).ravel()
+        suffix = ufunc.accumulate(pad[:, ::-1], axis=1)[:, ::-1].ravel()
+
+        # sparse[k, j] reduces the blocks j .. j + 2**k - 1
+        sparse = [prefix[B - 1::B]]
+        while 2 ** len(sparse) <= blocks:
+            span = 2 ** (len(sparse) - 1)
+            prev = sparse[-1]
+            sparse.append(np.concatenate([ufunc(prev[:-span], prev[span:]), prev[-span:]]))
+        return prefix, suffix, np.stack(sparse)
+
+
+    def bounds(self, r) -> tuple[np.ndarray, np.ndarray, bool]:
+        """Normalizes the range(s) `r` into `[start, end)` index arrays, and if `r` was a single range."""
+        r = np.asarray(r, dtype=np.int64)
+        single = r.ndim == 1
+        r = r.reshape(-1, 2)
+        N = self.x.shape[0]
+        start = np.clip(np.where(r[:, 0] < 0, r[:, 0] + N, r[:, 0]), 0, N)
+        end = np.clip(np.where(r[:, 1] < 0, r[:, 1] + N, r[:, 1]), 0, N)
+        return start, end, single
+
+
+    def result(self, values: np.ndarray, start, end, single):
+        """Sets the empty ranges to `nan`, unpacking the scalar of a single range."""
+        values = np.where(end > start, values, np.nan)
+        return float(values[0]) if single else values
+
+
+    def count(self, r=None):
+        """Sample count of the range(s) `r`."""
+        start, end, single = self.bounds(self.full(r))
+        n = np.maximum(end - start, 0)
+        return int(n[0]) if single else n
+
+
+    def mean(self, r=None):
+        """Mean of the range(s) `r`, defaults to the full signal."""
+        start, end, single = self.bounds(self.full(r))
+        n = np.maximum(end - start, 1)
+        return self.result((self.__csum[end] - self.__csum[start]) / n + self.__offset, start, end, single)
+
+
+    def var(self, r=None):
+        """Population variance (same as `np.var`) of the range(s) `r`, defaults to the full signal."""
+        start, end, single = self.bounds(self.full(r))
+        n = np.maximum(end - start, 1)
+        mean_c = (self.__csum[end] - self.__csum[start]) / n
+        var = np.clip((self.__csum2[end] - self.__csum2[start]) / n - mean_c ** 2, 0, None)
+        var[n == 1] = 0.
+        return self.result(var, start, end, single)
+
+
+    def std(self, r=None):
+        """Population std dev (same as `np.std`) of the range(s) `r`, defaults to the full signal."""
+        return np.sqrt(self.var(r))
+
+
+    def max(self, r=None):
+        """Max of the range(s) `r`, defaults to the full signal."""
+        return self.reduce(np.maximum, r)
+
+
+    def min(self, r=None):
+        """Min of the range(s) `r`, defaults to the full signal."""
+        return self.reduce(np.minimum, r)
+
+
+    def argmax(self, r=None):
+        """Index in `x` of the first max of the range(s) `r` (same as `np.argmax` + start), `-1` if empty."""
+        return self.argReduce(np.maximum, r)
+
+
+    def argmin(self, r=None):
+        """Index in `x` of the first min of the range(s) `r` (same as `np.argmin` + start), `-1` if empty."""
+        return self.argReduce(np.minimum, r)
+
+
+    def argReduce(self, ufunc, r):
+        """First index reaching the `ufunc` reduction of the range(s) `r`, searched in the gathered samples
+        of all the ranges at once.
+        """
+        start, end, single = self.bounds(self.full(r))
+        n = np.maximum(end - start, 0)
+        idxs = np.full(start.shape, -1, dtype=np.int64)
+        hit = n > 0
+        if np.any(hit):
+            target = self.reduce(ufunc, np.stack([start[hit], end[hit]], axis=1))
+            offsets = np.cumsum(n[hit]) - n[hit]
+            rows = np.repeat(np.arange(offsets.shape[0]), n[hit])
+            pos = np.arange(rows.shape[0]) - offsets[rows] + start[hit][rows]
+            values = self.x[pos]
+            # `nan` reductions point at the first `nan`, like `np.argmax`
+            match = (values == target[rows]) | (np.isnan(values) & np.isnan(target[rows]))
+            idxs[hit] = np.minimum.reduceat(np.where(match, pos, len(self)), offsets)
+        return int(idxs[0]) if single else idxs
+
+
+    def reduce(self, ufunc, r):
+        """`ufunc` (`np.maximum` or `np.minimum`) reduction of the range(s) `r` from the block tables."""
+        start, end, single = self.bounds(self.full(r))
+        if len(self) == 0:
+            return self.result(np.full(start.shape, np.nan), start, end, single)
+
+        B = self.block
+        prefix, suffix, sparse = self.__tables[ufunc]
+        # empty ranges are still looked up in bounds, then set to `nan`
+        first = np.minimum(start, len(self) - 1)
+        last = np.clip(end - 1, first, len(self) - 1)
+        first_block = first // B
+        last_block = last // B
+
+        # ranges spanning several blocks: suffix of the first, prefix of the last & the blocks in between
+        out = ufunc(suffix[first], prefix[last])
+        inner = last_block - first_block > 1
+        if np.any(inner):
+            lo = first_block[inner] + 1
+            hi = last_block[inner] - 1
+            k = np.floor(np.log2(hi - lo + 1)).astype(np.int64)
+            out[inner] = ufunc(out[inner], ufunc(sparse[k, lo], sparse[k, hi - 2 ** k + 1]))
+
+        # ranges inside a single block are reduced directly, at most `block` samples
+        same = first_block == last_block
+        if np.any(same):
+            rows = self.__blocks[first_block[same]]
+            cols = np.arange(B)
+            inside = (cols >= (first[same] % B)[:, None]) & (cols <= (last[same] % B)[:, None])
+            fill = rows[np.arange(rows.shape[0]), first[same] % B][:, None]
+            out[same] = ufunc.reduce(np.where(inside, rows, fill), axis=1)
+        return self.result(out, start, end, single)
+
+
+    def full(self, r):
+        """The range(s) `r`, or the full signal range if `None`."""
+        return [0, len(self)] if r is None else r
+
+
+    @property
+    def x(self) -> np.ndarray:
+        """Indexed signal. [Nx1]"""
+        return self.__x
+
+    @x.setter
+    def x(self, x):
+        self.__x = x
+
+
+    @property
+    def block(self) -> int:
+        """Block length of the min/max sparse table, in samples."""
+        return self.__block
+
+    @block.setter
+    def block(self, b):
+        self.__block = b
@@ -0,0 +1,99 @@
+import numpy as np
+from utilities.range_stats import RangeStats
+
+
+class RollingStats:
+    """
+    Sliding window statistics of the signal `x` for every window of `window` samples, indexed by
+    the window start: `std[s]` is the std dev of `x[s:s + window]`. [(N - window + 1)x1]
+
+    Every window is a range of the `RangeStats` of `x`, with blocks of `window` samples each window
+    spans the suffix of one block & the prefix of the next (van Herk/Gil-Werman), so every
+    statistic is O(N) for the whole signal no matter the window length. Each one is only computed
+    on first access.
+    """
+    def __init__(self, x: np.ndarray, window: int) -> None:
+        self.window = int(window)
+        self.stats = RangeStats(x, block=max(self.window, 1))
+        self.__mean = None
+        self.__var = None
+        self.__std = None
+        self.__max = None
+        self.__min = None
+
+
+    def __len__(self) -> int:
+        return max(self.x.shape[0] - self.window + 1, 0)
+
+
+    @property
+    def x(self) -> np.ndarray:
+        """Input signal. [Nx1]"""
+        return self.stats.x
+
+
+    @property
+    def window(self) -> int:
+        """Window length, in samples."""
+        return self.__window
+
+    @window.setter
+    def window(self, w):
+        self.__window = w
+
+
+    @property
+    def stats(self) -> RangeStats:
+        """Range statistics of `x` answering every window."""
+        return self.__stats
+
+    @stats.setter
+    def stats(self, s):
+        self.__stats = s
+
+
+    @property
+    def ranges(self) -> np.ndarray:
+        """`[s, s + window]` range of every window. [(N - window + 1)x2]"""
+        starts = np.arange(len(self))
+        return np.stack([starts, starts + self.window], axis=1)
+
+
+    @property
+    def mean(self) -> np.ndarray:
+        """Mean of every window."""
+        if self.__mean is None:
+            self.__mean = self.stats.mean(self.ranges)
+        return self.__mean
+
+
+    @property
+    def var(self) -> np.ndarray:
+        """Population variance (same as `np.var`) of every window."""
+        if self.__var is None:
+            self.__var = self.stats.var(self.ranges)
+        return self.__var
+
+
+    @property
+    def std(self) -> np.ndarray:
+        """Population std dev (same as `np.std`) of every window."""
+        if self.__std is None:
+            self.__std = np.sqrt(self.var)
+        return self.__std
+
+
+    @property
+    def max(self) -> np.ndarray:
+        """Max of every window."""
+        if self.__max is None:
+            self.__max = self.stats.max(self.ranges)
+        return self.__max
+
+
+    @property
+    def min(self) -> np.ndarray:
+        """Min of every window."""
+        if self.__min is None:
+            self.__min = self.stats.min(self.ranges)
+        return self.__min
@@ -1,6 +1,8 @@
 import math
+import numpy as np
 from scipy import signal
 from domain.session_logger import SessionLogger as logger
+from utilities import sig_proc_np
 
 
 def arma(x: list, m=5):
@@ -28,59 +30,14 @@ def makeContinuousRange(x: list, m=0.5, full_scale=360):
     This is useful for graphs when trying to test for stillness, since a zero crossing would be a massive
     outlier.
 
+    List wrapper of the linear time `sig_proc_np.makeContinuousRange()`.
+
     Returns
     -------
     unclamped signal `x` and the observed skipping indices
     """
-    y = x
-    skips = []
-    N = len(x)
-    m_FS = m * full_scale
-    p = 0
-    logger.debug(f'Making signal continuous based on FS range: {full_scale}')
-
-    for i in range(N):
-        if i == 0: continue
-        current_p = round(i/N*100)
-        if current_p % 5 == 0 and p != current_p:
-            logger.debug(f'makeContinuousRange() progress {current_p}%')
-            p = current_p
-
-        xi_minus_xi1 = x[i] - x[i - 1]
-        abs_xi_minus_xi1 = abs(xi_minus_xi1)
-
-        if xi_minus_xi1 > 0 and abs_xi_minus_xi1 >= m_FS:
-            skips.append([i - 1, i])
-            for j in range(N - i):
-                y[i + j] = x[i + j] - full_scale
-                if xi_minus_xi1 < 0 and abs_xi_minus_xi1 >= m_FS:
-                    skips.append([i - 1, i])
-                    break
-            continue
-
-        if xi_minus_xi1 < 0 and abs_xi_minus_xi1 >= m_FS:
-            skips.append([i - 1, i])
-            for j in range(N - i):
-                y[i + j] = x[i + j] + full_scale
-                if xi_minus_xi1 > 0 and abs_xi_minus_xi1 >= m_FS:
-                    skips.append([i - 1, i])
-                    break
-            continue
-    logger.debug(f'makeContinuousRange() skips found: {len(skips)}')
-    return y, skips
-
-    # logger.debug(len(x))
-    # m = 0.95
-    # y = x
-    # for i in range(len(x) - 1):
-    #     # if i == 0: continue
-    #     y[i] = x[i] + c
-    #     if x[i + 1] > 0 and (x[i + 1] - x[i]) >= (m * full_scale):
-    #         fixZeroCrossings(x[i + 1:], -full_scale)
-
-    #     if x[i + 1] < 0 and (x[i + 1] - x[i]) <= -(m * full_scale):
-    #         fixZeroCrossings(x[i + 1:], full_scale)
-    # return y
+    y, skips = sig_proc_np.makeContinuousRange(np.asarray(x, dtype=float), m, full_scale)
+    return y.tolist(), skips.tolist()
 
 
 def makeContinuousRange3dof(x: list, fix_0=True, fix_1=True, fix_2=True):
@@ -102,17 +59,9 @@ def groupClosePointsIntoRanges(idxs: list, th=2):
     """Return list of ranges of sequential points grouped by closeness,
     whose changes are separated by values greater than `th`
     """
-    ranges = []
     if len(idxs) == 0:
-        return ranges
-    x1 = idxs[0]
-    x2 = idxs[-1]
-    for i in range(len(idxs) - 1):
-        if idxs[i + 1] - idxs[i] > th:
-            ranges.append([x1, idxs[i]])
-            x1 = idxs[i + 1]
-    ranges.append([x1, x2])
-    return ranges
+        return []
+    return sig_proc_np.groupClosePointsIntoRanges(np.asarray(idxs), th).tolist()
 
 
 def identifyRangesBelowTH(x: list, th):
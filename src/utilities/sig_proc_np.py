@@ -1,35 +1,31 @@
 import numpy as np
 from scipy import signal
 from domain.session_logger import SessionLogger as logger
-from utilities.sig_proc import makeContinuousRange
-
-def onlyIdxsInsideRanges(idxs: np.ndarray, ranges: np.ndarray) -> np.ndarray:
-    _idxs = []
-
-    if idxs.ndim == 2:
-        for i in range(idxs.shape[0]):
-            for j in range(ranges.shape[0]):
-                if (
-                    idxs[i, 0] > ranges[j, 0] and
-                    idxs[i, 1] > ranges[j, 0] and
-                    idxs[i, 0] < ranges[j, 1] and
-                    idxs[i, 1] < ranges[j, 1]
-                ):
-                    _idxs.append([idxs[i, 0], idxs[i, 1]])
-
-    elif idxs.ndim == 1:
-        for i in range(idxs.shape[0]):
-            for j in range(ranges.shape[0]):
-                if (
-                    idxs[i] > ranges[j, 0] and
-                    idxs[i] < ranges[j, 1] 
-                ):
-                    _idxs.append(idxs[i])
-
-    return np.array(_idxs)
-
-
-def deriv(x: np.ndarray, dt=1/100, lpf=True) -> np.ndarray:
+from utilities.interval_index import IntervalIndex
+
+def onlyIdxsInsideRanges(idxs: np.ndarray, ranges: np.ndarray | IntervalIndex) -> np.ndarray:
+    """Only the indices [Nx1] or index pairs [Nx2] of `idxs` strictly inside any of the `ranges`,
+    pairs need both indices inside the same range.
+
+    Pass an `IntervalIndex` of the ranges to reuse it across calls.
+    """
+    index = ranges if isinstance(ranges, IntervalIndex) else IntervalIndex(ranges)
+    return index.filter(idxs)
+
+
+def cumtrapz(x: np.ndarray, dt=0.01) -> np.ndarray:
+    """Computes the trapezoidal integration of the input signal `x`, same as `sig_proc.cumtrapz`.
+
+    Assumes a `dt` of 0.01seconds = 100Hz, otherwise override it.
+    """
+    x = np.asarray(x, dtype=float)
+    if x.shape[0] < 2:
+        return np.empty(0)
+    # rectangle + triangle
+    return (x[:-1] + (x[1:] - np.concatenate([[0.], x[:-2]])) / 2) * dt
+
+
+def deriv(x: np.ndarray, dt=1/100, lpf=True, axis=0) -> np.ndarray:
     """Five point estimation for the first order derivative, centred about xi.
 
     .. math::
@@ -38,35 +34,43 @@ def deriv(x: np.ndarray, dt=1/100, lpf=True) -> np.ndarray:
     
     Perfroms a butter2 lowpass filter with wn=2/100 since the discrete derivative is inherently
     noise enducing. Override `lpf` if you'd like otherwise.
+
+    The stencil runs as shifted slices along `axis`, so (Nxk) signals are derived column-wise in a
+    single pass.
     """
-    xw = x[2:-2]
-    W = xw.shape[0]
+    x = np.moveaxis(np.asarray(x), axis, 0)
+    W = x.shape[0] - 4
     if W < 1:
         logger.error('Error calculating derivative. Signal not long enough, must be at least 5 elements.')
-        return x
+        return np.moveaxis(x, 0, axis)
     
     one_twelfth_dt = 1 / (12 * dt)
-    two_zeros = [0] + [0]
-    yw = two_zeros + [(x[i-2] - 8 * x[i-1] + 8 * x[i+1] - x[i+2]) for i in range(W)] + two_zeros
+    # x_{n-2} of the first samples wraps around to the end of the signal
+    xp = np.concatenate([x[-2:], x])
+    yw = np.zeros(x.shape)
+    yw[2:-2] = xp[0:W] - 8 * xp[1:W + 1] + 8 * xp[3:W + 3] - xp[4:W + 4]
     y = np.divide(yw, one_twelfth_dt)
-    return lowpass(y, 2/100) if lpf else y
+    return np.moveaxis(lowpass(y, 2/100) if lpf else y, 0, axis)
+
+
+def closePointRuns(idxs: np.ndarray, th=2) -> tuple[np.ndarray, np.ndarray]:
+    """Return the `(starts, ends)` np.ndarrays of the runs of sequential points grouped by
+    closeness, whose changes are separated by values greater than `th`
+    """
+    idxs = np.asarray(idxs)
+    splits = np.flatnonzero(np.diff(idxs) > th)
+    starts = idxs[np.concatenate([[0], splits + 1])] if idxs.shape[0] else idxs
+    ends = idxs[np.concatenate([splits, [idxs.shape[0] - 1]])] if idxs.shape[0] else idxs
+    return starts, ends
 
 
 def groupClosePointsIntoRanges(idxs: np.ndarray, th=2):
     """Return np.ndarray of ranges of sequential points grouped by closeness,
     whose changes are separated by values greater than `th`
     """
-    ranges = []
     if len(idxs) == 0:
         return np.zeros((0, 0))
-    x1 = idxs[0]
-    x2 = idxs[-1]
-    for i in range(idxs.shape[0] - 1):
-        if idxs[i + 1] - idxs[i] > th:
-            ranges.append([x1, idxs[i]])
-            x1 = idxs[i + 1]
-    ranges.append([x1, x2])
-    return np.array(ranges)
+    return np.stack(closePointRuns(idxs, th), axis=1)
 
 
 def identifyLTThInsideRanges(x: np.ndarray, th, ranges):
@@ -100,15 +104,39 @@ def mae(x1: np.ndarray, x2: np.ndarray):
     return np.mean(np.abs(x1 - x2))
 
 
-def makeContinuousRange3dof(x: np.ndarray, fix_0=True, fix_1=True, fix_2=True, debug_file=None):
-    """Runs `fixZeroCrossing()` for each column signal in the input ndarray `x`
+def makeContinuousRange(x: np.ndarray, m=0.5, full_scale=360):
+    """Fixes the zero crossings in a signal that is previously clamped to a single scale range of
+    `full_scale` (`360` for +-180deg, `180` for +-90deg), unwrapping every step of at least
+    `m * full_scale` by a full scale.
+
+    Linear time, the corrections are a cumulative sum of the skips.
+
+    Returns
+    -------
+    unclamped signal `x` and the observed skipping indices, `[i - 1, i]` per skip
+    """
+    x = np.asarray(x)
+    d = np.diff(x)
+    is_skip = np.abs(d) >= m * full_scale
+    correction = np.concatenate([[0.], np.cumsum(np.where(is_skip, -np.sign(d) * full_scale, 0.))])
+
+    skip_idxs = np.flatnonzero(is_skip) + 1
+    skips = np.stack([skip_idxs - 1, skip_idxs], axis=1)
+    logger.debug(f'makeContinuousRange() skips found: {skips.shape[0]}')
+    return x + correction, skips
+
+
+def makeContinuousRange3dof(x: np.ndarray, fix_0=True, fix_1=True, fix_2=True, full_scale=360):
+    """Runs `makeContinuousRange()` for each column signal in the input ndarray `x`, `full_scale`
+    can also be set per column, ex: `(360, 180, 360)`.
     
     Returns the ndarray, with fixed zero crossings on each column signal individually.
     """
+    full_scales = np.broadcast_to(full_scale, (3,))
     return np.transpose([
-        np.array(makeContinuousRange(x[:, 0].tolist(), debug_file=debug_file)[0]) if fix_0 else x[:, 0],
-        np.array(makeContinuousRange(x[:, 1].tolist(), debug_file=debug_file)[0]) if fix_1 else x[:, 1],
-        np.array(makeContinuousRange(x[:, 2].tolist(), debug_file=debug_file)[0]) if fix_2 else x[:, 2],
+        makeContinuousRange(x[:, 0], full_scale=full_scales[0])[0] if fix_0 else x[:, 0],
+        makeContinuousRange(x[:, 1], full_scale=full_scales[1])[0] if fix_1 else x[:, 1],
+        makeContinuousRange(x[:, 2], full_scale=full_scales[2])[0] if fix_2 else x[:, 2],
     ])
 
 
@@ -154,6 +182,23 @@ def zeroCrossingIdxs(x: np.ndarray) -> np.ndarray:
     return np.where(sign_changes > 0)[0]
 
 
+def lastZeroCrossingIdxs(x: np.ndarray, ends) -> np.ndarray:
+    """Last of the `zeroCrossingIdxs(x[:end])` for every `end` (python slice rules), `-1` if there are none.
+
+    The crossings inside every prefix are the ones of the full signal, except the first sample
+    which wraps around to the last sample of the prefix.
+    """
+    N = x.shape[0]
+    ends = np.asarray(ends, dtype=np.int64)
+    L = np.clip(np.where(ends < 0, ends + N, ends), 0, N)
+    xsign = np.sign(x)
+    inner = np.flatnonzero((xsign[:-1] - xsign[1:]) != 0) + 1
+
+    j = np.searchsorted(inner, L, side='left') - 1
+    wraps = (L > 0) & ((xsign[np.maximum(L - 1, 0)] - xsign[0]) != 0) if N > 0 else np.zeros(L.shape, dtype=bool)
+    return np.where(j >= 0, inner[np.maximum(j, 0)] if inner.shape[0] else -1, np.where(wraps, 0, -1))
+
+
 def zeroCrossingIdxsGTThInsideRanges(x: np.ndarray, th, ranges) -> np.ndarray:
     sign_changes_r = zeroCrossingIdxs(x)
     large_diff_r = np.where(-np.diff(x) > th)[0]
@@ -1,214 +1,230 @@
 import numpy as np
 from domain.session_logger import SessionLogger as logger
 from utilities.decorators.print_test_results import printTestResults
-from utilities.sig_proc_np import maxIndex
+from utilities.range_stats import RangeStats
 
 
 class StatTests:
+    """
+    Statistical tests of signal windows. Every test takes a single range `[start, end]` or the
+    ranges of all the events at once [Kx2], returning a result per range. [Kx1]
+    """
+    @staticmethod
+    def windowBounds(x: np.ndarray, r=[0, -1]):
+        """`[start, end)` of the window(s) `x[r[0]:r[1]]`, following the python slice rules."""
+        r = np.asarray(r, dtype=np.int64)
+        N = x.shape[0]
+        start = np.clip(np.where(r[..., 0] < 0, r[..., 0] + N, r[..., 0]), 0, N)
+        end = np.clip(np.where(r[..., 1] < 0, r[..., 1] + N, r[..., 1]), 0, N)
+        return start, np.maximum(end, start)
+
+
     @staticmethod
     def assertWindow(x: np.ndarray, r=[0, -1]):
+        """Which window(s) `x[r[0]:r[1]]` are valid, a 1D signal with at least one sample."""
         if not x.ndim == 1:
-            return x, False
-        window = x[r[0]:r[1]]
-        if window.shape[0] <= 0:
-            return window, False
-        return window, True
+            return np.zeros(np.shape(r)[:-1], dtype=bool)
+        start, end = StatTests.windowBounds(x, r)
+        return end > start
+
+
+    @staticmethod
+    def rangeStats(x: np.ndarray, stats: RangeStats = None) -> RangeStats:
+        """The precomputed `stats` of `x` if given, otherwise built once for all the ranges."""
+        return stats if stats is not None else RangeStats(x)
 
 
     @printTestResults
     @staticmethod
-    def testContainsLocalPeak(x: np.ndarray, r=[0, -1], header=""):
+    def testContainsLocalPeak(x: np.ndarray, r=[0, -1], stats: RangeStats = None, header=""):
         """tests the input `x` signal for a peak inside the range `r`, excluding the endponits.
 
         The max will need to be higher than `th` which is default to `5`
-        
+
         if so, returns `True` else `False`
         """
-        window, isValid = StatTests.assertWindow(x, r)
-        if not isValid:
-            return False
-
-        max_window = np.max(window)
-        head = x[r[0]]
-        tail = x[r[1]]
+        isValid = StatTests.assertWindow(x, r)
+        if not np.any(isValid):
+            return isValid
+
+        r = np.asarray(r)
+        max_window = StatTests.rangeStats(x, stats).max(r)
+        head = x[r[..., 0]]
+        tail = x[r[..., 1]]
         logger.debug(f'\t\t{head} < {max_window} < {tail}?')
-        if head < max_window and max_window > tail:
-            return True
-        return False
+        return isValid & (head < max_window) & (max_window > tail)
 
 
     @printTestResults
     @staticmethod
     def testDecreasingTrend(x: np.ndarray, r=[0, -1], th=1, header=""):
-        """tests the input `x` signal for an overall decreasing trend
-        
+        """tests the input `x` signal for an overall decreasing trend, no sample to sample increase
+        larger than `th`. The increases are counted once for all the ranges.
+
         if so, returns `True` else `False`
         """
-        window, isValid = StatTests.assertWindow(x, r)
-        if not isValid:
-            return False
-        
-        for i in range(window.shape[0] - 1):
-            # logger.debug(f'\t\t{window[i + 1]} - {window[i]} = {window[i + 1] - window[i]} < {th}?')
-            if (window[i + 1] - window[i]) > th:
-                return False
-        return True
+        isValid = StatTests.assertWindow(x, r)
+        if not np.any(isValid):
+            return isValid
+
+        start, end = StatTests.windowBounds(x, r)
+        increases = np.concatenate([[0], np.cumsum(np.diff(x) > th)])
+        return isValid & (increases[np.maximum(end - 1, start)] - increases[start] == 0)
 
 
     @printTestResults
     @staticmethod
     def testMinSampleCount(r=[0, -1], min_count=50, header=""):
-        samples = r[1] - r[0]
+        r = np.asarray(r)
+        samples = r[..., 1] - r[..., 0]
         logger.debug(f'\t\t{samples} >= {min_count}?')
-        if samples >= min_count: 
-            return True
-        return False
-    
+        return samples >= min_count
+
 
     @printTestResults
     @staticmethod
-    def testLowerSampleStdDev(x: np.ndarray, r=[0, -1], against_other_r=None, header=""):
+    def testLowerSampleStdDev(x: np.ndarray, r=[0, -1], against_other_r=None, stats: RangeStats = None, header=""):
         """tests the input `x` signal for a smaller sample standard deviation vs the population.
-        
-        Unless `against_other_r` is passed, where the sample will test against it instead.
+
+        Unless `against_other_r` is passed, where the sample will test against it instead. Pass the
+        precomputed `stats` of `x` to reuse them across tests.
         """
-        window, isValid = StatTests.assertWindow(x, r)
-        if not isValid:
-            return False
-        
-        sample_against = x if against_other_r is None else x[against_other_r[0]:against_other_r[1]]
-        logger.debug(f'\t\t{np.std(window)} < {np.std(sample_against)}?')
-        if np.std(window) < np.std(sample_against):
-            return True
-        return False
+        isValid = StatTests.assertWindow(x, r)
+        if not np.any(isValid):
+            return isValid
+
+        stats = StatTests.rangeStats(x, stats)
+        sample = stats.std(r)
+        sample_against = stats.std(against_other_r)
+        logger.debug(f'\t\t{sample} < {sample_against}?')
+        return isValid & (sample < sample_against)
 
 
     @printTestResults
     @staticmethod
-    def testLargerSampleStdDev(x: np.ndarray, r=[0, -1], against_other_r=None, header=""):
+    def testLargerSampleStdDev(x: np.ndarray, r=[0, -1], against_other_r=None, stats: RangeStats = None, header=""):
         """tests the input `x` signal for a larger sample standard deviation vs the population.
-        
-        Unless `against_other_r` is passed, where the sample will test against it instead.
+
+        Unless `against_other_r` is passed, where the sample will test against it instead. Pass the
+        precomputed `stats` of `x` to reuse them across tests.
         """
-        window, isValid = StatTests.assertWindow(x, r)
-        if not isValid:
-            return False
-        
-        sample_against = x if against_other_r is None else x[against_other_r[0]:against_other_r[1]]
-        logger.debug(f'\t\t{np.std(window)} > {np.std(sample_against)}?')
-        if np.std(window) > np.std(sample_against):
-            return True
-        return False
+        isValid = StatTests.assertWindow(x, r)
+        if not np.any(isValid):
+            return isValid
+
+        stats = StatTests.rangeStats(x, stats)
+        sample = stats.std(r)
+        sample_against = stats.std(against_other_r)
+        logger.debug(f'\t\t{sample} > {sample_against}?')
+        return isValid & (sample > sample_against)
 
 
     @printTestResults
     @staticmethod
-    def testLowerSampleMean(x: np.ndarray, r=[0, -1], against_other_r=None, header=""):
+    def testLowerSampleMean(x: np.ndarray, r=[0, -1], against_other_r=None, stats: RangeStats = None, header=""):
         """tests the input `x` signal for a smaller sample mean vs the population.
-        
-        Unless `against_other_r` is passed, where the sample will test against it instead.
+
+        Unless `against_other_r` is passed, where the sample will test against it instead. Pass the
+        precomputed `stats` of `x` to reuse them across tests.
         """
-        window, isValid = StatTests.assertWindow(x, r)
-        if not isValid:
-            return False
-        
-        sample_against = x if against_other_r is None else x[against_other_r[0]:against_other_r[1]]
-        logger.debug(f'\t\t{np.mean(window)} < {np.mean(sample_against)}?')
-        if np.mean(window) < np.mean(sample_against):
-            return True
-        return False
+        isValid = StatTests.assertWindow(x, r)
+        if not np.any(isValid):
+            return isValid
+
+        stats = StatTests.rangeStats(x, stats)
+        sample = stats.mean(r)
+        sample_against = stats.mean(against_other_r)
+        logger.debug(f'\t\t{sample} < {sample_against}?')
+        return isValid & (sample < sample_against)
 
 
     @printTestResults
     @staticmethod
-    def testLargerSampleMean(x: np.ndarray, r=[0, -1], against_other_r=None, header=""):
+    def testLargerSampleMean(x: np.ndarray, r=[0, -1], against_other_r=None, stats: RangeStats = None, header=""):
         """tests the input `x` signal for a larger sample mean vs the population.
-        
-        Unless `against_other_r` is passed, where the sample will test against it instead.
+
+        Unless `against_other_r` is passed, where the sample will test against it instead. Pass the
+        precomputed `stats` of `x` to reuse them across tests.
         """
-        window, isValid = StatTests.assertWindow(x, r)
-        if not isValid:
-            return False
-        
-        sample_against = x if against_other_r is None else x[against_other_r[0]:against_other_r[1]]
-        logger.debug(f'\t\t{np.mean(window)} > {np.mean(sample_against)}?')
-        if np.mean(window) > np.mean(sample_against):
-            return True
-        return False
+        isValid = StatTests.assertWindow(x, r)
+        if not np.any(isValid):
+            return isValid
+
+        stats = StatTests.rangeStats(x, stats)
+        sample = stats.mean(r)
+        sample_against = stats.mean(against_other_r)
+        logger.debug(f'\t\t{sample} > {sample_against}?')
+        return isValid & (sample > sample_against)
 
 
     @printTestResults
     @staticmethod
-    def testLargestMagnitude(x: np.ndarray, r=[0, -1], override_max=None, th=None, header=""):
+    def testLargestMagnitude(x: np.ndarray, r=[0, -1], override_max=None, th=None, stats: RangeStats = None, header=""):
         """tests the input `x` signal whether a large impulse occured during the range `r`.
-        
+
         `th` will override the threshold of the impulse magnitude test, defaults to 3 * stddev
         """
-        window, isValid = StatTests.assertWindow(x, r)
-        if not isValid:
-            return False
-        
-        baseline = 3 * np.std(window) if th is None else th
-        impulse = np.max(window) if override_max is None else override_max
+        isValid = StatTests.assertWindow(x, r)
+        if not np.any(isValid):
+            return isValid
+
+        stats = StatTests.rangeStats(x, stats)
+        baseline = 3 * stats.std(r) if th is None else th
+        impulse = stats.max(r) if override_max is None else override_max
         logger.debug(f'\t\t{impulse} > {baseline}?')
-        if impulse > baseline:
-            return True
-        return False
+        return isValid & (impulse > baseline)
 
 
     @printTestResults
     @staticmethod
-    def testSmallestMagnitude(x: np.ndarray, r=[0, -1], th=None, header=""):
+    def testSmallestMagnitude(x: np.ndarray, r=[0, -1], th=None, stats: RangeStats = None, header=""):
         """tests the input `x` signal whether a small magnitude occured during the range `r`.
-        
+
         `th` will override the threshold of the impulse magnitude test, defaults to (1 / 3) * stddev
         """
-        window, isValid = StatTests.assertWindow(x, r)
-        if not isValid:
-            return False
-        
-        baseline = (1 / 3) * np.std(window) if th is None else th
-        smallest_mag = np.min(window)
+        isValid = StatTests.assertWindow(x, r)
+        if not np.any(isValid):
+            return isValid
+
+        stats = StatTests.rangeStats(x, stats)
+        baseline = (1 / 3) * stats.std(r) if th is None else th
+        smallest_mag = stats.min(r)
         logger.debug(f'\t\t{smallest_mag} < {baseline}?')
-        if smallest_mag < baseline:
-            return True
-        return False
+        return isValid & (smallest_mag < baseline)
 
 
     @printTestResults
     @staticmethod
-    def testTimingOfMagnitude(x: np.ndarray, r=[0, -1], th=None, header=""):
+    def testTimingOfMagnitude(x: np.ndarray, r=[0, -1], th=None, stats: RangeStats = None, header=""):
         """tests the input `x` signal whether a large impulse occured close to the start of the landing range.
-        
+
         `th` will override the threshold of the impulse magnitude test, defaults to 3 * stddev
         """
-        window, isValid = StatTests.assertWindow(x, r)
-        if not isValid:
-            return False
+        isValid = StatTests.assertWindow(x, r)
+        if not np.any(isValid):
+            return isValid
 
+        start, _ = StatTests.windowBounds(x, r)
         min_samples = 20 if th is None else th
-        impulse_idx = maxIndex(window) + 1
+        impulse_idx = StatTests.rangeStats(x, stats).argmax(r) - start + 1
         logger.debug(f'\t\t{impulse_idx} < {min_samples}?')
-        if impulse_idx < min_samples:
-            return True
-        return False
+        return isValid & (impulse_idx < min_samples)
 
 
     @printTestResults
     @staticmethod
-    def testRecentMax(x: np.ndarray, r=[0, -1], th=None, header=""):
+    def testRecentMax(x: np.ndarray, r=[0, -1], th=None, stats: RangeStats = None, header=""):
         """tests the input `x` signal whether a large impulse occured close to the start of the landing range.
-        
+
         `th` will override the threshold of the impulse magnitude test, defaults to 3 * stddev
         """
-        window, isValid = StatTests.assertWindow(x, r)
-        if not isValid:
-            return False
+        isValid = StatTests.assertWindow(x, r)
+        if not np.any(isValid):
+            return isValid
 
-        L = window.shape[0]
+        start, end = StatTests.windowBounds(x, r)
+        L = end - start
         min_samples = 20 if th is None else th
-        max_idx = maxIndex(window) + 1
+        max_idx = StatTests.rangeStats(x, stats).argmax(r) - start + 1
         logger.debug(f'\t\t{L} - {max_idx} < {min_samples}?')
-        if L - max_idx < min_samples:
-            return True
-        return False
+        return isValid & (L - max_idx < min_samples)
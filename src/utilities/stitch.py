@@ -1,6 +1,9 @@
-import numpy as np
 from domain.devices.track import Track
+from domain.devices.track_set import TrackSet
 
-def stitch(trackList: list[Track]):
-    return np.array([track.time for track in trackList]),\
-        np.array([track.alt for track in trackList])
\ No newline at end of file
+def stitch(trackList: list[Track] | TrackSet):
+    """Stitches the time & altitude vectors of consecutive tracks into single contiguous vectors,
+    without copying when the tracks are already a `TrackSet`.
+    """
+    tracks = trackList if isinstance(trackList, TrackSet) else TrackSet(trackList)
+    return tracks.time, tracks.alt
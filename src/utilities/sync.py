@@ -1,12 +1,13 @@
 import numpy as np
 from utilities.stitch import stitch
 from domain.devices.track import Track
+from domain.devices.track_set import TrackSet
 from domain.session_logger import SessionLogger as logger
 
 
 def identifyOffsets(
     tile_alt: np.ndarray, 
-    truth: list[Track],
+    truth: list[Track] | TrackSet,
     use_mae=True,
     time_step_s=0.1,
     max_time_search_s=30,
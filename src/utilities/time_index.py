@@ -0,0 +1,96 @@
+import numpy as np
+
+
+class TimeIndex:
+    """
+    Maps timestamps to sample indices of a monotonic, fixed rate time vector.
+
+    Inside every continuous segment (split at the `gap_idxs`) the index is computed with
+    arithmetic on the `fs` clock, then validated against the time vector. Guesses thrown off
+    by clock jitter or drift fall back to a `searchsorted`, so a lookup is never worse than O(log N).
+    """
+    def __init__(self, time: np.ndarray, fs=100, gap_idxs: np.ndarray = None) -> None:
+        self.time = time
+        self.fs = fs
+        gap_idxs = np.asarray(gap_idxs if gap_idxs is not None else [], dtype=np.int64)
+        self.seg_starts = np.concatenate([[0], np.sort(gap_idxs)]).astype(np.int64)
+        self.seg_ends = np.concatenate([self.seg_starts[1:], [time.shape[0]]]).astype(np.int64)
+
+
+    def index(self, t):
+        """Index of the first sample at or after the timestamp `t` (same as `searchsorted(side='left')`),
+        `t` can be a scalar or an array of timestamps.
+        """
+        t_arr = np.atleast_1d(np.asarray(t, dtype=float))
+        N = self.time.shape[0]
+
+        # arithmetic guess inside the segment holding t
+        seg = np.clip(np.searchsorted(self.time[self.seg_starts], t_arr, side='right') - 1, 0, None)
+        offset = np.ceil((t_arr - self.time[self.seg_starts[seg]]) * self.fs)
+        idxs = np.clip(self.seg_starts[seg] + np.nan_to_num(offset).astype(np.int64), self.seg_starts[seg], self.seg_ends[seg])
+
+        # validate time[idx - 1] < t <= time[idx], the rest falls back to a binary search
+        after_prev = (idxs == 0) | (self.time[np.clip(idxs - 1, 0, N - 1)] < t_arr)
+        at_or_before = (idxs == N) | (self.time[np.clip(idxs, 0, N - 1)] >= t_arr)
+        miss = ~(after_prev & at_or_before)
+        if np.any(miss):
+            idxs[miss] = np.searchsorted(self.time, t_arr[miss], side='left')
+
+        return int(idxs[0]) if np.ndim(t) == 0 else idxs
+
+
+    def slice(self, t0, t1) -> slice:
+        """Sample slice of every timestamp in `[t0, t1)`."""
+        i0, i1 = self.index([t0, t1])
+        return slice(int(i0), int(max(i0, i1)))
+
+
+    @property
+    def time(self) -> np.ndarray:
+        """Indexed time vector, in `s`. [Nx1]"""
+        return self.__time
+
+    @time.setter
+    def time(self, t):
+        self.__time = t
+
+
+    @property
+    def fs(self) -> float:
+        """Nominal sampling rate, in `Hz`."""
+        return self.__fs
+
+    @fs.setter
+    def fs(self, fs):
+        self.__fs = fs
+
+
+class SignalWindow:
+    """
+    Zero-copy window over the signals of `source`. Every per-sample array attribute (first
+    dimension `n`) is returned as a view sliced to the window, nested signal containers (ex:
+    `g_force`, `imu`) are wrapped as windows too, anything else is returned unchanged.
+    """
+    def __init__(self, source, s: slice, n: int) -> None:
+        self.__source = source
+        self.__slice = s
+        self.__n = n
+
+
+    def __getattr__(self, name):
+        value = getattr(self.__source, name)
+        if isinstance(value, np.ndarray):
+            return value[self.__slice] if value.ndim > 0 and value.shape[0] == self.__n else value
+        if hasattr(value, '__dict__') and not callable(value):
+            return SignalWindow(value, self.__slice, self.__n)
+        return value
+
+
+    def __len__(self) -> int:
+        return len(range(*self.__slice.indices(self.__n)))
+
+
+    @property
+    def slice(self) -> slice:
+        """Sample slice of the window inside the source signals."""
+        return self.__slice